@@ -19,11 +19,28 @@ import sys
 import json
 import time
 import shutil
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+# Faster JSON parsing when orjson is available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Streaming record counts when ijson is available
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Selenium imports
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -87,6 +104,12 @@ FILE_PATHS = {
     },
 }
 
+# Same paths pre-converted to str, for injection into phase modules
+FILE_PATHS_STR = {
+    phase_key: {key: str(path) for key, path in paths.items()}
+    for phase_key, paths in FILE_PATHS.items()
+}
+
 # ==========================================
 # URL CONFIGURATION
 # ==========================================
@@ -97,6 +120,10 @@ URLS = {
     "organizations": "https://www.ocip.express/BusinessAdmin/Index",
 }
 
+# chromedriver binary to use; None looks it up on PATH once per process.
+# If it cannot be found, Selenium Manager resolves it on each start instead.
+CHROMEDRIVER_PATH = None
+
 # ==========================================
 # PHASE METADATA
 # ==========================================
@@ -155,23 +182,59 @@ PHASE_INFO = {
 # ==========================================
 # DISPLAY UTILITIES
 # ==========================================
+# ANSI "erase display + cursor home"; avoids spawning cls/clear per redraw
+_CLEAR = "\x1b[2J\x1b[H"
+
+if os.name == 'nt':
+    os.system("")  # switches the Windows console into ANSI (VT) mode
+
+
+def _clear_code():
+    """Escape sequence to clear the screen, or '' when not on a terminal."""
+    return _CLEAR if sys.stdout.isatty() else ""
+
+
 def clear_screen():
     """Clear terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(_clear_code())
+
+
+def _flush(buf):
+    """Write buffered lines to stdout in a single call."""
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
+
+
+# Banner is assembled once at import; print_header only writes it
+_RULE = "=" * 70
+_BANNER = f"""
+{_RULE}
+  ██████╗  ██████╗██╗██████╗     ███████╗██╗  ██╗████████╗
+ ██╔═══██╗██╔════╝██║██╔══██╗    ██╔════╝╚██╗██╔╝╚══██╔══╝
+ ██║   ██║██║     ██║██████╔╝    █████╗   ╚███╔╝    ██║   
+ ██║   ██║██║     ██║██╔═══╝     ██╔══╝   ██╔██╗    ██║   
+ ╚██████╔╝╚██████╗██║██║         ███████╗██╔╝ ██╗   ██║   
+  ╚═════╝  ╚═════╝╚═╝╚═╝         ╚══════╝╚═╝  ╚═╝   ╚═╝   
+{_RULE}
+  OCIP Portal Data Extraction Pipeline - Main Controller
+{_RULE}
+"""
 
 
 def print_header():
     """Print application header."""
-    print("\n" + "=" * 70)
-    print("  ██████╗  ██████╗██╗██████╗     ███████╗██╗  ██╗████████╗")
-    print(" ██╔═══██╗██╔════╝██║██╔══██╗    ██╔════╝╚██╗██╔╝╚══██╔══╝")
-    print(" ██║   ██║██║     ██║██████╔╝    █████╗   ╚███╔╝    ██║   ")
-    print(" ██║   ██║██║     ██║██╔═══╝     ██╔══╝   ██╔██╗    ██║   ")
-    print(" ╚██████╔╝╚██████╗██║██║         ███████╗██╔╝ ██╗   ██║   ")
-    print("  ╚═════╝  ╚═════╝╚═╝╚═╝         ╚══════╝╚═╝  ╚═╝   ╚═╝   ")
-    print("=" * 70)
-    print("  OCIP Portal Data Extraction Pipeline - Main Controller")
-    print("=" * 70)
+    sys.stdout.write(_BANNER)
+
+
+def is_interactive():
+    """True when a human is at the terminal to answer prompts."""
+    return sys.stdin.isatty() and not os.environ.get("OCIP_NONINTERACTIVE")
+
+
+def _pause(message):
+    """Wait for ENTER, unless running headless."""
+    if is_interactive():
+        input(message)
 
 
 def print_divider(char="-", length=70):
@@ -190,22 +253,62 @@ def format_file_size(size_bytes):
     return f"{size_bytes:.1f} TB"
 
 
-def get_file_info(filepath):
+@lru_cache(maxsize=256)
+def _fmt_size(size_bytes):
+    """Memoised format_file_size for repeated dashboard redraws."""
+    return format_file_size(size_bytes)
+
+
+@lru_cache(maxsize=256)
+def _fmt_mtime(mtime_ns):
+    """Format an integer st_mtime_ns as a dashboard timestamp."""
+    return datetime.fromtimestamp(mtime_ns / 1e9).strftime("%Y-%m-%d %H:%M")
+
+
+def get_file_info(filepath, entry=None, stat_result=None):
     """Get file information if exists."""
-    path = Path(filepath)
-    if path.exists():
-        stat = path.stat()
-        size = format_file_size(stat.st_size)
-        modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-        return {"exists": True, "size": size, "modified": modified}
-    return {"exists": False, "size": "-", "modified": "-"}
+    try:
+        if stat_result is not None:
+            stat = stat_result
+        else:
+            stat = entry.stat() if entry is not None else Path(filepath).stat()
+    except OSError:
+        return {"exists": False, "size": "-", "modified": "-"}
+    size = _fmt_size(stat.st_size)
+    modified = _fmt_mtime(stat.st_mtime_ns)
+    return {"exists": True, "size": size, "modified": modified}
 
 
-def get_checkpoint_progress(checkpoint_path):
+def scan_directory(folder):
+    """List a folder once as a {name: DirEntry} dict."""
+    try:
+        with os.scandir(folder) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+
+@lru_cache(maxsize=64)
+def _load_cached(path_str, mtime_ns):
+    """Parse a JSON file once per (path, mtime) pair."""
+    if ORJSON_AVAILABLE:
+        with open(path_str, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path_str, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load_json(filepath, stat_result=None):
+    """Load JSON, re-parsing only when the file has changed on disk."""
+    if stat_result is None:
+        stat_result = os.stat(filepath)
+    return _load_cached(str(filepath), stat_result.st_mtime_ns)
+
+
+def get_checkpoint_progress(checkpoint_path, stat_result=None):
     """Read checkpoint and return progress info."""
     try:
-        with open(checkpoint_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(checkpoint_path, stat_result)
 
         # Extract common fields
         processed = data.get('experts_processed') or data.get('facilities_processed') or \
@@ -229,11 +332,30 @@ def get_checkpoint_progress(checkpoint_path):
         return None
 
 
-def count_json_records(filepath):
+@lru_cache(maxsize=64)
+def _stream_count(path_str, mtime_ns):
+    """Count top-level records without loading the whole file."""
+    with open(path_str, 'rb') as f:
+        head = f.read(64).lstrip()
+        f.seek(0)
+        if head.startswith(b'['):
+            prefix = 'item'
+        elif head.startswith(b'{'):
+            prefix = 'data.item'
+        else:
+            return 0
+        return sum(1 for _ in ijson.items(f, prefix))
+
+
+def count_json_records(filepath, stat_result=None):
     """Count records in a JSON file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if stat_result is None:
+            stat_result = os.stat(filepath)
+        if IJSON_AVAILABLE:
+            return _stream_count(str(filepath), stat_result.st_mtime_ns)
+
+        data = _load_json(filepath, stat_result)
         if isinstance(data, list):
             return len(data)
         elif isinstance(data, dict) and 'data' in data:
@@ -243,6 +365,45 @@ def count_json_records(filepath):
     return 0
 
 
+def _dir_summary(entries):
+    """Total size and file count of scan_directory() entries in one pass."""
+    total = 0
+    count = 0
+    for entry in entries.values():
+        if entry.is_file(follow_symlinks=False):
+            total += entry.stat(follow_symlinks=False).st_size
+            count += 1
+    return total, count
+
+
+def _stat_or_none(path):
+    """Return os.stat() for a path, or None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, TypeError):
+        return None
+
+
+@dataclass
+class PhaseFS:
+    """One-shot stat snapshot of a phase's output and checkpoint files."""
+    out_path: Path
+    ckpt_path: Path
+    out_stat: os.stat_result = None
+    ckpt_stat: os.stat_result = None
+
+    @classmethod
+    def snapshot(cls, paths):
+        out_path = paths.get("output_json")
+        ckpt_path = paths.get("checkpoint")
+        return cls(
+            out_path=out_path,
+            ckpt_path=ckpt_path,
+            out_stat=_stat_or_none(out_path),
+            ckpt_stat=_stat_or_none(ckpt_path),
+        )
+
+
 # ==========================================
 # STATUS DASHBOARD
 # ==========================================
@@ -250,13 +411,19 @@ def show_status_dashboard():
     """Display comprehensive status of all phases."""
     clear_screen()
     print_header()
-    print("\n  📊 EXTRACTION STATUS DASHBOARD")
-    print_divider("=")
 
-    print("\n  {:^8} │ {:^22} │ {:^10} │ {:^12} │ {:^15}".format(
+    # Build the whole screen, then write it once
+    buf = ["\n  📊 EXTRACTION STATUS DASHBOARD\n", "=" * 70 + "\n"]
+
+    buf.append("\n  {:^8} │ {:^22} │ {:^10} │ {:^12} │ {:^15}\n".format(
         "Phase", "Name", "Status", "Records", "Last Modified"
     ))
-    print("  " + "-" * 8 + "─┼─" + "-" * 22 + "─┼─" + "-" * 10 + "─┼─" + "-" * 12 + "─┼─" + "-" * 15)
+    buf.append("  " + "-" * 8 + "─┼─" + "-" * 22 + "─┼─" + "-" * 10 + "─┼─" + "-" * 12 + "─┼─" + "-" * 15 + "\n")
+
+    # List each folder once and answer every lookup from these dicts
+    output_entries = scan_directory(OUTPUT_DIR)
+    checkpoint_entries = scan_directory(CHECKPOINT_DIR)
+    logs_entries = scan_directory(LOGS_DIR)
 
     for phase_num, info in PHASE_INFO.items():
         phase_key = f"phase{phase_num}"
@@ -264,11 +431,16 @@ def show_status_dashboard():
 
         # Check output file
         output_path = paths.get("output_json")
-        file_info = get_file_info(output_path)
+        output_entry = output_entries.get(output_path.name)
+        if output_entry:
+            file_info = get_file_info(output_path, output_entry)
+        else:
+            file_info = {"exists": False, "size": "-", "modified": "-"}
 
         # Check checkpoint
         checkpoint_path = paths.get("checkpoint")
-        checkpoint_progress = get_checkpoint_progress(checkpoint_path) if Path(checkpoint_path).exists() else None
+        checkpoint_progress = get_checkpoint_progress(checkpoint_path) \
+            if checkpoint_path.name in checkpoint_entries else None
 
         # Determine status
         if file_info["exists"]:
@@ -284,7 +456,7 @@ def show_status_dashboard():
             status = "⬜ Pending"
             records = 0
 
-        print("  {:^8} │ {:<22} │ {:^10} │ {:>12} │ {:^15}".format(
+        buf.append("  {:^8} │ {:<22} │ {:^10} │ {:>12} │ {:^15}\n".format(
             f"[{phase_num}]",
             info["name"][:22],
             status,
@@ -292,28 +464,43 @@ def show_status_dashboard():
             file_info["modified"] if file_info["exists"] else "-"
         ))
 
-    print_divider("=")
+    buf.append("=" * 70 + "\n")
 
     # Show folder sizes
-    print("\n  📁 FOLDER SUMMARY")
-    print_divider()
-
-    output_size = sum(f.stat().st_size for f in OUTPUT_DIR.glob("*") if f.is_file())
-    checkpoint_size = sum(f.stat().st_size for f in CHECKPOINT_DIR.glob("*") if f.is_file())
-    logs_size = sum(f.stat().st_size for f in LOGS_DIR.glob("*") if f.is_file())
+    buf.append("\n  📁 FOLDER SUMMARY\n")
+    buf.append("-" * 70 + "\n")
 
-    print(f"  Output folder:     {format_file_size(output_size):>10}  ({len(list(OUTPUT_DIR.glob('*')))} files)")
-    print(
-        f"  Checkpoints folder:{format_file_size(checkpoint_size):>10}  ({len(list(CHECKPOINT_DIR.glob('*')))} files)")
-    print(f"  Logs folder:       {format_file_size(logs_size):>10}  ({len(list(LOGS_DIR.glob('*')))} files)")
+    folders = [
+        ("Output folder:     ", output_entries),
+        ("Checkpoints folder:", checkpoint_entries),
+        ("Logs folder:       ", logs_entries),
+    ]
+    for label, entries in folders:
+        folder_size, file_count = _dir_summary(entries)
+        buf.append(f"  {label}{format_file_size(folder_size):>10}  ({file_count} files)\n")
 
-    print()
-    input("  Press ENTER to return to main menu...")
+    buf.append("\n")
+    _flush(buf)
+    _pause("  Press ENTER to return to main menu...")
 
 
 # ==========================================
 # BROWSER SESSION MANAGEMENT
 # ==========================================
+@lru_cache(maxsize=1)
+def chromedriver_path():
+    """Resolve the chromedriver binary once so driver starts skip discovery."""
+    return CHROMEDRIVER_PATH or shutil.which("chromedriver")
+
+
+def new_chrome(options):
+    """Start Chrome, pinning the cached chromedriver path when known."""
+    path = chromedriver_path()
+    if path:
+        return webdriver.Chrome(service=Service(executable_path=path), options=options)
+    return webdriver.Chrome(options=options)
+
+
 class BrowserSession:
     """Manages a single browser session across multiple phases."""
 
@@ -322,6 +509,8 @@ class BrowserSession:
         self.wait = None
         self.is_logged_in = False
         self.current_page = None
+        self._last_probe = 0.0
+        self._last_alive = False
 
     def start(self):
         """Initialize the browser."""
@@ -337,11 +526,20 @@ class BrowserSession:
         options.add_experimental_option("useAutomationExtension", False)
         options.add_experimental_option("detach", True)
 
-        self.driver = webdriver.Chrome(options=options)
+        self.driver = new_chrome(options)
         self.driver.execute_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
-        self.wait = WebDriverWait(self.driver, 20)
+        self.wait = WebDriverWait(self.driver, 20, poll_frequency=0.1)
+        self._last_probe = 0.0
+
+        # Keep the HTTP cache warm across phases and enable CDP navigation
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+            self.driver.execute_cdp_cmd("Page.enable", {})
+        except Exception:
+            pass
 
         print("  ✅ Browser started successfully")
 
@@ -373,8 +571,20 @@ class BrowserSession:
             self.start()
 
         print(f"\n  🔗 Navigating to {page_name}...")
-        self.driver.get(url)
-        time.sleep(2)  # Allow page to load
+        try:
+            # Tag the current document so the readiness poll below cannot
+            # mistake the old page for the new one
+            self.driver.execute_script("window.__ocipLeaving = true;")
+            self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+        except Exception:
+            self.driver.get(url)
+        # Poll for readiness instead of sleeping a fixed interval
+        try:
+            self.wait.until(lambda d: d.execute_script(
+                "return !window.__ocipLeaving && document.readyState === 'complete';"))
+            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        except TimeoutException:
+            print(f"  ⚠️  {page_name} is still loading, continuing anyway")
         self.current_page = url
         print(f"  ✅ Arrived at {page_name}")
 
@@ -393,15 +603,20 @@ class BrowserSession:
             print("  ✅ Browser closed")
 
     def is_active(self):
-        """Check if browser session is active."""
+        """Check if browser session is active (probed at most once per second)."""
         if not self.driver:
             return False
+        now = time.monotonic()
+        if now - self._last_probe < 1.0:
+            return self._last_alive
         try:
             _ = self.driver.current_url
-            return True
+            self._last_alive = True
         except:
             self.driver = None
-            return False
+            self._last_alive = False
+        self._last_probe = now
+        return self._last_alive
 
 
 # Global browser session
@@ -411,6 +626,10 @@ browser = BrowserSession()
 # ==========================================
 # PHASE EXECUTION IMPORTS
 # ==========================================
+# Loaded phase modules: {phase_num: (source_mtime_ns, module)}
+_MODULE_CACHE = {}
+
+
 # Import phase modules dynamically to avoid circular imports
 def import_phase_module(phase_num):
     """Dynamically import a phase module."""
@@ -429,15 +648,23 @@ def import_phase_module(phase_num):
 
     # Check if module file exists
     module_path = BASE_DIR / f"{module_name}.py"
-    if not module_path.exists():
+    try:
+        mtime_ns = module_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Module file not found: {module_path}")
 
+    # Reuse the loaded module unless its source changed
+    cached = _MODULE_CACHE.get(phase_num)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
     # Import the module
     import importlib.util
     spec = importlib.util.spec_from_file_location(module_name, module_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
 
+    _MODULE_CACHE[phase_num] = (mtime_ns, module)
     return module
 
 
@@ -452,14 +679,10 @@ def check_phase_dependency(phase_num):
     if depends_on is None:
         return True, None
 
-    # Check if dependency output exists
+    # Check dependency output has records (a missing file counts as 0)
     dep_key = f"phase{depends_on}"
     dep_output = FILE_PATHS[dep_key]["output_json"]
 
-    if not Path(dep_output).exists():
-        return False, depends_on
-
-    # Check if it has records
     records = count_json_records(dep_output)
     if records == 0:
         return False, depends_on
@@ -484,13 +707,13 @@ def run_phase(phase_num, session=None):
     if not dep_ok:
         print(f"\n  ❌ ERROR: Phase {missing_phase} must be completed first!")
         print(f"     Run Phase {missing_phase} to generate required input data.")
-        input("\n  Press ENTER to return to menu...")
+        _pause("\n  Press ENTER to return to menu...")
         return False
 
     # Check for existing checkpoint
-    checkpoint_path = paths.get("checkpoint")
-    if Path(checkpoint_path).exists():
-        progress = get_checkpoint_progress(checkpoint_path)
+    fs = PhaseFS.snapshot(paths)
+    if fs.ckpt_stat:
+        progress = get_checkpoint_progress(fs.ckpt_path, fs.ckpt_stat)
         if progress:
             print(f"\n  ⚠️  Found existing checkpoint:")
             print(f"      Timestamp: {progress['timestamp']}")
@@ -545,12 +768,12 @@ def run_phase(phase_num, session=None):
         print_divider()
         print(f"\n  ✅ Phase {phase_num} completed successfully!")
 
-        # Show output summary
-        output_path = paths.get("output_json")
-        if Path(output_path).exists():
-            records = count_json_records(output_path)
-            file_info = get_file_info(output_path)
-            print(f"     Output: {output_path.name}")
+        # Show output summary (re-snapshot: the phase just wrote it)
+        fs = PhaseFS.snapshot(paths)
+        if fs.out_stat:
+            records = count_json_records(fs.out_path, fs.out_stat)
+            file_info = get_file_info(fs.out_path, stat_result=fs.out_stat)
+            print(f"     Output: {fs.out_path.name}")
             print(f"     Records: {records:,}")
             print(f"     Size: {file_info['size']}")
 
@@ -566,13 +789,17 @@ def run_phase(phase_num, session=None):
         traceback.print_exc()
         return False
     finally:
-        input("\n  Press ENTER to continue...")
+        _pause("\n  Press ENTER to continue...")
 
 
 def inject_paths_to_module(module, phase_num):
     """Inject file paths into a module."""
+    # Cached modules keep their injected paths between runs
+    if getattr(module, '_OCIP_INJECTED_PHASE', None) == phase_num:
+        return
+
     phase_key = f"phase{phase_num}"
-    paths = FILE_PATHS[phase_key]
+    paths = FILE_PATHS_STR[phase_key]
 
     # Common path attributes to set
     path_mappings = {
@@ -585,7 +812,9 @@ def inject_paths_to_module(module, phase_num):
 
     for attr, key in path_mappings.items():
         if key in paths and hasattr(module, attr):
-            setattr(module, attr, str(paths[key]))
+            setattr(module, attr, paths[key])
+
+    module._OCIP_INJECTED_PHASE = phase_num
 
 
 # ==========================================
@@ -676,7 +905,7 @@ def run_category_pipeline():
             break
 
     print(f"\n  📦 {category} Pipeline completed!")
-    input("  Press ENTER to continue...")
+    _pause("  Press ENTER to continue...")
 
 
 def run_full_pipeline():
@@ -713,7 +942,8 @@ def run_full_pipeline():
         else:
             failed.append(phase_num)
             print(f"\n  ⚠️  Phase {phase_num} failed. Continue with remaining? (y/n): ")
-            if input().strip().lower() != 'y':
+            # Headless runs keep going with the remaining phases
+            if is_interactive() and input().strip().lower() != 'y':
                 break
 
     # Summary
@@ -729,7 +959,7 @@ def run_full_pipeline():
     print(f"  Completed Phases: {completed}")
     print(f"  Failed Phases: {failed}")
 
-    input("\n  Press ENTER to continue...")
+    _pause("\n  Press ENTER to continue...")
 
 
 # ==========================================
@@ -742,11 +972,12 @@ def clean_checkpoints():
     print("\n  🧹 CLEAN CHECKPOINTS")
     print_divider("=")
 
-    checkpoint_files = list(CHECKPOINT_DIR.glob("*.json"))
+    # *.json* also catches the .jsonl row logs kept beside some checkpoints
+    checkpoint_files = list(CHECKPOINT_DIR.glob("*.json*"))
 
     if not checkpoint_files:
         print("\n  No checkpoint files found.")
-        input("  Press ENTER to continue...")
+        _pause("  Press ENTER to continue...")
         return
 
     print(f"\n  Found {len(checkpoint_files)} checkpoint file(s):")
@@ -766,7 +997,7 @@ def clean_checkpoints():
     else:
         print("\n  ❌ Operation cancelled.")
 
-    input("  Press ENTER to continue...")
+    _pause("  Press ENTER to continue...")
 
 
 def clean_all_data():
@@ -794,7 +1025,7 @@ def clean_all_data():
     else:
         print("\n  ❌ Operation cancelled.")
 
-    input("  Press ENTER to continue...")
+    _pause("  Press ENTER to continue...")
 
 
 def show_help():
@@ -842,46 +1073,48 @@ def show_help():
   • Don't interact with the browser while running
     """
     print(help_text)
-    input("  Press ENTER to return to menu...")
+    _pause("  Press ENTER to return to menu...")
 
 
 # ==========================================
 # MAIN MENU
 # ==========================================
-def main_menu():
-    """Display and handle main menu."""
-    while True:
-        clear_screen()
-        print_header()
+# Static part of the main menu, drawn below the status line
+_MAIN_MENU = f"""{_RULE}
 
-        # Quick status line
-        browser_status = "🟢 Active" if browser.is_active() else "⚪ Inactive"
-        login_status = "🔓 Logged In" if browser.is_logged_in else "🔒 Not Logged In"
+  📋 MAIN MENU
+{"-" * 70}
 
-        print(f"\n  Browser: {browser_status}  |  {login_status}")
-        print_divider("=")
+  EXECUTION:
+    [1] Run Single Phase
+    [2] Run Category Pipeline (Experts/Facilities/Organizations)
+    [3] Run Full Pipeline (All 6 Phases)
 
-        print("\n  📋 MAIN MENU")
-        print_divider()
+  STATUS:
+    [4] View Status Dashboard
+    [5] Browser Session Management
 
-        print("\n  EXECUTION:")
-        print("    [1] Run Single Phase")
-        print("    [2] Run Category Pipeline (Experts/Facilities/Organizations)")
-        print("    [3] Run Full Pipeline (All 6 Phases)")
+  MAINTENANCE:
+    [6] Clean Checkpoints
+    [7] Clean All Data
 
-        print("\n  STATUS:")
-        print("    [4] View Status Dashboard")
-        print("    [5] Browser Session Management")
+  OTHER:
+    [8] Help & Documentation
+    [0] Exit
+{"-" * 70}
+"""
 
-        print("\n  MAINTENANCE:")
-        print("    [6] Clean Checkpoints")
-        print("    [7] Clean All Data")
 
-        print("\n  OTHER:")
-        print("    [8] Help & Documentation")
-        print("    [0] Exit")
+def main_menu():
+    """Display and handle main menu."""
+    while True:
+        # Quick status line
+        browser_status = "🟢 Active" if browser.is_active() else "⚪ Inactive"
+        login_status = "🔓 Logged In" if browser.is_logged_in else "🔒 Not Logged In"
 
-        print_divider()
+        # Whole screen in one write
+        _flush((_clear_code(), _BANNER,
+                f"\n  Browser: {browser_status}  |  {login_status}\n", _MAIN_MENU))
         choice = input("  Enter choice: ").strip()
 
         if choice == '1':
@@ -938,28 +1171,28 @@ def browser_management_menu():
 
     if choice == '1':
         browser.start()
-        input("  Press ENTER to continue...")
+        _pause("  Press ENTER to continue...")
     elif choice == '2':
         browser.login(force=True)
-        input("  Press ENTER to continue...")
+        _pause("  Press ENTER to continue...")
     elif choice == '3':
         if not browser.is_logged_in:
             browser.login()
         browser.navigate_to(URLS["experts"], "Experts Page")
-        input("  Press ENTER to continue...")
+        _pause("  Press ENTER to continue...")
     elif choice == '4':
         if not browser.is_logged_in:
             browser.login()
         browser.navigate_to(URLS["facilities"], "Facilities Page")
-        input("  Press ENTER to continue...")
+        _pause("  Press ENTER to continue...")
     elif choice == '5':
         if not browser.is_logged_in:
             browser.login()
         browser.navigate_to(URLS["organizations"], "Organizations Page")
-        input("  Press ENTER to continue...")
+        _pause("  Press ENTER to continue...")
     elif choice == '6':
         browser.close()
-        input("  Press ENTER to continue...")
+        _pause("  Press ENTER to continue...")
 
 
 def exit_program():
@@ -992,7 +1225,7 @@ def main():
         print(f"\n  ❌ Unexpected error: {e}")
         import traceback
         traceback.print_exc()
-        input("\n  Press ENTER to exit...")
+        _pause("\n  Press ENTER to exit...")
 
 
 if __name__ == "__main__":
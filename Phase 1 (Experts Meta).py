@@ -8,11 +8,17 @@ Author: AI Assistant
 Version: 2.1 (with pagination reset fix)
 """
 
+import os
+import shutil
 import time
 import json
 import re
+import multiprocessing
+from functools import lru_cache
+from multiprocessing import util as mp_util
 import pandas as pd
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -24,6 +30,20 @@ from selenium.common.exceptions import (
 )
 from datetime import datetime
 
+# Optional: stream the Excel file row by row instead of building it in memory
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Optional: Arrow-backed string columns and a Parquet copy of the results
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # ==========================================
 # CONFIGURATION
 # ==========================================
@@ -33,17 +53,37 @@ OUTPUT_EXCEL = "experts_master_list.xlsx"
 CHECKPOINT_FILE = "checkpoint_progress.json"
 
 # Timing Configuration (adjust if site is slow)
-PAGE_LOAD_WAIT = 2.0  # Wait after selecting institution
-PAGINATION_WAIT = 1.5  # Wait after clicking next page
-DROPDOWN_CLOSE_WAIT = 0.5  # Wait after closing dropdown
-LOADING_MASK_TIMEOUT = 10  # Max wait for loading spinner
+PAGE_LOAD_WAIT = 2.0  # Max wait for an empty grid to refresh (nothing to compare against)
+LOADING_MASK_TIMEOUT = 10  # Max wait for loading spinner / grid refresh
+
+# Rows per grid page requested through the Kendo API. Institutions with more
+# experts than this fall back to clicking through the pager.
+GRID_PAGE_SIZE = 1000
+
+# Expert rows are appended to a JSONL file next to CHECKPOINT_FILE; fsync it
+# every N institutions (it is flushed after each one regardless)
+CHECKPOINT_SYNC_EVERY = 10
+
+# Parallel scraping: each worker process runs its own Chrome, logged in with
+# the cookies of the manual login. Set to 1 to scrape sequentially.
+WORKER_COUNT = 4
+
+# Worker browsers run headless (the login browser always stays visible)
+HEADLESS = True
+
+# chromedriver binary; None looks it up on PATH once (else Selenium Manager)
+CHROMEDRIVER_PATH = None
+
+# Web fonts have no Chrome content setting, so they are blocked by URL
+BLOCKED_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
 
 
 # ==========================================
 # DRIVER SETUP
 # ==========================================
-def get_driver():
-    """Initialize Chrome WebDriver with optimal settings."""
+@lru_cache(maxsize=None)
+def chrome_options(headless=False):
+    """Build the Chrome option bundle once per mode; every driver reuses it."""
     options = webdriver.ChromeOptions()
     options.add_argument("--start-maximized")
     options.add_argument("--disable-blink-features=AutomationControlled")
@@ -51,25 +91,60 @@ def get_driver():
     options.add_experimental_option("useAutomationExtension", False)
     options.add_experimental_option("detach", True)  # Keep browser open after script ends
 
-    driver = webdriver.Chrome(options=options)
+    # Skip images (web fonts are blocked in get_driver) - the scraper only
+    # reads text and hrefs. Stylesheets stay on: Kendo's dropdowns rely on
+    # them for visibility.
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+    })
+    options.add_argument("--blink-settings=imagesEnabled=false")
+
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+
+    return options
+
+
+@lru_cache(maxsize=1)
+def chromedriver_path():
+    """Resolve the chromedriver binary once so driver starts skip discovery."""
+    return CHROMEDRIVER_PATH or shutil.which("chromedriver")
+
+
+def get_driver(headless=False):
+    """Initialize Chrome WebDriver with optimal settings."""
+    path = chromedriver_path()
+    if path:
+        driver = webdriver.Chrome(service=Service(executable_path=path), options=chrome_options(headless))
+    else:
+        driver = webdriver.Chrome(options=chrome_options(headless))
 
     # Make selenium less detectable
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    block_resources(driver)
 
     return driver
 
 
+def block_resources(driver):
+    """Stop the browser requesting BLOCKED_URL_PATTERNS (via DevTools)."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"      [Warning] Could not block page resources: {e}")
+
+
 # ==========================================
 # UTILITY FUNCTIONS
 # ==========================================
 def wait_for_loading_complete(driver, timeout=LOADING_MASK_TIMEOUT):
     """Wait for any loading masks/spinners to disappear."""
     try:
-        # First, give the mask a moment to appear
-        time.sleep(0.3)
-
-        # Wait for loading mask to disappear
-        WebDriverWait(driver, timeout).until(
+        # Succeeds immediately if no mask is showing
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
             EC.invisibility_of_element_located((By.CSS_SELECTOR, ".k-loading-mask"))
         )
     except TimeoutException:
@@ -78,40 +153,120 @@ def wait_for_loading_complete(driver, timeout=LOADING_MASK_TIMEOUT):
         pass  # No loading mask appeared
 
 
-def parse_pagination_info(driver):
+# "1 - 100 of 163 items"
+_PAGER_RE = re.compile(r'(\d+)\s*-\s*(\d+)\s+of\s+(\d+)\s+items?')
+
+PAGER_INFO_JS = "var el = document.querySelector('span.k-pager-info.k-label'); return el ? el.innerText : null;"
+
+
+def parse_pager_text(info_text):
     """
     Parse the pagination info text to get current range and total count.
     Returns: (current_start, current_end, total_count) or (0, 0, 0) if not found
 
     Example: "1 - 100 of 163 items" -> (1, 100, 163)
     """
-    try:
-        pager_info = driver.find_element(By.CSS_SELECTOR, "span.k-pager-info.k-label")
-        info_text = pager_info.text.strip()
+    if info_text is None:
+        print("      [Warning] Pagination info element not found")
+        return (0, 0, 0)
 
-        # Parse "1 - 100 of 163 items" format
-        match = re.match(r'(\d+)\s*-\s*(\d+)\s+of\s+(\d+)\s+items?', info_text)
+    info_text = info_text.strip()
+    match = _PAGER_RE.match(info_text)
 
-        if match:
-            start = int(match.group(1))
-            end = int(match.group(2))
-            total = int(match.group(3))
-            return (start, end, total)
-        else:
-            # Try alternate format "No items to display"
-            if "no items" in info_text.lower() or "0 items" in info_text.lower():
-                return (0, 0, 0)
-            print(f"      [Warning] Could not parse pagination: '{info_text}'")
-            return (0, 0, 0)
+    if match:
+        return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
 
-    except NoSuchElementException:
-        print("      [Warning] Pagination info element not found")
+    # Try alternate format "No items to display"
+    lowered = info_text.lower()
+    if "no items" in lowered or "0 items" in lowered:
         return (0, 0, 0)
+    print(f"      [Warning] Could not parse pagination: '{info_text}'")
+    return (0, 0, 0)
+
+
+def parse_pagination_info(driver):
+    """Read the grid's pager text in one script call and parse it."""
+    try:
+        return parse_pager_text(driver.execute_script(PAGER_INFO_JS))
     except Exception as e:
         print(f"      [Warning] Pagination parse error: {e}")
         return (0, 0, 0)
 
 
+def grid_snapshot(driver):
+    """
+    Capture the grid state before an action that reloads it.
+    Returns: (first_row_element_or_None, pager_info_text)
+    """
+    rows = driver.find_elements(By.CSS_SELECTOR, "tr.k-master-row")
+    try:
+        info_text = driver.find_element(By.CSS_SELECTOR, "span.k-pager-info.k-label").text
+    except NoSuchElementException:
+        info_text = ""
+    return (rows[0] if rows else None, info_text)
+
+
+def wait_for_grid_update(driver, snapshot):
+    """
+    Wait until the grid has re-rendered since `snapshot` was taken.
+    Kendo rebuilds the table body on every reload, so the old first row going
+    stale (or the pager text changing) means the new data is in place.
+    """
+    old_row, old_info = snapshot
+
+    def updated(d):
+        if old_row is not None:
+            try:
+                old_row.is_enabled()
+            except StaleElementReferenceException:
+                return True
+        else:
+            if d.find_elements(By.CSS_SELECTOR, "tr.k-master-row"):
+                return True
+        try:
+            return d.find_element(By.CSS_SELECTOR, "span.k-pager-info.k-label").text != old_info
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+
+    # An empty grid that stays empty never changes, so don't wait long for it
+    timeout = LOADING_MASK_TIMEOUT if old_row is not None else PAGE_LOAD_WAIT
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(updated)
+    except TimeoutException:
+        if old_row is not None:
+            print("      [Warning] Grid refresh timeout - proceeding anyway")
+    wait_for_loading_complete(driver)
+
+
+# Sets the Kendo grid's page size; returns "set", "kept" or null (no grid API)
+SET_PAGE_SIZE_JS = """
+var el = document.querySelector('.k-grid');
+var grid = (el && window.jQuery) ? window.jQuery(el).data('kendoGrid') : null;
+if (!grid) { return null; }
+var ds = grid.dataSource;
+if (ds.pageSize() >= arguments[0] && ds.page() === 1) { return 'kept'; }
+ds.pageSize(arguments[0]);  // also resets to page 1 and reloads
+return 'set';
+"""
+
+
+def expand_page_size(driver, page_size=GRID_PAGE_SIZE):
+    """
+    Ask the grid for `page_size` rows per page so most institutions fit on one page.
+    Returns True if the grid is now using the larger page size.
+    """
+    try:
+        snapshot = grid_snapshot(driver)
+        result = driver.execute_script(SET_PAGE_SIZE_JS, page_size)
+    except Exception as e:
+        print(f"      [Warning] Could not set grid page size: {e}")
+        return False
+
+    if result == "set":
+        wait_for_grid_update(driver, snapshot)
+    return result is not None
+
+
 def has_next_page(driver):
     """Check if there's a next page available."""
     try:
@@ -137,7 +292,7 @@ def click_next_page(driver, wait):
 
         # Scroll into view and click
         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_btn)
-        time.sleep(0.2)
+        snapshot = grid_snapshot(driver)
 
         # Try regular click first, fallback to JS click
         try:
@@ -146,8 +301,7 @@ def click_next_page(driver, wait):
             driver.execute_script("arguments[0].click();", next_btn)
 
         # Wait for new data to load
-        wait_for_loading_complete(driver)
-        time.sleep(PAGINATION_WAIT)
+        wait_for_grid_update(driver, snapshot)
 
         return True
 
@@ -181,7 +335,7 @@ def reset_to_first_page(driver, wait):
 
         # Scroll into view and click
         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", first_page_btn)
-        time.sleep(0.2)
+        snapshot = grid_snapshot(driver)
 
         # Try regular click first, fallback to JS click
         try:
@@ -190,8 +344,7 @@ def reset_to_first_page(driver, wait):
             driver.execute_script("arguments[0].click();", first_page_btn)
 
         # Wait for new data to load
-        wait_for_loading_complete(driver)
-        time.sleep(PAGINATION_WAIT)
+        wait_for_grid_update(driver, snapshot)
 
         print("         → Reset to page 1")
         return True
@@ -204,14 +357,51 @@ def reset_to_first_page(driver, wait):
         return False
 
 
-def save_checkpoint(data, current_index, institution_names):
-    """Save progress checkpoint in case of crash."""
+def checkpoint_data_file():
+    """Path of the append-only expert log that goes with CHECKPOINT_FILE."""
+    return os.path.splitext(CHECKPOINT_FILE)[0] + ".jsonl"
+
+
+def open_checkpoint_log(resume_bytes=None):
+    """
+    Open the expert log for appending.
+    When resuming, anything written after the last saved checkpoint is cut off.
+    """
+    if resume_bytes is None:
+        # Fresh start: the old index would not describe the new log
+        try:
+            os.remove(CHECKPOINT_FILE)
+        except FileNotFoundError:
+            pass
+        return open(checkpoint_data_file(), 'wb')
+    log = open(checkpoint_data_file(), 'r+b')
+    log.truncate(resume_bytes)
+    log.seek(0, os.SEEK_END)
+    return log
+
+
+def append_checkpoint(log, experts):
+    """Append one JSON line per expert to the log."""
+    log.write(b"".join(
+        json.dumps(e, ensure_ascii=False).encode('utf-8') + b"\n" for e in experts
+    ))
+
+
+def save_checkpoint(log, experts_collected, current_index, institution_names):
+    """
+    Save progress checkpoint in case of crash.
+    Only the small index file is rewritten; expert rows live in the log.
+    """
+    log.flush()
+    if current_index % CHECKPOINT_SYNC_EVERY == 0:
+        os.fsync(log.fileno())
+
     checkpoint = {
         "timestamp": datetime.now().isoformat(),
         "current_index": current_index,
         "total_institutions": len(institution_names),
-        "experts_collected": len(data),
-        "data": data
+        "experts_collected": experts_collected,
+        "data_bytes": log.tell()
     }
     with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
         json.dump(checkpoint, f, indent=2)
@@ -221,16 +411,38 @@ def load_checkpoint():
     """Load previous checkpoint if exists."""
     try:
         with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            checkpoint = json.load(f)
     except FileNotFoundError:
         return None
     except json.JSONDecodeError:
         return None
 
+    # Older checkpoints carry the rows inline
+    if "data" in checkpoint:
+        return checkpoint
+
+    try:
+        with open(checkpoint_data_file(), 'rb') as f:
+            raw = f.read(checkpoint["data_bytes"])
+    except (FileNotFoundError, KeyError):
+        return None
+    if len(raw) < checkpoint["data_bytes"]:
+        return None
+
+    checkpoint["data"] = [json.loads(line) for line in raw.splitlines() if line]
+    return checkpoint
+
 
 # ==========================================
 # MODULE 1: Get Institution Names
 # ==========================================
+INSTITUTION_NAMES_JS = """
+return Array.from(document.querySelectorAll('#HeiId_listbox li'))
+    .map(function (li) { return li.innerText.trim(); })
+    .filter(function (text) { return text && text.indexOf('Select HEI') === -1; });
+"""
+
+
 def get_institution_names(driver, wait):
     """
     Extract all institution names from the dropdown.
@@ -247,25 +459,18 @@ def get_institution_names(driver, wait):
         ))
         dropdown_trigger.click()
 
-        # Wait for listbox to appear
+        # Wait for listbox to appear and populate
         listbox = wait.until(EC.visibility_of_element_located((By.ID, "HeiId_listbox")))
-        time.sleep(0.5)  # Allow list to fully populate
+        wait.until(lambda d: listbox.find_elements(By.TAG_NAME, "li"))
 
-        # Get all list items
-        options = listbox.find_elements(By.TAG_NAME, "li")
-
-        names = []
-        for opt in options:
-            text = opt.text.strip()
-            # Filter out placeholder text
-            if text and "Select HEI" not in text and text != "":
-                names.append(text)
+        # Read every option in one script call, skipping the placeholder
+        names = driver.execute_script(INSTITUTION_NAMES_JS)
 
         print(f"✓ Found {len(names)} institutions to process")
 
         # Close dropdown
         driver.find_element(By.TAG_NAME, "body").click()
-        time.sleep(DROPDOWN_CLOSE_WAIT)
+        wait.until(EC.invisibility_of_element_located((By.ID, "HeiId_listbox")))
 
         return names
 
@@ -280,6 +485,29 @@ def get_institution_names(driver, wait):
 # ==========================================
 # MODULE 2: Select Institution
 # ==========================================
+# Finds the option matching arguments[0] (same loose 'in' comparison both
+# ways) and clicks it, all in one round-trip. Returns true if clicked.
+SELECT_OPTION_JS = """
+var target = arguments[0];
+var items = document.querySelectorAll('#HeiId_listbox li');
+for (var i = 0; i < items.length; i++) {
+    var text = items[i].innerText.trim();
+    if (text && (text.indexOf(target) !== -1 || target.indexOf(text) !== -1)) {
+        items[i].click();
+        return true;
+    }
+}
+return false;
+"""
+
+# The dropdown's filter box, if it is filterable (lives in the listbox popup)
+FILTER_INPUT_JS = """
+var listbox = document.getElementById('HeiId_listbox');
+var popup = listbox && listbox.closest('.k-popup, .k-list-container, .k-animation-container');
+return popup ? popup.querySelector('.k-list-filter input, input.k-textbox, input.k-input-inner') : null;
+"""
+
+
 def select_institution(driver, wait, target_name):
     """
     Select an institution from the dropdown using robust matching.
@@ -294,30 +522,33 @@ def select_institution(driver, wait, target_name):
 
         # 2. Wait for listbox
         listbox = wait.until(EC.visibility_of_element_located((By.ID, "HeiId_listbox")))
-        time.sleep(0.3)
-
-        # 3. Find matching option using Python loop (handles hidden chars)
-        all_options = listbox.find_elements(By.TAG_NAME, "li")
 
-        target_element = None
-        for opt in all_options:
-            opt_text = opt.text.strip()
-            # Use 'in' comparison to handle minor text differences
-            if target_name in opt_text or opt_text in target_name:
-                target_element = opt
-                break
-
-        if not target_element:
+        wait.until(lambda d: listbox.find_elements(By.TAG_NAME, "li"))
+
+        # 3. Match and click the option in-browser (JS click is more reliable)
+        snapshot = grid_snapshot(driver)
+        clicked = driver.execute_script(SELECT_OPTION_JS, target_name)
+
+        # 4. Not rendered (e.g. virtualized list): narrow it via the filter box
+        if not clicked:
+            filter_input = driver.execute_script(FILTER_INPUT_JS)
+            if filter_input is not None:
+                filter_input.clear()
+                filter_input.send_keys(target_name)
+                try:
+                    clicked = WebDriverWait(driver, LOADING_MASK_TIMEOUT, poll_frequency=0.1).until(
+                        lambda d: d.execute_script(SELECT_OPTION_JS, target_name)
+                    )
+                except TimeoutException:
+                    clicked = False
+
+        if not clicked:
             print(f"      ✗ Could not find '{target_name}' in dropdown")
             driver.find_element(By.TAG_NAME, "body").click()
             return False
 
-        # 4. Click using JavaScript (more reliable)
-        driver.execute_script("arguments[0].click();", target_element)
-
         # 5. Wait for table to load
-        wait_for_loading_complete(driver)
-        time.sleep(PAGE_LOAD_WAIT)
+        wait_for_grid_update(driver, snapshot)
 
         return True
 
@@ -340,78 +571,71 @@ def select_institution(driver, wait, target_name):
 # ==========================================
 # MODULE 3: Scrape Single Page of Table
 # ==========================================
+# Runs inside the browser and returns every row plus the pager text in one
+# WebDriver round-trip.
+# Cell indices match the grid HTML: 1=ID, 4=Facility, 6=Type, 7=Position, 8=Name
+SCRAPE_ROWS_JS = """
+var pager = document.querySelector('span.k-pager-info.k-label');
+var rows = Array.from(document.querySelectorAll('tr.k-master-row')).map(function (row) {
+    var cells = row.querySelectorAll('td');
+    if (cells.length < 9) { return null; }
+    var text = function (i) { return cells[i] ? cells[i].innerText.trim() : ''; };
+    var manage = row.querySelector("a[title='View Full Details']");
+    var profile = row.querySelector("a[title='View Profile']");
+    return {
+        expert_type: text(6),
+        position: text(7),
+        name: text(8),
+        expert_id: text(1),
+        facility: text(4),
+        manage_url: manage ? manage.href : 'Not Found',
+        profile_url: profile ? profile.href : 'Not Found'
+    };
+});
+return {rows: rows, pager: pager ? pager.innerText : null};
+"""
+
+
 def scrape_current_page(driver, institution_name):
     """
     Scrape all expert rows from the currently displayed table page.
-    Returns a list of expert dictionaries.
+    Returns (list of expert dictionaries, pagination info tuple).
     """
     try:
-        rows = driver.find_elements(By.CSS_SELECTOR, "tr.k-master-row")
-    except:
-        return []
+        result = driver.execute_script(SCRAPE_ROWS_JS)
+    except Exception as e:
+        print(f"      [Warning] Row extraction failed: {e}")
+        return [], parse_pagination_info(driver)
+
+    rows = result["rows"]
+    pagination = parse_pager_text(result["pager"])
 
     if not rows:
-        return []
+        return [], pagination
 
     page_data = []
+    scraped_at = datetime.now().isoformat()
 
     for row in rows:
-        try:
-            cells = row.find_elements(By.TAG_NAME, "td")
-
-            if len(cells) < 9:
-                continue
-
-            # Extract visible data from correct cell indices
-            # Based on HTML: cells[6]=Type, cells[7]=Position, cells[8]=Name
-            expert_type = cells[6].text.strip()
-            position = cells[7].text.strip()
-            name = cells[8].text.strip()
-
-            # Extract hidden cell data (for additional context)
-            try:
-                expert_id = cells[1].text.strip() if len(cells) > 1 else ""
-                facility_name = cells[4].text.strip() if len(cells) > 4 else ""
-            except:
-                expert_id = ""
-                facility_name = ""
+        if not row:
+            continue
 
-            # Extract the "Manage" link URL
-            manage_url = ""
-            profile_url = ""
-            try:
-                manage_link = row.find_element(By.CSS_SELECTOR, "a[title='View Full Details']")
-                manage_url = manage_link.get_attribute("href")
-            except NoSuchElementException:
-                manage_url = "Not Found"
+        # Build expert record
+        expert_record = {
+            "Institution": institution_name,
+            "Name": row["name"],
+            "Expert_Type": row["expert_type"],
+            "Position": row["position"],
+            "Facility": row["facility"],
+            "Expert_ID": row["expert_id"],
+            "Manage_URL": row["manage_url"],
+            "Profile_URL": row["profile_url"],
+            "Scraped_At": scraped_at
+        }
 
-            try:
-                profile_link = row.find_element(By.CSS_SELECTOR, "a[title='View Profile']")
-                profile_url = profile_link.get_attribute("href")
-            except NoSuchElementException:
-                profile_url = "Not Found"
-
-            # Build expert record
-            expert_record = {
-                "Institution": institution_name,
-                "Name": name,
-                "Expert_Type": expert_type,
-                "Position": position,
-                "Facility": facility_name,
-                "Expert_ID": expert_id,
-                "Manage_URL": manage_url,
-                "Profile_URL": profile_url,
-                "Scraped_At": datetime.now().isoformat()
-            }
-
-            page_data.append(expert_record)
-
-        except StaleElementReferenceException:
-            continue
-        except Exception as e:
-            continue
+        page_data.append(expert_record)
 
-    return page_data
+    return page_data, pagination
 
 
 # ==========================================
@@ -426,6 +650,10 @@ def scrape_all_pages_for_institution(driver, wait, institution_name):
     all_experts = []
     current_page = 1
 
+    # Pull (nearly) everything onto one page; the pager loop below only runs
+    # for very large institutions or if the grid API is unavailable
+    expand_page_size(driver)
+
     # Get initial pagination info
     start, end, total = parse_pagination_info(driver)
 
@@ -433,19 +661,19 @@ def scrape_all_pages_for_institution(driver, wait, institution_name):
         print(f"      → No experts found")
         return []
 
-    total_pages = (total + 99) // 100  # Calculate expected pages (ceiling division)
+    per_page = max(end - start + 1, 1)
+    total_pages = (total + per_page - 1) // per_page  # Calculate expected pages (ceiling division)
     print(f"      → Found {total} experts across ~{total_pages} page(s)")
 
     while True:
-        # Scrape current page
-        page_experts = scrape_current_page(driver, institution_name)
+        # Scrape current page (pager info comes back in the same call)
+        page_experts, (start, end, total) = scrape_current_page(driver, institution_name)
         experts_on_page = len(page_experts)
         all_experts.extend(page_experts)
 
         print(f"         Page {current_page}: Scraped {experts_on_page} experts (Total so far: {len(all_experts)})")
 
         # Check if more pages exist
-        start, end, total = parse_pagination_info(driver)
 
         if end >= total:
             # We've reached the last page
@@ -475,6 +703,115 @@ def scrape_all_pages_for_institution(driver, wait, institution_name):
     return all_experts
 
 
+def scrape_institution(driver, wait, uni_name):
+    """
+    Select one institution and scrape all of its pages.
+    Returns the list of experts, or None if selection failed.
+    """
+    if not select_institution(driver, wait, uni_name):
+        return None
+    return scrape_all_pages_for_institution(driver, wait, uni_name)
+
+
+def _scrape_sequential(driver, wait, names, start_index, total):
+    """Yield (name, experts) for each institution using a single browser."""
+    for i, uni_name in enumerate(names, start=start_index):
+        print(f"\n[{i + 1}/{total}] {uni_name}")
+        yield uni_name, scrape_institution(driver, wait, uni_name)
+
+
+def write_excel_streaming(records, path):
+    """
+    Write records to .xlsx with xlsxwriter's constant_memory mode.
+    Rows are written in order and flushed as they go, so memory stays flat.
+    (pandas writes column by column, which constant_memory cannot handle.)
+    URLs are stored as plain text, not hyperlinks (a sheet holds at most
+    65,530 hyperlinks; xlsxwriter drops the cells past that).
+    """
+    columns = list(dict.fromkeys(key for rec in records for key in rec))
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+    try:
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, columns)
+        for row, rec in enumerate(records, start=1):
+            sheet.write_row(row, 0, [rec.get(col, "") for col in columns])
+    finally:
+        workbook.close()
+
+
+# ==========================================
+# MODULE 5: Worker Pool
+# ==========================================
+_worker_driver = None
+_worker_wait = None
+_worker_error = None  # why this worker's browser failed to start, if it did
+
+
+def _init_worker(cookies, experts_url):
+    """Start this worker's browser and log it in with the shared cookies."""
+    global _worker_driver, _worker_wait, _worker_error
+    # An initializer that raises makes the pool respawn the worker forever
+    # (and imap never returns), so a failed start is recorded instead
+    try:
+        _worker_driver = get_driver(headless=HEADLESS)
+        _worker_wait = WebDriverWait(_worker_driver, 20, poll_frequency=0.1)
+
+        # Cookies can only be set for the domain currently loaded
+        _worker_driver.get(LOGIN_URL)
+        for cookie in cookies:
+            cookie.pop("sameSite", None)
+            try:
+                _worker_driver.add_cookie(cookie)
+            except Exception:
+                pass
+        _worker_driver.get(experts_url)
+        wait_for_loading_complete(_worker_driver)
+    except Exception as e:
+        _worker_error = f"{type(e).__name__}: {e}"
+        if _worker_driver is not None:
+            try:
+                _worker_driver.quit()
+            except Exception:
+                pass
+            _worker_driver = None
+        return
+
+    # Quit the browser when the pool shuts this worker down
+    mp_util.Finalize(None, _worker_driver.quit, exitpriority=10)
+
+
+def _scrape_in_worker(uni_name):
+    """
+    Pool task: scrape one institution on this worker's browser.
+    Returns (name, experts, error); error is set (and experts None) if the
+    worker's browser failed to start.
+    """
+    if _worker_error is not None:
+        return uni_name, None, _worker_error
+    try:
+        return uni_name, scrape_institution(_worker_driver, _worker_wait, uni_name), None
+    except Exception as e:
+        print(f"      ✗ Worker error on '{uni_name}': {e}")
+        return uni_name, None, None
+
+
+def _scrape_pooled(pool, driver, wait, names):
+    """
+    Yield (name, experts) for each institution from the pool, in order.
+    Institutions given to a worker whose browser failed to start are
+    scraped in the main browser instead.
+    """
+    warned = False
+    for uni_name, experts, error in pool.imap(_scrape_in_worker, names):
+        if error is not None:
+            if not warned:
+                print(f"      [Warning] A worker browser failed to start ({error}) - "
+                      f"its institutions are scraped in the main browser")
+                warned = True
+            experts = scrape_institution(driver, wait, uni_name)
+        yield uni_name, experts
+
+
 # ==========================================
 # MAIN EXECUTION
 # ==========================================
@@ -488,9 +825,10 @@ def main():
 
     # Initialize
     driver = get_driver()
-    wait = WebDriverWait(driver, 20)
+    wait = WebDriverWait(driver, 20, poll_frequency=0.1)
     master_list = []
     start_index = 0
+    resume_bytes = None
 
     # Check for existing checkpoint
     checkpoint = load_checkpoint()
@@ -503,8 +841,13 @@ def main():
         if resume == 'y':
             master_list = checkpoint['data']
             start_index = checkpoint['current_index']
+            resume_bytes = checkpoint.get('data_bytes')
             print("✓ Resuming from checkpoint...")
 
+    log = open_checkpoint_log(resume_bytes)
+    if resume_bytes is None and master_list:
+        append_checkpoint(log, master_list)
+
     try:
         # ===== STEP 1: Login =====
         driver.get(LOGIN_URL)
@@ -527,25 +870,52 @@ def main():
         print("STEP 2: SCRAPING EXPERTS")
         print("-" * 50)
 
-        for i, uni_name in enumerate(institution_names[start_index:], start=start_index):
-            print(f"\n[{i + 1}/{len(institution_names)}] {uni_name}")
+        remaining = institution_names[start_index:]
 
-            # Select institution from dropdown
-            success = select_institution(driver, wait, uni_name)
+        # Pool tasks must be picklable by module name, which only holds when
+        # this file runs as a script (not when loaded by the main controller)
+        use_pool = WORKER_COUNT > 1 and len(remaining) > 1 and __name__ == "__main__"
 
-            if success:
-                # Scrape all pages for this institution
-                experts = scrape_all_pages_for_institution(driver, wait, uni_name)
-                master_list.extend(experts)
-                print(f"      ✓ Collected {len(experts)} experts (Running total: {len(master_list)})")
-            else:
-                print(f"      ✗ Skipped due to selection error")
-
-            # Save checkpoint after each institution
-            save_checkpoint(master_list, i + 1, institution_names)
+        if use_pool:
+            print(f"Scraping with {WORKER_COUNT} parallel browsers...")
+            pool = multiprocessing.Pool(
+                WORKER_COUNT,
+                initializer=_init_worker,
+                initargs=(driver.get_cookies(), driver.current_url)
+            )
+            results = _scrape_pooled(pool, driver, wait, remaining)
+        else:
+            pool = None
+            results = _scrape_sequential(driver, wait, remaining, start_index, len(institution_names))
 
-            # Small delay between institutions
-            time.sleep(0.5)
+        try:
+            # imap keeps input order, so checkpoints stay index-based
+            for i, (uni_name, experts) in enumerate(results, start=start_index):
+                if pool is not None:
+                    print(f"\n[{i + 1}/{len(institution_names)}] {uni_name}")
+
+                if experts is not None:
+                    master_list.extend(experts)
+                    append_checkpoint(log, experts)
+                    print(f"      ✓ Collected {len(experts)} experts (Running total: {len(master_list)})")
+                else:
+                    print(f"      ✗ Skipped due to selection error")
+
+                # Save checkpoint after each institution
+                save_checkpoint(log, len(master_list), i + 1, institution_names)
+
+                # Small delay between institutions
+                if pool is None:
+                    time.sleep(0.5)
+        except BaseException:
+            if pool is not None:
+                pool.terminate()
+                pool = None
+            raise
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
 
         # ===== STEP 4: Save Final Results =====
         print("\n" + "=" * 60)
@@ -559,10 +929,15 @@ def main():
             json.dump(master_list, f, indent=2, ensure_ascii=False)
         print(f"\n✓ Saved to {OUTPUT_JSON}")
 
+        # Build the DataFrame once for every output below
+        df = pd.DataFrame(master_list, dtype="string[pyarrow]" if PYARROW_AVAILABLE else None)
+
         # Save Excel
         try:
-            df = pd.DataFrame(master_list)
-            df.to_excel(OUTPUT_EXCEL, index=False, engine='openpyxl')
+            if XLSXWRITER_AVAILABLE:
+                write_excel_streaming(master_list, OUTPUT_EXCEL)
+            else:
+                df.to_excel(OUTPUT_EXCEL, index=False, engine='openpyxl')
             print(f"✓ Saved to {OUTPUT_EXCEL}")
         except Exception as e:
             print(f"✗ Excel save failed: {e}")
@@ -573,13 +948,23 @@ def main():
             except:
                 pass
 
+        # Save Parquet (much smaller and faster to reload than Excel)
+        if PYARROW_AVAILABLE:
+            parquet_file = os.path.splitext(OUTPUT_EXCEL)[0] + ".parquet"
+            try:
+                df.to_parquet(parquet_file, index=False, compression='zstd')
+                print(f"✓ Saved to {parquet_file}")
+            except Exception as e:
+                print(f"✗ Parquet save failed: {e}")
+
         # Summary statistics
         print("\n" + "-" * 50)
         print("SUMMARY BY INSTITUTION:")
         print("-" * 50)
-        df = pd.DataFrame(master_list)
         if not df.empty:
-            summary = df.groupby('Institution').size().sort_values(ascending=False)
+            # Dictionary-encode the institution column; groupby then works on codes
+            df['Institution'] = df['Institution'].astype('category')
+            summary = df.groupby('Institution', observed=True).size().sort_values(ascending=False)
             for inst, count in summary.head(10).items():
                 print(f"   {inst}: {count}")
             if len(summary) > 10:
@@ -607,6 +992,7 @@ def main():
             print(f"   Emergency backup saved to {emergency_file}")
 
     finally:
+        log.close()
         print("\n" + "=" * 60)
         print("Script finished. Browser left open for inspection.")
         print("=" * 60)
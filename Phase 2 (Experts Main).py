@@ -12,41 +12,108 @@ import time
 import json
 import re
 import os
+import queue
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+import lxml.etree
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import (
-    TimeoutException,
-    NoSuchElementException,
-    StaleElementReferenceException,
-    ElementClickInterceptedException
-)
+from selenium.common.exceptions import TimeoutException
+
+# Optional: fetch detail pages over plain HTTP instead of the browser
+# (aiohttp preferred, requests + threads as a fallback)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+if not (AIOHTTP_AVAILABLE or REQUESTS_AVAILABLE):
+    print("[WARN] aiohttp/requests not installed - detail pages will load through the browser.")
+
+# Optional: faster JSON encoding/decoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: a columnar Parquet copy of the results
+try:
+    import pyarrow
+    import pyarrow.parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # ==========================================
 # CONFIGURATION
 # ==========================================
+LOGIN_URL = "https://www.ocip.express/"
 INPUT_FILE = "experts_master_list.json"
 OUTPUT_FILE = "experts_full_details.json"
 CHECKPOINT_FILE = "phase2_checkpoint.json"
 ERROR_LOG_FILE = "phase2_errors.json"
 
 # Timing Configuration
-PAGE_LOAD_WAIT = 2.0
-ACCORDION_EXPAND_WAIT = 0.5
+# Collapsed panels are still in the DOM and the extractors read text_content()
+# from a static snapshot, so clicking them open is normally unnecessary
+EXPAND_ACCORDIONS = False
+ACCORDION_EXPAND_TIMEOUT = 5.0  # Max wait for the panels to report expanded
 BETWEEN_EXPERTS_DELAY = 1.0
-REQUEST_DELAY = 0.3  # Delay between accordion clicks
+
+# Profiles are appended to a JSONL log beside CHECKPOINT_FILE through a
+# buffer of this size; the header checkpoint is rewritten every 10 experts.
+# Output and checkpoint files are written to a temp file and swapped in.
+WRITE_BUFFER = 1 << 20
+
+# The Parquet copy is built from the log this many profiles at a time
+PARQUET_BATCH_SIZE = 1000
 
 # Rate limiting - pause every N experts
 BATCH_SIZE = 50
 BATCH_PAUSE = 10  # seconds
 
+# HTTP fast path: reuse the browser's login cookies to fetch detail pages
+# concurrently; any page that doesn't parse falls back to the browser
+USE_HTTP_FETCH = True
+HTTP_CONCURRENCY = 20  # Pages fetched per batch / max open connections
+HTTP_TIMEOUT = 30  # seconds per request
+
+# Browser path: pages that can't be fetched over HTTP load in this many
+# browsers at once (the extras reuse the login cookies). 1 = main browser only.
+BROWSER_WORKERS = 4
+BROWSER_RATE_LIMIT = 1.0  # max page loads per second across all browsers
+HEADLESS = True  # extra browsers run headless
+
+# Don't download images, fonts, stylesheets or analytics on detail pages; the
+# extractors only read the HTML (Photo_URL comes from the img src attribute).
+# The main browser loads everything until you have logged in.
+BLOCK_RESOURCES = True
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.webp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css", "*analytics*", "*googletagmanager*",
+]
+
 
 # ==========================================
 # DRIVER SETUP
 # ==========================================
-def get_driver():
+def get_driver(headless=False, block_images=False):
     """Initialize Chrome WebDriver with optimal settings."""
     options = webdriver.ChromeOptions()
     options.add_argument("--start-maximized")
@@ -54,6 +121,11 @@ def get_driver():
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
     options.add_experimental_option("detach", True)
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    if block_images:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
 
     driver = webdriver.Chrome(options=options)
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -61,48 +133,256 @@ def get_driver():
     return driver
 
 
+def block_resources(driver):
+    """Stop the browser requesting BLOCKED_URL_PATTERNS (via DevTools)."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"   [Warning] Could not block page resources: {e}")
+
+
 # ==========================================
 # UTILITY FUNCTIONS
 # ==========================================
+def to_json(obj, indent=False):
+    """Encode obj as UTF-8 JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def from_json(data):
+    """Decode JSON bytes/str (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@contextmanager
+def atomic_write(filepath):
+    """
+    Open a buffered temp file beside filepath and swap it into place once the
+    block finishes, so a crash never leaves a half-written file behind.
+    """
+    tmp = filepath + ".tmp"
+    try:
+        with open(tmp, 'wb', buffering=WRITE_BUFFER) as f:
+            yield f
+        os.replace(tmp, filepath)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def write_json(filepath, obj):
+    """Write obj to filepath as indented JSON."""
+    with atomic_write(filepath) as f:
+        f.write(to_json(obj, indent=True))
+
+
+def read_json(filepath):
+    """Read a JSON file."""
+    with open(filepath, 'rb') as f:
+        return from_json(f.read())
+
+
 def load_master_list(filepath):
     """Load the master list from Phase 1."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(filepath)
         print(f"✓ Loaded {len(data)} experts from {filepath}")
         return data
     except FileNotFoundError:
         print(f"✗ ERROR: {filepath} not found. Run Phase 1 first.")
         return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"✗ ERROR: Invalid JSON in {filepath}: {e}")
         return None
 
 
-def save_checkpoint(processed_data, current_index, errors):
-    """Save progress checkpoint."""
+def checkpoint_data_file():
+    """Path of the append-only profile log that goes with CHECKPOINT_FILE."""
+    return os.path.splitext(CHECKPOINT_FILE)[0] + ".jsonl"
+
+
+def open_checkpoint_log(resume_bytes=None):
+    """
+    Open the profile log for appending (1 MiB write buffer).
+    When resuming, anything written after the last saved checkpoint is cut off.
+    """
+    if resume_bytes is None:
+        # Fresh start: the old index would not describe the new log
+        try:
+            os.remove(CHECKPOINT_FILE)
+        except FileNotFoundError:
+            pass
+        return open(checkpoint_data_file(), 'wb', buffering=WRITE_BUFFER)
+    log = open(checkpoint_data_file(), 'r+b', buffering=WRITE_BUFFER)
+    log.truncate(resume_bytes)
+    log.seek(0, os.SEEK_END)
+    return log
+
+
+def append_profile(log, profile):
+    """Append one profile to the log as a JSON line."""
+    log.write(to_json(profile) + b"\n")
+
+
+# Number of errors in ERROR_LOG_FILE as last written by save_checkpoint()
+_errors_saved = None
+
+
+def save_checkpoint(log, experts_processed, current_index, errors, stats):
+    """
+    Save progress checkpoint.
+    Profiles are already in the log; only a small header is rewritten, plus
+    the error log when new errors have been added since the last save.
+    """
+    global _errors_saved
+    log.flush()
     checkpoint = {
         "timestamp": datetime.now().isoformat(),
         "current_index": current_index,
-        "experts_processed": len(processed_data),
+        "experts_processed": experts_processed,
         "errors_count": len(errors),
-        "data": processed_data
+        "data_bytes": log.tell(),
+        "stats": stats
     }
-    with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(checkpoint, f, indent=2, ensure_ascii=False)
+    write_json(CHECKPOINT_FILE, checkpoint)
 
-    # Save errors separately
-    with open(ERROR_LOG_FILE, 'w', encoding='utf-8') as f:
-        json.dump(errors, f, indent=2, ensure_ascii=False)
+    # Save errors separately (the list only grows, so its length says
+    # whether the file is already current)
+    if len(errors) != _errors_saved:
+        write_json(ERROR_LOG_FILE, errors)
+        _errors_saved = len(errors)
 
 
 def load_checkpoint():
     """Load previous checkpoint if exists."""
     try:
-        with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        checkpoint = read_json(CHECKPOINT_FILE)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    # Older checkpoints carry the profiles inline
+    if "data" in checkpoint:
+        return checkpoint
+
+    # The profiles stay on disk; just make sure the log covers the header
+    try:
+        if os.path.getsize(checkpoint_data_file()) < checkpoint["data_bytes"]:
+            return None
+    except (OSError, KeyError):
         return None
+    return checkpoint
+
+
+def iter_logged_profiles():
+    """Yield each profile in the log as its raw JSON line (bytes)."""
+    with open(checkpoint_data_file(), 'rb', buffering=WRITE_BUFFER) as f:
+        for line in f:
+            line = line.rstrip(b"\n")
+            if line:
+                yield line
+
+
+def write_output_from_log(filepath):
+    """
+    Write the logged profiles to filepath as one JSON array, one profile per
+    line, streaming so the profiles never have to be in memory together.
+    """
+    with atomic_write(filepath) as out:
+        out.write(b"[")
+        separator = b"\n"
+        for line in iter_logged_profiles():
+            out.write(separator)
+            out.write(line)
+            separator = b",\n"
+        out.write(b"\n]\n")
+
+
+def parquet_schema():
+    """
+    Fixed Parquet schema: one string column per Meta field ("Meta.Institution")
+    and one per section, holding the section as JSON. Section contents are
+    free-form, so they are never type-inferred.
+    """
+    meta = ["Source_URL", "Scraped_At"] + [key for key, _ in META_FIELDS]
+    return pyarrow.schema(
+        [(f"Meta.{key}", pyarrow.string()) for key in meta]
+        + [(key, pyarrow.string()) for key, *_ in PROFILE_SECTIONS]
+    )
+
+
+def parquet_row(profile, schema):
+    """Flatten one profile into a row of parquet_schema()."""
+    meta = profile.get("Meta", {})
+    row = {}
+    for name in schema.names:
+        if name.startswith("Meta."):
+            value = meta.get(name[len("Meta."):])
+            row[name] = None if value is None else str(value)
+        else:
+            value = profile.get(name)
+            row[name] = None if value is None else to_json(value).decode('utf-8')
+    return row
+
+
+def write_parquet_from_log(filepath):
+    """
+    Write the logged profiles to filepath as Parquet (zstd), one row per
+    expert, PARQUET_BATCH_SIZE profiles at a time so memory stays flat.
+    """
+    schema = parquet_schema()
+    with atomic_write(filepath) as f:
+        writer = pyarrow.parquet.ParquetWriter(f, schema, compression='zstd')
+        try:
+            batch = []
+            for line in iter_logged_profiles():
+                batch.append(parquet_row(from_json(line), schema))
+                if len(batch) >= PARQUET_BATCH_SIZE:
+                    writer.write_table(pyarrow.Table.from_pylist(batch, schema=schema))
+                    batch = []
+            if batch:
+                writer.write_table(pyarrow.Table.from_pylist(batch, schema=schema))
+        finally:
+            writer.close()
+
+
+def new_stats():
+    """Zeroed run statistics (Experts with Bio, Expertise, ...)."""
+    return dict.fromkeys(
+        ("with_bio", "with_expertise", "expertise_entries", "with_facilities", "with_web", "with_activity"), 0
+    )
+
+
+def count_profile(stats, profile):
+    """
+    Add one profile to the running statistics.
+    Returns (has_bio, expertise_count, facilities_count) for the progress line.
+    """
+    has_bio = bool(profile.get("Details", {}).get("ProfileDescription", ""))
+    expertise_count = len(profile.get("Expertise", []))
+    facilities_count = len(profile.get("Facility_Affiliation", []))
+    stats["with_bio"] += has_bio
+    stats["with_expertise"] += bool(expertise_count)
+    stats["expertise_entries"] += expertise_count
+    stats["with_facilities"] += bool(facilities_count)
+    stats["with_web"] += bool(profile.get("Web_Presence", []))
+    stats["with_activity"] += bool(profile.get("OCIP_Activity", []))
+    return has_bio, expertise_count, facilities_count
+
+
+def summarize_logged_profiles():
+    """Rebuild the statistics from the log (checkpoints written before they were tracked)."""
+    stats = new_stats()
+    for line in iter_logged_profiles():
+        count_profile(stats, from_json(line))
+    return stats
+
+
+_WS_RE = re.compile(r'\s+')
 
 
 def clean_text(text):
@@ -110,507 +390,707 @@ def clean_text(text):
     if not text:
         return ""
     # Remove excess whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WS_RE.sub(' ', text.strip())
     # Remove non-breaking spaces
     text = text.replace('\xa0', ' ')
     return text
 
 
+def has_class(name):
+    """XPath predicate matching a single CSS class token."""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# XPath expressions used per field/row, compiled once at import and called
+# as functions: XP_ROWS(panel) -> list of matching elements
+XPath = lxml.etree.XPath
+XP_ICON = XPath(f'.//span[{has_class("k-icon")}]')
+XP_ICON_OR_LINK = XPath(f'.//span[{has_class("k-icon")}] | .//a')
+XP_RATING = XPath(f'.//span[{has_class("k-rating")}]')
+XP_NO_RECORDS = XPath(f'.//tr[{has_class("k-no-data")}] | .//div[{has_class("k-grid-norecords-template")}]')
+XP_GRID_ROWS = XPath(f'.//tbody//tr[{has_class("k-master-row")}]')
+XP_ROWS = XPath(f'.//div[{has_class("row")}]')
+XP_BREADCRUMB_ITEMS = XPath(f'.//ol[{has_class("breadcrumb")}]/li')
+XP_TABLE = XPath(f'.//table[{has_class("table")}]')
+XP_PANELBAR_ANCESTOR = XPath(f'ancestor::*[{has_class("k-panelbar")}][1]')
+XP_DESCENDANT_BY_ID = XPath('.//*[@id=$id]')
+XP_LABELS = XPath('.//label')
+XP_COL_MD = XPath('.//div[contains(@class, "col-md")]')
+XP_MAILTO = XPath('.//a[starts-with(@href, "mailto:")]')
+XP_TEL = XPath('.//a[starts-with(@href, "tel:")]')
+XP_IMG_ALT = XPath('.//img[@alt]')
+XP_CELLS = XPath('.//td')
+XP_BODY_CELLS = XPath('.//tbody//td')
+XP_LINKS = XPath('.//a')
+
+
+@lru_cache(maxsize=None)
+def columns_xpath(classes):
+    """Compiled XPath for div columns carrying any of the given classes."""
+    return XPath(f'.//div[{" or ".join(has_class(c) for c in classes)}]')
+
+
+def node_text(element):
+    """Cleaned text content of an lxml element."""
+    return clean_text(element.text_content())
+
+
 def parse_yes_no(element):
     """Parse Yes/No icon elements."""
-    try:
-        icon = element.find_element(By.CSS_SELECTOR, "span.k-icon")
-        title = icon.get_attribute("title")
+    icons = XP_ICON(element)
+    if icons:
+        icon = icons[0]
+        title = icon.get("title")
         if title:
             return title  # Returns "Yes" or "No"
         # Fallback: check class names
-        classes = icon.get_attribute("class")
+        classes = icon.get("class") or ""
         if "k-i-checkbox-checked" in classes:
             return "Yes"
         elif "k-i-checkbox" in classes:
             return "No"
-    except:
-        pass
-    return clean_text(element.text)
+    return node_text(element)
 
 
-def expand_all_accordions(driver, wait):
-    """Expand all collapsed accordion panels."""
-    try:
-        # Find all collapsed accordion headers
-        collapsed_headers = driver.find_elements(
-            By.CSS_SELECTOR,
-            "li.k-panelbar-header[aria-expanded='false'] > a.k-link"
-        )
+def has_no_records(panel):
+    """Check whether a grid panel shows the 'No records' placeholder."""
+    return bool(XP_NO_RECORDS(panel))
 
-        for header in collapsed_headers:
-            try:
-                # Scroll into view
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", header)
-                time.sleep(0.1)
 
-                # Click to expand
-                try:
-                    header.click()
-                except ElementClickInterceptedException:
-                    driver.execute_script("arguments[0].click();", header)
+def grid_rows(container):
+    """Return the data rows of a Kendo grid."""
+    return XP_GRID_ROWS(container)
 
-                time.sleep(ACCORDION_EXPAND_WAIT)
 
-            except StaleElementReferenceException:
-                continue
-            except Exception as e:
-                continue
+def labelled_rows(panel):
+    """Yield (label_for, label_text, row) for each labelled div.row."""
+    for row in XP_ROWS(panel):
+        labels = XP_LABELS(row)
+        if not labels:
+            continue
+        label = labels[0]
+        yield label.get("for") or "", node_text(label), row
+
+
+def value_columns(row, *classes):
+    """Return the row's value columns matching any of the given classes."""
+    return columns_xpath(classes)(row)
 
-        # Give time for all content to render
-        time.sleep(0.5)
-        return True
+
+# Markup of the panel bar holding ProfileBar-1..10 (whole page if absent)
+PANELBAR_HTML_FN = """
+function panelbarHtml() {
+    var first = document.getElementById('ProfileBar-1');
+    var root = (first && first.closest('.k-panelbar')) || document.documentElement;
+    return root.outerHTML;
+}
+"""
+
+HARVEST_JS = PANELBAR_HTML_FN + "return panelbarHtml();"
+
+# Clicks every collapsed panel header, waits until a MutationObserver sees
+# all of them flip to aria-expanded="true" (at most arguments[0] ms), then
+# calls back with {expanded, html}: the panel bar's markup, harvested in the
+# same round-trip. expanded is -1 if the wait timed out.
+EXPAND_AND_HARVEST_JS = PANELBAR_HTML_FN + """
+var timeoutMs = arguments[0];
+var callback = arguments[arguments.length - 1];
+function done(expanded) {
+    callback({expanded: expanded, html: panelbarHtml()});
+}
+var headers = Array.from(document.querySelectorAll("li.k-panelbar-header[aria-expanded='false']"));
+if (!headers.length) { done(0); return; }
+
+var finished = false;
+function allExpanded() {
+    return headers.every(function (h) { return h.getAttribute('aria-expanded') === 'true'; });
+}
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    done(result);
+}
+
+var observer = new MutationObserver(function () {
+    if (allExpanded()) { finish(headers.length); }
+});
+headers.forEach(function (h) {
+    observer.observe(h, {attributes: true, attributeFilter: ['aria-expanded']});
+});
+headers.forEach(function (h) {
+    var link = h.querySelector(':scope > a.k-link');
+    if (link) { link.click(); }
+});
+
+if (allExpanded()) { finish(headers.length); }
+setTimeout(function () { finish(-1); }, timeoutMs);
+"""
+
+
+def harvest_profile_html(driver):
+    """
+    Return the panel bar HTML, first expanding the accordions if
+    EXPAND_ACCORDIONS is set. Falls back to the full page source if the
+    script fails.
+    """
+    if not EXPAND_ACCORDIONS:
+        try:
+            return driver.execute_script(HARVEST_JS)
+        except Exception as e:
+            print(f"      [Warning] Panel harvest error: {e}")
+            return driver.page_source
+
+    try:
+        driver.set_script_timeout(ACCORDION_EXPAND_TIMEOUT + 5)
+        result = driver.execute_async_script(EXPAND_AND_HARVEST_JS, int(ACCORDION_EXPAND_TIMEOUT * 1000))
+        if result["expanded"] < 0:
+            print("      [Warning] Not all accordions reported expanded - proceeding anyway")
+        return result["html"]
 
     except Exception as e:
         print(f"      [Warning] Accordion expansion error: {e}")
-        return False
+        return driver.page_source
 
 
 # ==========================================
 # SECTION EXTRACTORS
 # ==========================================
+# Each extractor takes its panel from the parsed page (an lxml element), so the
+# same code serves pages loaded in the browser and pages fetched over HTTP.
+# The page is a static snapshot, so extract_sections() handles missing panels
+# and errors for all of them.
 
-def extract_general_information(driver):
+def extract_general_information(panel):
     """Extract data from General Information section."""
     data = {}
 
-    try:
-        # Find the General Information panel
-        panel = driver.find_element(By.ID, "ProfileBar-1")
-
-        # Extract Academic Unit breadcrumb
-        try:
-            breadcrumb_items = panel.find_elements(By.CSS_SELECTOR, "ol.breadcrumb li")
-            academic_unit_path = []
-            for item in breadcrumb_items:
-                text = clean_text(item.text)
-                if text:
-                    academic_unit_path.append(text)
-            data["Academic_Unit"] = " > ".join(academic_unit_path) if academic_unit_path else ""
-        except:
-            data["Academic_Unit"] = ""
-
-        # Extract key-value pairs from rows
-        rows = panel.find_elements(By.CSS_SELECTOR, "div.row")
-
-        for row in rows:
-            try:
-                labels = row.find_elements(By.TAG_NAME, "label")
-                if not labels:
-                    continue
-
-                label = labels[0]
-                label_for = label.get_attribute("for") or ""
-                label_text = clean_text(label.text)
-
-                # Find the corresponding value column
-                cols = row.find_elements(By.CSS_SELECTOR, "div[class*='col-md']")
-                value_col = None
-
-                for col in cols:
-                    if label not in col.find_elements(By.TAG_NAME, "label"):
-                        # Check if this column has the value
-                        if col.text.strip() or col.find_elements(By.CSS_SELECTOR, "span.k-icon, a"):
-                            value_col = col
-                            break
-
-                if not value_col:
-                    continue
-
-                # Extract value based on field type
-                field_key = label_for if label_for else label_text.replace(" ", "_")
-
-                if label_for in ["IsLinkedToUser", "Enabled"]:
-                    data[field_key] = parse_yes_no(value_col)
-                elif label_for == "Contact":
-                    # Extract email and phone
-                    try:
-                        email_elem = value_col.find_element(By.CSS_SELECTOR, "a[href^='mailto:']")
-                        data["Email"] = email_elem.text.strip()
-                    except:
-                        data["Email"] = ""
-                    try:
-                        phone_elem = value_col.find_element(By.CSS_SELECTOR, "a[href^='tel:']")
-                        data["Phone"] = phone_elem.text.strip()
-                    except:
-                        data["Phone"] = ""
-                elif label_for == "ReputationScore":
-                    # Extract rating value
-                    try:
-                        rating_span = value_col.find_element(By.CSS_SELECTOR, "span.k-rating")
-                        rating_value = rating_span.get_attribute("aria-valuenow")
-                        data["Reputation_Score"] = rating_value if rating_value else "Not Rated"
-                        # Also get the text description
-                        rating_text = clean_text(value_col.text)
-                        if "Not Rated" in rating_text:
-                            data["Reputation_Score"] = "Not Rated"
-                    except:
-                        data["Reputation_Score"] = clean_text(value_col.text)
-                else:
-                    data[field_key] = clean_text(value_col.text)
-
-            except Exception as e:
+    # Extract Academic Unit breadcrumb
+    academic_unit_path = []
+    for item in XP_BREADCRUMB_ITEMS(panel):
+        text = node_text(item)
+        if text:
+            academic_unit_path.append(text)
+    data["Academic_Unit"] = " > ".join(academic_unit_path) if academic_unit_path else ""
+
+    # Extract key-value pairs from rows
+    for label_for, label_text, row in labelled_rows(panel):
+        # Find the corresponding value column
+        value_col = None
+        for col in XP_COL_MD(row):
+            if XP_LABELS(col):
                 continue
+            # Check if this column has the value
+            if col.text_content().strip() or XP_ICON_OR_LINK(col):
+                value_col = col
+                break
+
+        if value_col is None:
+            continue
+
+        # Extract value based on field type
+        field_key = label_for if label_for else label_text.replace(" ", "_")
+
+        if label_for in ["IsLinkedToUser", "Enabled"]:
+            data[field_key] = parse_yes_no(value_col)
+        elif label_for == "Contact":
+            # Extract email and phone
+            email = XP_MAILTO(value_col)
+            data["Email"] = email[0].text_content().strip() if email else ""
+            phone = XP_TEL(value_col)
+            data["Phone"] = phone[0].text_content().strip() if phone else ""
+        elif label_for == "ReputationScore":
+            # Extract rating value
+            rating = XP_RATING(value_col)
+            if rating:
+                rating_value = rating[0].get("aria-valuenow")
+                data["Reputation_Score"] = rating_value if rating_value else "Not Rated"
+                # Also get the text description
+                if "Not Rated" in node_text(value_col):
+                    data["Reputation_Score"] = "Not Rated"
+            else:
+                data["Reputation_Score"] = node_text(value_col)
+        else:
+            data[field_key] = node_text(value_col)
 
-        # Extract photo URL if present
-        try:
-            img = panel.find_element(By.CSS_SELECTOR, "img[alt]")
-            data["Photo_URL"] = img.get_attribute("src")
-        except:
-            data["Photo_URL"] = ""
-
-    except NoSuchElementException:
-        pass
-    except Exception as e:
-        print(f"      [Warning] General Information extraction error: {e}")
+    # Extract photo URL if present
+    img = XP_IMG_ALT(panel)
+    data["Photo_URL"] = img[0].get("src", "") if img else ""
 
     return data
 
 
-def extract_details(driver):
+def extract_details(panel):
     """Extract data from Details section."""
     data = {}
 
-    try:
-        panel = driver.find_element(By.ID, "ProfileBar-2")
-        rows = panel.find_elements(By.CSS_SELECTOR, "div.row")
+    for label_for, label_text, row in labelled_rows(panel):
+        # Find value column
+        cols = value_columns(row, "col-md-9", "col-md-7")
+        if cols:
+            field_key = label_for if label_for else label_text.replace(" ", "_")
+            data[field_key] = node_text(cols[0])
 
-        for row in rows:
-            try:
-                labels = row.find_elements(By.TAG_NAME, "label")
-                if not labels:
-                    continue
-
-                label = labels[0]
-                label_for = label.get_attribute("for") or ""
-                label_text = clean_text(label.text)
+    return data
 
-                # Find value column
-                cols = row.find_elements(By.CSS_SELECTOR, "div.col-md-9, div.col-md-7")
-                if cols:
-                    value = clean_text(cols[0].text)
-                    field_key = label_for if label_for else label_text.replace(" ", "_")
-                    data[field_key] = value
 
-            except Exception:
-                continue
+def extract_expert_demographics(panel):
+    """Extract data from Expert Demographics section."""
+    data = {}
 
-    except NoSuchElementException:
-        pass
-    except Exception as e:
-        print(f"      [Warning] Details extraction error: {e}")
+    for _, label_text, row in labelled_rows(panel):
+        cols = value_columns(row, "col-md-7", "col-md-9")
+        if cols:
+            data[label_text.replace(" ", "_")] = node_text(cols[0])
 
     return data
 
 
-def extract_expert_demographics(driver):
-    """Extract data from Expert Demographics section."""
-    data = {}
+def extract_expertise(panel):
+    """Extract data from Expertise section (table/grid)."""
+    expertise_list = []
 
-    try:
-        panel = driver.find_element(By.ID, "ProfileBar-3")
-        rows = panel.find_elements(By.CSS_SELECTOR, "div.row")
+    if has_no_records(panel):
+        return []
 
-        for row in rows:
-            try:
-                labels = row.find_elements(By.TAG_NAME, "label")
-                if not labels:
-                    continue
+    # Find the grid table
+    grid = XP_DESCENDANT_BY_ID(panel, id="contactsGrid")
+    if not grid:
+        return []
 
-                label = labels[0]
-                label_text = clean_text(label.text)
+    for row in grid_rows(grid[0]):
+        cells = XP_CELLS(row)
+        if len(cells) >= 4:
+            expertise_list.append({
+                "SRED_Code": node_text(cells[0]),
+                "Area": node_text(cells[1]),
+                "Discipline": node_text(cells[2]),
+                "Field": node_text(cells[3])
+            })
 
-                cols = row.find_elements(By.CSS_SELECTOR, "div.col-md-7, div.col-md-9")
-                if cols:
-                    value = clean_text(cols[0].text)
-                    data[label_text.replace(" ", "_")] = value
+    return expertise_list
 
-            except Exception:
-                continue
 
-    except NoSuchElementException:
-        pass
-    except Exception as e:
-        print(f"      [Warning] Demographics extraction error: {e}")
+def extract_price_availability(panel):
+    """Extract data from Price & Availability section."""
+    data = {}
+
+    # Extract Daily Rate
+    for label_for, _, row in labelled_rows(panel):
+        if label_for == "PerDiemRate":
+            cols = value_columns(row, "col-md-9")
+            if cols:
+                data["Daily_Rate"] = node_text(cols[0])
+
+    # Extract availability flags from table
+    tables = XP_TABLE(panel)
+    if tables:
+        header_texts = [
+            "Can_Initiate_Innovation_Challenge",
+            "Available_for_Scoping",
+            "Available_for_Projects",
+            "Can_be_Principal_Investigator"
+        ]
+
+        for i, cell in enumerate(XP_BODY_CELLS(tables[0])):
+            if i < len(header_texts):
+                data[header_texts[i]] = parse_yes_no(cell)
 
     return data
 
 
-def extract_expertise(driver):
-    """Extract data from Expertise section (table/grid)."""
-    expertise_list = []
+def extract_facility_affiliation(panel):
+    """Extract data from Facility Affiliation section (table/grid)."""
+    facilities_list = []
 
-    try:
-        panel = driver.find_element(By.ID, "ProfileBar-4")
+    if has_no_records(panel):
+        return []
 
-        # Check for "No records found"
-        try:
-            no_data = panel.find_element(By.CSS_SELECTOR, "tr.k-no-data, div.k-grid-norecords-template")
-            if no_data:
-                return []
-        except NoSuchElementException:
-            pass
+    grid = XP_DESCENDANT_BY_ID(panel, id="networksGrid")
+    if not grid:
+        return []
 
-        # Find the grid table
-        grid = panel.find_element(By.ID, "contactsGrid")
-        rows = grid.find_elements(By.CSS_SELECTOR, "tbody tr.k-master-row")
+    for row in grid_rows(grid[0]):
+        cells = XP_CELLS(row)
+        if len(cells) >= 2:
+            facilities_list.append({
+                "Facility_Name": node_text(cells[0]),
+                "Is_Primary_Facility": parse_yes_no(cells[1])
+            })
 
-        for row in rows:
-            try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 4:
-                    expertise_entry = {
-                        "SRED_Code": clean_text(cells[0].text),
-                        "Area": clean_text(cells[1].text),
-                        "Discipline": clean_text(cells[2].text),
-                        "Field": clean_text(cells[3].text)
-                    }
-                    expertise_list.append(expertise_entry)
-            except Exception:
-                continue
+    return facilities_list
 
-    except NoSuchElementException:
-        pass
-    except Exception as e:
-        print(f"      [Warning] Expertise extraction error: {e}")
 
-    return expertise_list
+def extract_web_presence(panel):
+    """Extract data from Web Presence section (table/grid)."""
+    web_presence_list = []
 
+    if has_no_records(panel):
+        return []
 
-def extract_price_availability(driver):
-    """Extract data from Price & Availability section."""
-    data = {}
+    # Find the webGrid table
+    grid = XP_DESCENDANT_BY_ID(panel, id="webGrid")
+    if not grid:
+        return []
 
-    try:
-        panel = driver.find_element(By.ID, "ProfileBar-5")
+    for row in grid_rows(grid[0]):
+        cells = XP_CELLS(row)
+        if len(cells) >= 3:
+            # URL might be in an anchor tag
+            links = XP_LINKS(cells[2])
+            url = links[0].get("href") if links else node_text(cells[2])
 
-        # Extract Daily Rate
-        try:
-            rows = panel.find_elements(By.CSS_SELECTOR, "div.row")
-            for row in rows:
-                labels = row.find_elements(By.TAG_NAME, "label")
-                if labels:
-                    label_for = labels[0].get_attribute("for") or ""
-                    if label_for == "PerDiemRate":
-                        cols = row.find_elements(By.CSS_SELECTOR, "div.col-md-9")
-                        if cols:
-                            data["Daily_Rate"] = clean_text(cols[0].text)
-        except:
-            data["Daily_Rate"] = ""
-
-        # Extract availability flags from table
-        try:
-            table = panel.find_element(By.CSS_SELECTOR, "table.table")
-            headers = table.find_elements(By.CSS_SELECTOR, "thead th")
-            cells = table.find_elements(By.CSS_SELECTOR, "tbody td")
+            web_presence_list.append({
+                "Name": node_text(cells[0]),
+                "Type": node_text(cells[1]),
+                "URL": url
+            })
 
-            header_texts = [
-                "Can_Initiate_Innovation_Challenge",
-                "Available_for_Scoping",
-                "Available_for_Projects",
-                "Can_be_Principal_Investigator"
-            ]
+    return web_presence_list
 
-            for i, cell in enumerate(cells):
-                if i < len(header_texts):
-                    data[header_texts[i]] = parse_yes_no(cell)
 
-        except Exception as e:
-            pass
+def extract_ocip_activity(panel):
+    """Extract data from OCIP Activity section (table/grid)."""
+    activity_list = []
 
-    except NoSuchElementException:
-        pass
-    except Exception as e:
-        print(f"      [Warning] Price & Availability extraction error: {e}")
+    if has_no_records(panel):
+        return []
+
+    # Note: This panel also uses id="webGrid" (duplicate ID in HTML)
+    # so rows are looked up within the panel context
+    for row in grid_rows(panel):
+        cells = XP_CELLS(row)
+        if len(cells) >= 4:
+            # Project name might be in a link
+            links = XP_LINKS(cells[0])
+            if links:
+                project_name = node_text(links[0])
+                project_url = links[0].get("href", "")
+            else:
+                project_name = node_text(cells[0])
+                project_url = ""
 
-    return data
+            activity_list.append({
+                "Project_Name": project_name,
+                "Project_URL": project_url,
+                "Type": node_text(cells[1]),
+                "Organization": node_text(cells[2]),
+                "Current_Status": node_text(cells[3])
+            })
 
+    return activity_list
 
-def extract_facility_affiliation(driver):
-    """Extract data from Facility Affiliation section (table/grid)."""
-    facilities_list = []
 
-    try:
-        panel = driver.find_element(By.ID, "ProfileBar-6")
+def extract_audit_trail(panel):
+    """Extract data from Audit Trail section."""
+    data = {}
 
-        # Check for "No records found"
-        try:
-            no_data = panel.find_element(By.CSS_SELECTOR, "tr.k-no-data, div.k-grid-norecords-template")
-            if no_data:
-                return []
-        except NoSuchElementException:
-            pass
+    for label_for, label_text, row in labelled_rows(panel):
+        cols = value_columns(row, "col-md-9")
+        if cols:
+            field_key = label_for if label_for else label_text.replace(" ", "_")
+            data[field_key] = node_text(cols[0])
 
-        grid = panel.find_element(By.ID, "networksGrid")
-        rows = grid.find_elements(By.CSS_SELECTOR, "tbody tr.k-master-row")
+    return data
 
-        for row in rows:
-            try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 2:
-                    facility_entry = {
-                        "Facility_Name": clean_text(cells[0].text),
-                        "Is_Primary_Facility": parse_yes_no(cells[1])
-                    }
-                    facilities_list.append(facility_entry)
-            except Exception:
-                continue
 
-    except NoSuchElementException:
-        pass
-    except Exception as e:
-        print(f"      [Warning] Facility Affiliation extraction error: {e}")
+# Profile key, panel id, extractor, section name, empty value - run in this
+# order by extract_sections()
+PROFILE_SECTIONS = [
+    ("General_Information", "ProfileBar-1", extract_general_information, "General Information", dict),
+    ("Details", "ProfileBar-2", extract_details, "Details", dict),
+    ("Expert_Demographics", "ProfileBar-3", extract_expert_demographics, "Demographics", dict),
+    ("Expertise", "ProfileBar-4", extract_expertise, "Expertise", list),
+    ("Price_Availability", "ProfileBar-5", extract_price_availability, "Price & Availability", dict),
+    ("Facility_Affiliation", "ProfileBar-6", extract_facility_affiliation, "Facility Affiliation", list),
+    ("Web_Presence", "ProfileBar-8", extract_web_presence, "Web Presence", list),
+    ("OCIP_Activity", "ProfileBar-9", extract_ocip_activity, "OCIP Activity", list),
+    ("Audit_Trail", "ProfileBar-10", extract_audit_trail, "Audit Trail", dict),
+]
 
-    return facilities_list
+XP_PROFILE_PANELS = XPath('//*[starts-with(@id, "ProfileBar-")]')
 
 
-def extract_web_presence(driver):
-    """Extract data from Web Presence section (table/grid)."""
-    web_presence_list = []
+def profile_panels(tree):
+    """Map each ProfileBar-N id to its panel, found in one pass over the page."""
+    panels = {}
+    for panel in XP_PROFILE_PANELS(tree):
+        panels.setdefault(panel.get("id"), panel)
+    return panels
 
-    try:
-        panel = driver.find_element(By.ID, "ProfileBar-8")
 
-        # Check for "No records found"
+def extract_sections(panels):
+    """
+    Run each section's extractor on its panel from profile_panels().
+    A missing panel, or one that fails to extract, gives an empty section.
+    """
+    sections = {}
+    for key, panel_id, extractor, name, empty in PROFILE_SECTIONS:
+        panel = panels.get(panel_id)
+        if panel is None:
+            sections[key] = empty()
+            continue
         try:
-            no_data = panel.find_element(By.CSS_SELECTOR, "tr.k-no-data, div.k-grid-norecords-template")
-            if no_data:
-                return []
-        except NoSuchElementException:
-            pass
+            sections[key] = extractor(panel)
+        except Exception as e:
+            print(f"      [Warning] {name} extraction error: {e}")
+            sections[key] = empty()
+    return sections
 
-        # Find the webGrid table
-        grid = panel.find_element(By.ID, "webGrid")
-        rows = grid.find_elements(By.CSS_SELECTOR, "tbody tr.k-master-row")
 
-        for row in rows:
-            try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 3:
-                    # URL might be in an anchor tag
-                    url = ""
-                    try:
-                        link = cells[2].find_element(By.TAG_NAME, "a")
-                        url = link.get_attribute("href")
-                    except:
-                        url = clean_text(cells[2].text)
-
-                    web_entry = {
-                        "Name": clean_text(cells[0].text),
-                        "Type": clean_text(cells[1].text),
-                        "URL": url
-                    }
-                    web_presence_list.append(web_entry)
-            except Exception:
-                continue
+# ==========================================
+# HTTP FETCHER
+# ==========================================
+def browser_identity(driver):
+    """The browser's login cookies (name -> value) and User-Agent string."""
+    cookies = {c["name"]: c["value"] for c in driver.get_cookies()}
+    user_agent = driver.execute_script("return navigator.userAgent;")
+    return cookies, user_agent
+
+
+class HttpFetcher:
+    """Fetch detail pages over HTTP using the browser's login cookies."""
+
+    def __init__(self, driver):
+        cookies, user_agent = browser_identity(driver)
+        self.loop = asyncio.new_event_loop()
+        self.session = self.loop.run_until_complete(self._open(cookies, user_agent))
+
+    async def _open(self, cookies, user_agent):
+        """Create the pooled client session inside the event loop."""
+        # Keep connections (and the DNS answer) alive across batches so each
+        # page reuses an open TLS connection instead of a fresh handshake
+        connector = aiohttp.TCPConnector(limit=HTTP_CONCURRENCY, keepalive_timeout=60, ttl_dns_cache=600)
+        return aiohttp.ClientSession(
+            cookies=cookies,
+            headers={"User-Agent": user_agent},
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        )
 
-    except NoSuchElementException:
-        pass
-    except Exception as e:
-        print(f"      [Warning] Web Presence extraction error: {e}")
+    async def _fetch(self, url):
+        """Return the page HTML, or None on any failure."""
+        try:
+            async with self.session.get(url) as response:
+                if response.status != 200:
+                    return None
+                body = await response.read()
+                # Decode with the declared charset; text() would sniff the
+                # encoding of the whole body when the header omits it
+                return body.decode(response.charset or "utf-8", errors="replace")
+        except Exception:
+            return None
 
-    return web_presence_list
+    def fetch_many(self, urls):
+        """Fetch several pages concurrently; results match the input order."""
+        return self.loop.run_until_complete(
+            asyncio.gather(*(self._fetch(url) for url in urls))
+        )
 
+    def close(self):
+        """Close the session and its event loop."""
+        try:
+            self.loop.run_until_complete(self.session.close())
+        finally:
+            self.loop.close()
+
+
+class RequestsFetcher:
+    """Same interface as HttpFetcher, built on requests and a thread pool."""
+
+    def __init__(self, driver):
+        cookies, user_agent = browser_identity(driver)
+        self.session = requests.Session()
+        # The default pool keeps only 10 connections per host, so with more
+        # threads than that connections get dropped and re-handshaken
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_CONCURRENCY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.cookies.update(cookies)
+        self.session.headers.update({"User-Agent": user_agent})
+        self.executor = ThreadPoolExecutor(max_workers=HTTP_CONCURRENCY)
+
+    def _fetch(self, url):
+        """Return the page HTML, or None on any failure."""
+        try:
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
+            if response.status_code != 200:
+                return None
+            return response.content.decode(response.encoding or "utf-8", errors="replace")
+        except Exception:
+            return None
 
-def extract_ocip_activity(driver):
-    """Extract data from OCIP Activity section (table/grid)."""
-    activity_list = []
+    def fetch_many(self, urls):
+        """Fetch several pages concurrently; results match the input order."""
+        return list(self.executor.map(self._fetch, urls))
 
-    try:
-        panel = driver.find_element(By.ID, "ProfileBar-9")
+    def close(self):
+        """Stop the threads and close the session."""
+        self.executor.shutdown(wait=True)
+        self.session.close()
 
-        # Check for "No records found"
-        try:
-            no_data = panel.find_element(By.CSS_SELECTOR, "tr.k-no-data, div.k-grid-norecords-template")
-            if no_data:
-                return []
-        except NoSuchElementException:
-            pass
 
-        # Note: This panel also uses id="webGrid" (duplicate ID in HTML)
-        # We need to find it within the panel context
-        rows = panel.find_elements(By.CSS_SELECTOR, "tbody tr.k-master-row")
+def make_fetcher(driver):
+    """Best available HTTP fetcher for this environment, or None."""
+    if AIOHTTP_AVAILABLE:
+        return HttpFetcher(driver)
+    if REQUESTS_AVAILABLE:
+        return RequestsFetcher(driver)
+    return None
+
 
-        for row in rows:
+# ==========================================
+# BROWSER POOL
+# ==========================================
+class BrowserPool:
+    """Several logged-in browsers loading detail pages in parallel threads."""
+
+    def __init__(self, driver, size):
+        cookies = driver.get_cookies()
+        self.executor = ThreadPoolExecutor(max_workers=size)
+        self.extra = list(self.executor.map(lambda _: self._start(cookies), range(size - 1)))
+        self.idle = queue.Queue()
+        for d in [driver] + self.extra:
+            self.idle.put(d)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    @staticmethod
+    def _start(cookies):
+        """Start one extra browser and log it in with the shared cookies."""
+        d = get_driver(headless=HEADLESS, block_images=BLOCK_RESOURCES)
+        if BLOCK_RESOURCES:
+            block_resources(d)
+        # Cookies can only be set for the domain currently loaded
+        d.get(LOGIN_URL)
+        for cookie in cookies:
+            cookie.pop("sameSite", None)
             try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 4:
-                    # Project name might be in a link
-                    project_name = ""
-                    project_url = ""
-                    try:
-                        link = cells[0].find_element(By.TAG_NAME, "a")
-                        project_name = clean_text(link.text)
-                        project_url = link.get_attribute("href")
-                    except:
-                        project_name = clean_text(cells[0].text)
-
-                    activity_entry = {
-                        "Project_Name": project_name,
-                        "Project_URL": project_url,
-                        "Type": clean_text(cells[1].text),
-                        "Organization": clean_text(cells[2].text),
-                        "Current_Status": clean_text(cells[3].text)
-                    }
-                    activity_list.append(activity_entry)
+                d.add_cookie(cookie)
             except Exception:
-                continue
+                pass
+        return d
+
+    def _throttle(self):
+        """Space page loads BROWSER_RATE_LIMIT apart across all threads."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / BROWSER_RATE_LIMIT
+        time.sleep(slot - now)
+
+    def _load(self, url):
+        """Load one page on whichever browser is free."""
+        d = self.idle.get()
+        try:
+            self._throttle()
+            return load_profile_html(d, WebDriverWait(d, 20, poll_frequency=0.1), url)
+        except Exception as e:
+            print(f"      [Warning] Browser load failed for {url}: {e}")
+            return None
+        finally:
+            self.idle.put(d)
 
-    except NoSuchElementException:
-        pass
-    except Exception as e:
-        print(f"      [Warning] OCIP Activity extraction error: {e}")
+    def load_many(self, urls):
+        """Load several pages concurrently; results match the input order."""
+        return list(self.executor.map(self._load, urls))
 
-    return activity_list
+    def close(self):
+        """Stop the threads and quit the extra browsers."""
+        self.executor.shutdown(wait=True)
+        for d in self.extra:
+            try:
+                d.quit()
+            except Exception:
+                pass
 
 
-def extract_audit_trail(driver):
-    """Extract data from Audit Trail section."""
-    data = {}
+# ==========================================
+# MAIN EXTRACTION FUNCTION
+# ==========================================
 
-    try:
-        panel = driver.find_element(By.ID, "ProfileBar-10")
-        rows = panel.find_elements(By.CSS_SELECTOR, "div.row")
+def load_profile_html(driver, wait, url):
+    """Load a detail page in the browser and return its rendered panel HTML."""
+    # Navigate to the detail page
+    driver.get(url)
 
-        for row in rows:
-            try:
-                labels = row.find_elements(By.TAG_NAME, "label")
-                if not labels:
-                    continue
+    # Wait for page to load (document ready, then the panel bar)
+    try:
+        wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+        wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, "ul.k-panelbar, li.k-panelbar-header")
+        ))
+    except TimeoutException:
+        print(f"      [Warning] Page load timeout for {url}")
+        return None
 
-                label = labels[0]
-                label_for = label.get_attribute("for") or ""
-                label_text = clean_text(label.text)
+    # Read the panels back in one script call
+    return harvest_profile_html(driver)
 
-                cols = row.find_elements(By.CSS_SELECTOR, "div.col-md-9")
-                if cols:
-                    value = clean_text(cols[0].text)
-                    field_key = label_for if label_for else label_text.replace(" ", "_")
-                    data[field_key] = value
 
-            except Exception:
-                continue
+def parse_profile_html(html, url):
+    """
+    Parse detail page HTML once into a static snapshot for the extractors.
+    Returns its profile_panels() map, or None if it has no profile panels.
+    """
+    try:
+        tree = lxml.html.fromstring(html, base_url=url)
+    except Exception:
+        return None
+    panels = profile_panels(tree)
+    first_panel = panels.get("ProfileBar-1")
+    if first_panel is None:
+        return None
 
-    except NoSuchElementException:
-        pass
-    except Exception as e:
-        print(f"      [Warning] Audit Trail extraction error: {e}")
+    # Resolve hrefs/srcs the way Selenium's get_attribute() did, but only
+    # inside the panel bar - the rest of the page (scripts, nav) is never read
+    panelbars = XP_PANELBAR_ANCESTOR(first_panel)
+    (panelbars[0] if panelbars else tree).make_links_absolute(url)
+    return panels
 
-    return data
 
+def prefetch_profiles(master_list, start, end, fetcher, browsers):
+    """
+    Load and parse the detail pages of master_list[start:end] ahead of time.
+    HTTP first, then the browser pool for pages that didn't parse.
+    Returns {index: panel map}; failed pages are left out.
+    """
+    batch = [(j, master_list[j].get("Manage_URL", "")) for j in range(start, end)]
+    batch = [(j, u) for j, u in batch if u and u != "Not Found"]
+
+    pages = fetcher.fetch_many([u for _, u in batch]) if fetcher else [None] * len(batch)
+
+    parsed = {}
+    retry = []
+    for (j, u), html in zip(batch, pages):
+        panels = parse_profile_html(html, u) if html else None
+        if panels is None:
+            retry.append((j, u))
+        else:
+            parsed[j] = panels
+
+    if browsers and retry:
+        for (j, u), html in zip(retry, browsers.load_many([u for _, u in retry])):
+            panels = parse_profile_html(html, u) if html else None
+            if panels is not None:
+                parsed[j] = panels
+
+    return parsed
+
+
+# Profile Meta fields copied from the Phase 1 record: (Meta key, Phase 1 key)
+META_FIELDS = (
+    ("Institution", "Institution"),
+    ("Name_From_List", "Name"),
+    ("Expert_ID", "Expert_ID"),
+    ("Profile_URL", "Profile_URL"),
+)
 
-# ==========================================
-# MAIN EXTRACTION FUNCTION
-# ==========================================
 
-def extract_expert_full_profile(driver, wait, expert_basic_info):
+def extract_expert_full_profile(driver, wait, expert_basic_info, panels=None):
     """
     Extract all information from an expert's detail page.
+    Uses prefetched page panels when given, otherwise loads the page in the browser.
     Returns a complete profile dictionary.
     """
     url = expert_basic_info.get("Manage_URL", "")
@@ -619,60 +1099,26 @@ def extract_expert_full_profile(driver, wait, expert_basic_info):
         return None
 
     try:
-        # Navigate to the detail page
-        driver.get(url)
-        time.sleep(PAGE_LOAD_WAIT)
-
-        # Wait for page to load (look for the panel bar)
-        try:
-            wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "ul.k-panelbar, li.k-panelbar-header")
-            ))
-        except TimeoutException:
-            print(f"      [Warning] Page load timeout for {url}")
-            return None
-
-        # Expand all accordion sections
-        expand_all_accordions(driver, wait)
+        if panels is None:
+            html = load_profile_html(driver, wait, url)
+            if html is None:
+                return None
+            panels = parse_profile_html(html, url)
+            if panels is None:
+                print(f"      [Warning] No profile panels found at {url}")
+                return None
 
         # Initialize profile with basic info from Phase 1
         profile = {
             "Meta": {
                 "Source_URL": url,
                 "Scraped_At": datetime.now().isoformat(),
-                "Institution": expert_basic_info.get("Institution", ""),
-                "Name_From_List": expert_basic_info.get("Name", ""),
-                "Expert_ID": expert_basic_info.get("Expert_ID", ""),
-                "Profile_URL": expert_basic_info.get("Profile_URL", "")
+                **{key: expert_basic_info.get(source, "") for key, source in META_FIELDS}
             }
         }
 
-        # Extract each section
-        profile["General_Information"] = extract_general_information(driver)
-        time.sleep(REQUEST_DELAY)
-
-        profile["Details"] = extract_details(driver)
-        time.sleep(REQUEST_DELAY)
-
-        profile["Expert_Demographics"] = extract_expert_demographics(driver)
-        time.sleep(REQUEST_DELAY)
-
-        profile["Expertise"] = extract_expertise(driver)
-        time.sleep(REQUEST_DELAY)
-
-        profile["Price_Availability"] = extract_price_availability(driver)
-        time.sleep(REQUEST_DELAY)
-
-        profile["Facility_Affiliation"] = extract_facility_affiliation(driver)
-        time.sleep(REQUEST_DELAY)
-
-        profile["Web_Presence"] = extract_web_presence(driver)
-        time.sleep(REQUEST_DELAY)
-
-        profile["OCIP_Activity"] = extract_ocip_activity(driver)
-        time.sleep(REQUEST_DELAY)
-
-        profile["Audit_Trail"] = extract_audit_trail(driver)
+        # Extract every section in one pass over the page
+        profile.update(extract_sections(panels))
 
         return profile
 
@@ -699,11 +1145,20 @@ def main():
         return
 
     # Initialize
+    global _errors_saved
+    _errors_saved = None
     driver = get_driver()
-    wait = WebDriverWait(driver, 20)
-    processed_data = []
+    wait = WebDriverWait(driver, 20, poll_frequency=0.1)
+    processed_count = 0
+    stats = None
     errors = []
     start_index = 0
+    legacy_data = []
+    fetcher = None
+    browsers = None
+    resume_bytes = None
+    prefetched = {}
+    prefetch_end = 0
 
     # Check for existing checkpoint
     checkpoint = load_checkpoint()
@@ -715,24 +1170,38 @@ def main():
 
         resume = input("\nResume from checkpoint? (y/n): ").strip().lower()
         if resume == 'y':
-            processed_data = checkpoint['data']
+            processed_count = checkpoint['experts_processed']
             start_index = checkpoint['current_index']
+            resume_bytes = checkpoint.get('data_bytes')
+            legacy_data = checkpoint.get('data', [])
+            stats = checkpoint.get('stats')
             # Load errors
             try:
-                with open(ERROR_LOG_FILE, 'r') as f:
-                    errors = json.load(f)
+                errors = read_json(ERROR_LOG_FILE)
             except:
                 errors = []
             print("✓ Resuming from checkpoint...")
 
+    # Profiles only live in the log; none are kept in memory
+    log = open_checkpoint_log(resume_bytes)
+    for profile in legacy_data:
+        append_profile(log, profile)
+    processed_count = processed_count if resume_bytes is not None else len(legacy_data)
+    del legacy_data
+    if stats is None:
+        log.flush()
+        stats = summarize_logged_profiles()
+
     try:
         # Login step
         print("\n" + "-" * 50)
         print("STEP 1: AUTHENTICATION")
         print("-" * 50)
-        driver.get("https://www.ocip.express/")
+        driver.get(LOGIN_URL)
         print("Please log in to the portal manually.")
         input("\n>>> Press ENTER here once you're logged in...")
+        if BLOCK_RESOURCES:
+            block_resources(driver)
 
         # Process each expert
         print("\n" + "-" * 50)
@@ -741,12 +1210,30 @@ def main():
 
         total = len(master_list)
 
-        for i, expert in enumerate(master_list[start_index:], start=start_index):
+        if USE_HTTP_FETCH:
+            fetcher = make_fetcher(driver)
+            if fetcher:
+                print(f"✓ HTTP fetch enabled ({HTTP_CONCURRENCY} pages per batch)")
+
+        if BROWSER_WORKERS > 1:
+            print(f"Starting {BROWSER_WORKERS - 1} extra browsers...")
+            browsers = BrowserPool(driver, BROWSER_WORKERS)
+            print(f"✓ Browser pool ready ({BROWSER_WORKERS} browsers)")
+
+        window = HTTP_CONCURRENCY if fetcher else BROWSER_WORKERS
+
+        for n, expert in enumerate(master_list[start_index:], start=start_index + 1):
+            i = n - 1
             expert_name = expert.get("Name", "Unknown")
             institution = expert.get("Institution", "Unknown")
             url = expert.get("Manage_URL", "")
 
-            print(f"\n[{i + 1}/{total}] {expert_name} ({institution})")
+            # Load the next batch of detail pages concurrently
+            if (fetcher or browsers) and i >= prefetch_end:
+                prefetch_end = min(i + window, total)
+                prefetched = prefetch_profiles(master_list, i, prefetch_end, fetcher, browsers)
+
+            print(f"\n[{n}/{total}] {expert_name} ({institution})")
 
             if not url or url == "Not Found":
                 print("      → Skipped: No valid URL")
@@ -757,17 +1244,17 @@ def main():
                 })
                 continue
 
-            # Extract full profile
-            profile = extract_expert_full_profile(driver, wait, expert)
+            # Extract full profile (main browser fallback if prefetching failed)
+            panels = prefetched.pop(i, None)
+            profile = extract_expert_full_profile(driver, wait, expert, panels=panels)
 
             if profile:
-                processed_data.append(profile)
+                processed_count += 1
+                append_profile(log, profile)
                 print(f"      ✓ Extracted successfully")
 
-                # Show summary of what was found
-                expertise_count = len(profile.get("Expertise", []))
-                facilities_count = len(profile.get("Facility_Affiliation", []))
-                has_bio = bool(profile.get("Details", {}).get("ProfileDescription", ""))
+                # Show summary of what was found (and add it to the run totals)
+                has_bio, expertise_count, facilities_count = count_profile(stats, profile)
                 print(
                     f"         Bio: {'Yes' if has_bio else 'No'} | Expertise: {expertise_count} | Facilities: {facilities_count}")
             else:
@@ -780,34 +1267,44 @@ def main():
                 print(f"      ✗ Extraction failed")
 
             # Save checkpoint periodically
-            if (i + 1) % 10 == 0:
-                save_checkpoint(processed_data, i + 1, errors)
-                print(f"\n   [Checkpoint saved: {len(processed_data)} profiles]")
+            if n % 10 == 0:
+                save_checkpoint(log, processed_count, n, errors, stats)
+                print(f"\n   [Checkpoint saved: {processed_count} profiles]")
 
             # Rate limiting: pause every BATCH_SIZE experts
-            if (i + 1) % BATCH_SIZE == 0 and i + 1 < total:
+            if n % BATCH_SIZE == 0 and n < total:
                 print(f"\n   [Rate limit pause: {BATCH_PAUSE}s...]")
                 time.sleep(BATCH_PAUSE)
 
-            # Delay between experts
-            time.sleep(BETWEEN_EXPERTS_DELAY)
+            # Delay between experts (main browser page loads only; the pool
+            # throttles itself)
+            if panels is None:
+                time.sleep(BETWEEN_EXPERTS_DELAY)
 
         # ===== FINAL SAVE =====
         print("\n" + "=" * 60)
         print("SCRAPING COMPLETE!")
         print("=" * 60)
-        print(f"Total Experts Processed: {len(processed_data)}")
+        print(f"Total Experts Processed: {processed_count}")
         print(f"Errors: {len(errors)}")
 
-        # Save final JSON
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(processed_data, f, indent=2, ensure_ascii=False)
+        # Save final JSON (streamed from the log)
+        log.flush()
+        write_output_from_log(OUTPUT_FILE)
         print(f"\n✓ Saved to {OUTPUT_FILE}")
 
+        # Save Parquet (much smaller and faster to reload than JSON)
+        if PYARROW_AVAILABLE:
+            parquet_file = os.path.splitext(OUTPUT_FILE)[0] + ".parquet"
+            try:
+                write_parquet_from_log(parquet_file)
+                print(f"✓ Saved to {parquet_file}")
+            except Exception as e:
+                print(f"✗ Parquet save failed: {e}")
+
         # Save error log
         if errors:
-            with open(ERROR_LOG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(errors, f, indent=2, ensure_ascii=False)
+            write_json(ERROR_LOG_FILE, errors)
             print(f"✓ Error log saved to {ERROR_LOG_FILE}")
 
         # Generate summary statistics
@@ -815,43 +1312,44 @@ def main():
         print("EXTRACTION SUMMARY:")
         print("-" * 50)
 
-        # Count statistics
-        total_with_bio = sum(1 for p in processed_data if p.get("Details", {}).get("ProfileDescription", ""))
-        total_with_expertise = sum(1 for p in processed_data if p.get("Expertise", []))
-        total_expertise_entries = sum(len(p.get("Expertise", [])) for p in processed_data)
-        total_with_facilities = sum(1 for p in processed_data if p.get("Facility_Affiliation", []))
-        total_with_web = sum(1 for p in processed_data if p.get("Web_Presence", []))
-        total_with_activity = sum(1 for p in processed_data if p.get("OCIP_Activity", []))
-
-        print(f"   Experts with Bio: {total_with_bio}")
-        print(f"   Experts with Expertise: {total_with_expertise} ({total_expertise_entries} total entries)")
-        print(f"   Experts with Facility Affiliation: {total_with_facilities}")
-        print(f"   Experts with Web Presence: {total_with_web}")
-        print(f"   Experts with OCIP Activity: {total_with_activity}")
-
-        # Clean up checkpoint file on success
-        if os.path.exists(CHECKPOINT_FILE) and len(errors) == 0:
-            os.remove(CHECKPOINT_FILE)
+        # Statistics (counted as each profile was extracted)
+        print(f"   Experts with Bio: {stats['with_bio']}")
+        print(f"   Experts with Expertise: {stats['with_expertise']} ({stats['expertise_entries']} total entries)")
+        print(f"   Experts with Facility Affiliation: {stats['with_facilities']}")
+        print(f"   Experts with Web Presence: {stats['with_web']}")
+        print(f"   Experts with OCIP Activity: {stats['with_activity']}")
+
+        # Clean up checkpoint files on success
+        if len(errors) == 0:
+            log.close()
+            for path in (CHECKPOINT_FILE, checkpoint_data_file()):
+                if os.path.exists(path):
+                    os.remove(path)
             print("\n✓ Checkpoint file cleaned up")
 
     except KeyboardInterrupt:
         print("\n\n⚠ Script interrupted by user")
-        save_checkpoint(processed_data, i + 1 if 'i' in dir() else start_index, errors)
-        print(f"   Progress saved. Processed {len(processed_data)} experts so far.")
+        save_checkpoint(log, processed_count, n if 'n' in dir() else start_index, errors, stats)
+        print(f"   Progress saved. Processed {processed_count} experts so far.")
 
     except Exception as e:
         print(f"\n✗ CRITICAL ERROR: {e}")
         import traceback
         traceback.print_exc()
 
-        # Emergency save
-        if processed_data:
+        # Emergency save: every extracted profile is already in the log
+        if processed_count:
             emergency_file = f"emergency_phase2_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(emergency_file, 'w', encoding='utf-8') as f:
-                json.dump(processed_data, f, indent=2)
+            log.flush()
+            write_output_from_log(emergency_file)
             print(f"   Emergency backup saved to {emergency_file}")
 
     finally:
+        log.close()
+        if fetcher:
+            fetcher.close()
+        if browsers:
+            browsers.close()
         print("\n" + "=" * 60)
         print("Script finished. Browser left open for inspection.")
         print("=" * 60)
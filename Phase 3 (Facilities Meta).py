@@ -18,7 +18,11 @@ import json
 import re
 import sys
 import os
-import pandas as pd
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import util as mp_util
+from urllib.parse import parse_qsl, urljoin
 from datetime import datetime
 
 # ── Optional colored output ─────────────────────────────────────────────────
@@ -45,6 +49,35 @@ except ImportError:
     TQDM_AVAILABLE = False
     print(yellow("[WARN] tqdm not installed. Run: pip install tqdm  (progress bars disabled)"))
 
+# ── Optional HTTP clients (direct grid data endpoint) ───────────────────────
+# aiohttp preferred, requests + threads as a fallback
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# ── Optional fast output writers ────────────────────────────────────────────
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Streams the Excel file row by row instead of building it in memory
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+    print(yellow("[WARN] xlsxwriter not installed. Run: pip install xlsxwriter  (Excel output disabled)"))
+
 # ── Selenium ─────────────────────────────────────────────────────────────────
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -53,7 +86,6 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
-    StaleElementReferenceException,
     ElementClickInterceptedException,
 )
 
@@ -65,12 +97,17 @@ TARGET_URL       = "https://www.ocip.express/FacilityAdmin/Index"
 OUTPUT_JSON      = "facilities_master_list.json"
 OUTPUT_EXCEL     = "facilities_master_list.xlsx"
 CHECKPOINT_FILE  = "phase3_checkpoint.json"
+COOKIES_FILE     = "ocip_cookies.json"   # login session, reused by later runs
+
+# Facility rows are appended to a JSONL file next to CHECKPOINT_FILE as each
+# institution finishes; the index is saved (and the log synced) every N
+# institutions, at the end, and on interrupt/error
+CHECKPOINT_EVERY = 10
 
 # ── Timing (seconds) ──────────────────────────────────────────────────────────
-PAGE_LOAD_WAIT          = 1.5   # after selecting institution, base wait
-PAGINATION_WAIT         = 2.0   # after clicking next page
-DROPDOWN_CLOSE_WAIT     = 0.7
-LOADING_MASK_TIMEOUT    = 15    # how long to wait for k-loading-mask to vanish
+PAGE_LOAD_WAIT          = 1.5   # max wait for an empty grid to refresh (nothing to compare against)
+DROPDOWN_CLOSE_TIMEOUT  = 2     # max wait for the institution list to close
+LOADING_MASK_TIMEOUT    = 15    # how long to wait for k-loading-mask to vanish / the grid to reload
 
 # ── Empty-page detection ──────────────────────────────────────────────────────
 # If 0 rows found immediately, we wait EMPTY_RETRY_WAIT seconds and try again,
@@ -79,15 +116,53 @@ EMPTY_RETRY_WAIT   = 0.5   # seconds to wait between retries
 EMPTY_MAX_RETRIES  = 3     # total extra attempts
 
 # ── Row stabilisation ─────────────────────────────────────────────────────────
-# After navigating to a page we poll until the row count stops changing.
-ROW_STABLE_POLLS      = 2      # how many consecutive same-count reads before "stable"
-ROW_STABLE_INTERVAL   = 1.0    # seconds between polls
+# After navigating to a page we wait (in the browser) until rows are present
+# and the grid has stopped changing for ROW_STABLE_QUIET seconds.
+ROW_STABLE_QUIET      = 0.3    # seconds without grid mutations before "stable"
 ROW_STABLE_TIMEOUT    = 3     # give up after this many seconds total
 
+# ── Grid page size ────────────────────────────────────────────────────────────
+# Rows per grid page requested through the Kendo API. Institutions with more
+# facilities than this fall back to clicking through the pager.
+GRID_PAGE_SIZE = 1000
+
+# ── Grid data endpoint ────────────────────────────────────────────────────────
+# Read each institution's rows straight from the JSON endpoint behind the Kendo
+# grid (found by watching the grid's first load), using the browser's login
+# cookies. Institutions whose request fails fall back to the browser.
+USE_GRID_API    = True
+API_PAGE_SIZE   = 10000   # rows requested per institution
+API_TIMEOUT     = 30      # seconds per request
+API_CONCURRENCY = 10      # institutions requested at once
+
+# ── Parallel scraping ─────────────────────────────────────────────────────────
+# Institutions are split across this many browsers (each its own process,
+# logged in with the main browser's cookies). 1 = scrape in the main browser.
+WORKER_COUNT = 4
+HEADLESS     = os.environ.get("HEADLESS", "1") != "0"   # worker browsers run headless
+# HEADLESS=1 also hides the main browser when saved cookies exist (it's
+# reopened visibly if they have expired and a manual login is needed)
+HEADLESS_MAIN = os.environ.get("HEADLESS") == "1"
+
+# ── Page weight ───────────────────────────────────────────────────────────────
+# Scraping only needs the DOM, so images and web fonts aren't downloaded.
+# Stylesheets stay on: the dropdown/pager waits check element visibility.
+# The main browser loads everything until you have logged in.
+BLOCK_RESOURCES      = True
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.webp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+
+# ── Progress bars ─────────────────────────────────────────────────────────────
+# Redraw at most once a second (and at least every 5 s) so bars stay cheap on
+# slow terminals and in captured logs
+BAR_OPTIONS = {"mininterval": 1.0, "maxinterval": 5.0}
+
 # ==========================================
 # DRIVER SETUP
 # ==========================================
-def get_driver():
+def get_driver(headless=False, block_images=False):
     """Initialize Chrome WebDriver with optimal settings."""
     options = webdriver.ChromeOptions()
     options.add_argument("--start-maximized")
@@ -95,70 +170,211 @@ def get_driver():
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
     options.add_experimental_option("detach", True)
+    # driver.get() returns at DOMContentLoaded; the grid waits do the rest
+    options.page_load_strategy = "eager"
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
+    if block_images:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     driver = webdriver.Chrome(options=options)
     driver.execute_script(
         "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
     )
     return driver
 
+
+def load_cookies():
+    """Cookies saved by an earlier login, or None."""
+    try:
+        with open(COOKIES_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def save_cookies(driver):
+    with open(COOKIES_FILE, 'w', encoding='utf-8') as f:
+        json.dump(driver.get_cookies(), f)
+
+
+def add_cookies(driver, cookies):
+    """Set cookies on the domain currently loaded in the browser."""
+    for cookie in cookies:
+        cookie.pop("sameSite", None)
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            pass
+
+
+def is_logged_in(driver, timeout=10):
+    """True once the facilities page shows its institution dropdown."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, "span[aria-controls$='listbox']")
+        ))
+        return True
+    except TimeoutException:
+        return False
+
+
+def login(driver, manual=True):
+    """
+    Log in with the saved cookies, or ask for a manual login and save them.
+    Returns False if the cookies failed and manual login isn't allowed.
+    """
+    # Cookies can only be set for the domain currently loaded
+    driver.get(LOGIN_URL)
+    cookies = load_cookies()
+    if cookies:
+        add_cookies(driver, cookies)
+        driver.get(TARGET_URL)
+        if is_logged_in(driver):
+            print(green(f"  ✓ Logged in with saved cookies ({COOKIES_FILE})"))
+            return True
+        print(yellow("  ⚠ Saved cookies no longer work — please log in again"))
+        if not manual:
+            return False
+        driver.get(LOGIN_URL)
+
+    print(bold("\nSTEP 1: Please log in to the portal."))
+    input("  >>> Press ENTER when fully logged in… ")
+    save_cookies(driver)
+    return True
+
+
+def block_resources(driver):
+    """Stop the browser requesting BLOCKED_URL_PATTERNS (via DevTools)."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(yellow(f"  ⚠ Could not block page resources: {e}"))
+
 # ==========================================
 # UTILITY: Loading / Waiting
 # ==========================================
+# Resolves (true) as soon as no .k-loading-mask is visible, watching the DOM
+# in the page instead of polling it over WebDriver; false on timeout.
+WAIT_FOR_MASK_JS = """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0];
+var finished = false;
+var observer;
+function masked() {
+    return Array.from(document.querySelectorAll('.k-loading-mask')).some(function (m) {
+        return m.offsetParent !== null || m.getClientRects().length > 0;
+    });
+}
+function finish(ok) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    done(ok);
+}
+if (!masked()) { finish(true); return; }
+observer = new MutationObserver(function () { if (!masked()) { finish(true); } });
+observer.observe(document.body, {childList: true, subtree: true, attributes: true, attributeFilter: ['style', 'class']});
+setTimeout(function () { finish(false); }, timeoutMs);
+"""
+
+
 def wait_for_loading_complete(driver, timeout=LOADING_MASK_TIMEOUT):
-    """Wait for Kendo loading masks to vanish."""
+    """Wait for Kendo loading masks to vanish (returns at once if none is showing)."""
     try:
-        time.sleep(0.4)
-        WebDriverWait(driver, timeout).until(
-            EC.invisibility_of_element_located((By.CSS_SELECTOR, ".k-loading-mask"))
-        )
-        time.sleep(0.3)
+        driver.set_script_timeout(timeout + 5)
+        driver.execute_async_script(WAIT_FOR_MASK_JS, int(timeout * 1000))
     except Exception:
         pass
 
 
-def wait_for_rows_stable(driver, timeout=ROW_STABLE_TIMEOUT):
-    """
-    Poll the row count until it stops changing for ROW_STABLE_POLLS consecutive
-    reads, or timeout expires.  Returns the stable list of rows.
-    """
-    deadline  = time.time() + timeout
-    last_count = -1
-    streak     = 0
+# Kendo gives every row a fresh data-uid each time the grid rebinds, so the
+# first row's uid plus the pager label identify what the grid is showing
+GRID_STATE_JS = """
+var row = document.querySelector('tr.k-master-row');
+var pager = document.querySelector('span.k-pager-info.k-label');
+return [row ? row.getAttribute('data-uid') : null, pager ? pager.innerText : ''];
+"""
 
-    while time.time() < deadline:
-        try:
-            rows = driver.find_elements(By.CSS_SELECTOR, "tr.k-master-row")
-        except Exception:
-            rows = []
-        count = len(rows)
 
-        if count == last_count and count > 0:
-            streak += 1
-            if streak >= ROW_STABLE_POLLS:
-                return rows          # stable non-empty result
-        else:
-            streak = 0
-            last_count = count
+def grid_state(driver):
+    """Capture the grid state before an action that reloads it."""
+    try:
+        return tuple(driver.execute_script(GRID_STATE_JS))
+    except Exception:
+        return (None, "")
 
-        time.sleep(ROW_STABLE_INTERVAL)
 
-    # Return whatever we have
+def wait_for_grid_update(driver, before):
+    """
+    Wait until the grid shows something other than `before` (from grid_state),
+    then for any loading mask to clear. Replaces fixed post-click sleeps.
+    """
+    # An empty grid that stays empty never changes, so don't wait long for it
+    timeout = LOADING_MASK_TIMEOUT if before[0] is not None else PAGE_LOAD_WAIT
     try:
-        return driver.find_elements(By.CSS_SELECTOR, "tr.k-master-row")
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: grid_state(d) != before
+        )
+    except TimeoutException:
+        pass
+    wait_for_loading_complete(driver)
+
+
+# Resolves with the row count once rows exist and the grid has seen no DOM
+# mutations for quietMs, or with whatever count there is at timeoutMs.
+ROWS_STABLE_JS = """
+var done = arguments[arguments.length - 1];
+var quietMs = arguments[0], timeoutMs = arguments[1];
+var target = document.querySelector('.k-grid') || document.body;
+var finished = false, quiet = null;
+function count() { return document.querySelectorAll('tr.k-master-row').length; }
+function finish() {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(quiet);
+    done(count());
+}
+function settle() {
+    clearTimeout(quiet);
+    quiet = setTimeout(function () { if (count() > 0) { finish(); } }, quietMs);
+}
+var observer = new MutationObserver(settle);
+observer.observe(target, {childList: true, subtree: true});
+settle();
+setTimeout(finish, timeoutMs);
+"""
+
+
+def wait_for_rows_stable(driver, timeout=ROW_STABLE_TIMEOUT):
+    """
+    Wait until the grid has rows and has stopped changing for ROW_STABLE_QUIET
+    seconds, or timeout expires.  Returns the row count.
+    """
+    try:
+        driver.set_script_timeout(timeout + 5)
+        return driver.execute_async_script(
+            ROWS_STABLE_JS, int(ROW_STABLE_QUIET * 1000), int(timeout * 1000)
+        )
     except Exception:
-        return []
+        return 0
 
 
 def wait_for_rows_with_retry(driver, institution_name):
     """
     Try to get rows.  If none found, wait EMPTY_RETRY_WAIT and retry up to
     EMPTY_MAX_RETRIES times before concluding the institution is truly empty.
-    Returns (rows, declared_empty: bool)
+    Returns (row_count, declared_empty: bool)
     """
     # First attempt: wait for stability
-    rows = wait_for_rows_stable(driver)
-    if rows:
-        return rows, False
+    row_count = wait_for_rows_stable(driver)
+    if row_count:
+        return row_count, False
 
     # Extended retry loop for slow-loading pages
     for attempt in range(1, EMPTY_MAX_RETRIES + 1):
@@ -167,10 +383,10 @@ def wait_for_rows_with_retry(driver, institution_name):
         time.sleep(EMPTY_RETRY_WAIT)
         wait_for_loading_complete(driver)
 
-        rows = wait_for_rows_stable(driver)
-        if rows:
+        row_count = wait_for_rows_stable(driver)
+        if row_count:
             print(green(f"         ✓ Rows appeared after {attempt} extra wait(s)"))
-            return rows, False
+            return row_count, False
 
         # Also check pagination info — data might be present but rows styled differently
         start, end, total = parse_pagination_info(driver)
@@ -179,26 +395,78 @@ def wait_for_rows_with_retry(driver, institution_name):
             print(yellow(f"         ℹ Pagination says {total} items — waiting extra…"))
             time.sleep(EMPTY_RETRY_WAIT * 2)
             wait_for_loading_complete(driver)
-            rows = wait_for_rows_stable(driver)
-            if rows:
-                return rows, False
+            row_count = wait_for_rows_stable(driver)
+            if row_count:
+                return row_count, False
 
-    return [], True  # genuinely empty after all retries
+    return 0, True  # genuinely empty after all retries
 
 # ==========================================
 # UTILITY: Pagination
 # ==========================================
+# "1 - 50 of 120 items"
+_PAGER_RE = re.compile(r'(\d+)\s*-\s*(\d+)\s+of\s+(\d+)\s+items?')
+
+PAGER_INFO_JS = "var el = document.querySelector('span.k-pager-info.k-label'); return el ? el.innerText : null;"
+
+
+def parse_pager_text(text):
+    """Return (start, end, total) from a pager label, e.g. '1 - 50 of 120 items'."""
+    m = _PAGER_RE.match((text or "").strip())
+    if m:
+        return int(m.group(1)), int(m.group(2)), int(m.group(3))
+    return 0, 0, 0
+
+
 def parse_pagination_info(driver):
-    """Return (start, end, total) from pager label, e.g. '1 - 50 of 120 items'."""
+    """Return (start, end, total) from the pager label, read in one script call."""
     try:
-        pager = driver.find_element(By.CSS_SELECTOR, "span.k-pager-info.k-label")
-        text  = pager.text.strip()
-        m = re.match(r'(\d+)\s*-\s*(\d+)\s+of\s+(\d+)\s+items?', text)
-        if m:
-            return int(m.group(1)), int(m.group(2)), int(m.group(3))
+        return parse_pager_text(driver.execute_script(PAGER_INFO_JS))
     except Exception:
-        pass
-    return 0, 0, 0
+        return 0, 0, 0
+
+
+# Sets the Kendo grid's page size; returns "set", "kept" (already on page 1 and
+# everything fits) or null (no grid API)
+SET_PAGE_SIZE_JS = """
+var el = document.querySelector('.k-grid');
+var grid = (el && window.jQuery) ? window.jQuery(el).data('kendoGrid') : null;
+if (!grid) { return null; }
+var ds = grid.dataSource;
+if (ds.page() === 1 && (ds.pageSize() >= arguments[0] || ds.total() <= ds.pageSize())) { return 'kept'; }
+ds.pageSize(arguments[0]);  // also resets to page 1 and reloads
+return 'set';
+"""
+
+
+def expand_page_size(driver, page_size=GRID_PAGE_SIZE):
+    """
+    Ask the grid for `page_size` rows per page so most institutions fit on one
+    page. Returns True if the grid API was available.
+    """
+    try:
+        before = grid_state(driver)
+        result = driver.execute_script(SET_PAGE_SIZE_JS, page_size)
+    except Exception as e:
+        print(yellow(f"         ⚠ Could not set grid page size: {e}"))
+        return False
+
+    if result == "set":
+        wait_for_grid_update(driver, before)
+    return result is not None
+
+
+# Moves the Kendo grid to its next page through the dataSource; returns true,
+# false (already on the last page) or null (no grid API)
+NEXT_PAGE_JS = """
+var el = document.querySelector('.k-grid');
+var grid = (el && window.jQuery) ? window.jQuery(el).data('kendoGrid') : null;
+if (!grid) { return null; }
+var ds = grid.dataSource;
+if (ds.page() >= ds.totalPages()) { return false; }
+ds.page(ds.page() + 1);
+return true;
+"""
 
 
 def has_next_page(driver):
@@ -212,28 +480,35 @@ def has_next_page(driver):
 
 
 def click_next_page(driver, wait):
+    """
+    Go to the next grid page, through the grid API when it is available and
+    by clicking the pager button otherwise. Returns False on the last page.
+    """
     try:
+        before = grid_state(driver)
+        moved = driver.execute_script(NEXT_PAGE_JS)
+        if moved is not None:
+            if moved:
+                wait_for_grid_update(driver, before)
+            return moved
+
         btn = wait.until(EC.element_to_be_clickable(
             (By.CSS_SELECTOR, "a.k-pager-nav[aria-label='Go to the next page']")
         ))
         if btn.get_attribute("aria-disabled") == "true":
             return False
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
-        time.sleep(0.3)
-        try:
-            btn.click()
-        except Exception:
-            driver.execute_script("arguments[0].click();", btn)
-        wait_for_loading_complete(driver)
-        time.sleep(PAGINATION_WAIT)
+        driver.execute_script("arguments[0].click();", btn)
+        wait_for_grid_update(driver, before)
         return True
     except Exception:
         return False
 
 
-def reset_to_first_page(driver, wait):
+def reset_to_first_page(driver, wait, start=None):
+    """Go back to page 1 (start: the current page's first row number, if known)."""
     try:
-        start, _, _ = parse_pagination_info(driver)
+        if start is None:
+            start, _, _ = parse_pagination_info(driver)
         if start <= 1:
             return True
         btn = wait.until(EC.element_to_be_clickable(
@@ -242,9 +517,9 @@ def reset_to_first_page(driver, wait):
         ))
         if btn.get_attribute("aria-disabled") == "true":
             return True
+        before = grid_state(driver)
         driver.execute_script("arguments[0].click();", btn)
-        wait_for_loading_complete(driver)
-        time.sleep(PAGINATION_WAIT)
+        wait_for_grid_update(driver, before)
         return True
     except Exception:
         return False
@@ -252,35 +527,153 @@ def reset_to_first_page(driver, wait):
 # ==========================================
 # CHECKPOINT
 # ==========================================
-def save_checkpoint(data, current_index, institution_names, empty_institutions):
+def checkpoint_data_file():
+    """Path of the append-only facility log that goes with CHECKPOINT_FILE."""
+    return os.path.splitext(CHECKPOINT_FILE)[0] + ".jsonl"
+
+
+def open_checkpoint_log(resume_bytes=None):
+    """
+    Open the facility log for appending.
+    When resuming, anything written after the last saved checkpoint is cut off.
+    """
+    if resume_bytes is None:
+        # Fresh start: the old index would not describe the new log
+        try:
+            os.remove(CHECKPOINT_FILE)
+        except FileNotFoundError:
+            pass
+        return open(checkpoint_data_file(), 'wb')
+    log = open(checkpoint_data_file(), 'r+b')
+    log.truncate(resume_bytes)
+    log.seek(0, os.SEEK_END)
+    return log
+
+
+def append_checkpoint(log, records):
+    """Append one JSON line per facility record to the log."""
+    log.write(b"".join(
+        json.dumps(r, ensure_ascii=False).encode('utf-8') + b"\n" for r in records
+    ))
+
+
+def rewrite_checkpoint_log(log, records):
+    """Replace the log's contents (after records were dropped from the list)."""
+    log.seek(0)
+    log.truncate()
+    append_checkpoint(log, records)
+
+
+def save_checkpoint(log, facilities_collected, current_index, institution_names, empty_institutions):
+    """
+    Save progress. Facility rows are already in the log; only the small index
+    file is rewritten (to a temp file, then swapped in).
+    """
+    log.flush()
+    os.fsync(log.fileno())
+
     checkpoint = {
         "timestamp":            datetime.now().isoformat(),
         "current_index":        current_index,
         "total_institutions":   len(institution_names),
-        "facilities_collected": len(data),
+        "facilities_collected": facilities_collected,
         "institution_names":    institution_names,
         "empty_institutions":   empty_institutions,   # list of {index, name}
-        "data":                 data,
+        "data_bytes":           log.tell(),
     }
-    with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
+    tmp = CHECKPOINT_FILE + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
         json.dump(checkpoint, f, indent=2)
+    os.replace(tmp, CHECKPOINT_FILE)
 
 
 def load_checkpoint():
     try:
         with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            checkpoint = json.load(f)
     except Exception:
         return None
 
+    # Older checkpoints carry the rows inline
+    if "data" in checkpoint:
+        return checkpoint
+
+    try:
+        with open(checkpoint_data_file(), 'rb') as f:
+            raw = f.read(checkpoint["data_bytes"])
+    except (OSError, KeyError):
+        return None
+    if len(raw) < checkpoint["data_bytes"]:
+        return None
+
+    checkpoint["data"] = [json.loads(line) for line in raw.splitlines() if line]
+    return checkpoint
+
 # ==========================================
 # MODULE 1: Get Institution Names
 # ==========================================
+# Closes any open dropdown list: through the Kendo widget when jQuery is
+# loaded, otherwise by blurring it and sending Escape.
+CLOSE_DROPDOWN_JS = """
+var open = document.querySelectorAll("ul[id$='listbox'][aria-hidden='false']");
+open.forEach(function (list) {
+    var id = list.id.replace(/_listbox$/, '');
+    var widget = window.jQuery && jQuery('#' + id).data('kendoDropDownList');
+    if (widget) { widget.close(); }
+});
+var active = document.activeElement;
+if (active && active !== document.body) {
+    active.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', keyCode: 27, bubbles: true}));
+    active.blur();
+}
+document.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', keyCode: 27, bubbles: true}));
+"""
+
+
+def close_dropdown(driver):
+    """Close the institution list and wait until it is hidden again."""
+    try:
+        driver.execute_script(CLOSE_DROPDOWN_JS)
+        WebDriverWait(driver, DROPDOWN_CLOSE_TIMEOUT, poll_frequency=0.1).until_not(
+            lambda d: d.find_elements(By.CSS_SELECTOR, "ul[id$='listbox'][aria-hidden='false']")
+        )
+    except Exception:
+        pass
+
+
+# Institution names straight from the dropdown's dataSource, which holds every
+# option even when the list only renders the visible ones. null when the
+# widget can't be reached or hasn't loaded its data.
+INSTITUTION_NAMES_JS = """
+var el = window.jQuery ? window.jQuery("[data-role='dropdownlist']").first() : null;
+var dd = el ? el.data('kendoDropDownList') : null;
+if (!dd) { return null; }
+var textField = dd.options.dataTextField;
+var items = dd.dataSource.data();
+if (!items.length) { return null; }
+return Array.from(items)
+    .map(function (item) { return String(textField ? item[textField] : item).trim(); })
+    .filter(function (text) { return text && text.indexOf('Select HEI') === -1; });
+"""
+
+# Fallback: the option texts currently rendered in the open list
+LISTBOX_NAMES_JS = """
+return Array.from(document.querySelectorAll("ul[id$='listbox'][aria-hidden='false'] li"))
+    .map(function (li) { return li.innerText.trim(); })
+    .filter(function (text) { return text && text.indexOf('Select HEI') === -1; });
+"""
+
+
 def get_institution_names(driver, wait):
     print("\n" + "=" * 55)
     print(bold("  GATHERING INSTITUTION LIST"))
     print("=" * 55)
     try:
+        names = driver.execute_script(INSTITUTION_NAMES_JS)
+        if names is not None:
+            print(green(f"  ✓ Found {len(names)} institutions"))
+            return names
+
         trigger = wait.until(EC.element_to_be_clickable(
             (By.CSS_SELECTOR, "span[aria-controls$='listbox']")
         ))
@@ -289,18 +682,11 @@ def get_institution_names(driver, wait):
         listbox = wait.until(EC.visibility_of_element_located(
             (By.CSS_SELECTOR, "ul[id$='listbox'][aria-hidden='false']")
         ))
-        time.sleep(0.6)
-
-        options = listbox.find_elements(By.TAG_NAME, "li")
-        names = []
-        for opt in options:
-            text = opt.text.strip()
-            if text and "Select HEI" not in text:
-                names.append(text)
+        wait.until(lambda d: listbox.find_elements(By.TAG_NAME, "li"))
+        names = driver.execute_script(LISTBOX_NAMES_JS)
 
         print(green(f"  ✓ Found {len(names)} institutions"))
-        driver.find_element(By.TAG_NAME, "body").click()
-        time.sleep(DROPDOWN_CLOSE_WAIT)
+        close_dropdown(driver)
         return names
 
     except Exception as e:
@@ -310,7 +696,43 @@ def get_institution_names(driver, wait):
 # ==========================================
 # MODULE 2: Select Institution
 # ==========================================
+# Selects the first institution whose text contains arguments[0] through the
+# Kendo DropDownList widget and fires its change event (which reloads the
+# grid). Returns true/false, or null when the widget can't be reached.
+SELECT_INSTITUTION_JS = """
+var target = arguments[0];
+var el = window.jQuery ? window.jQuery("[data-role='dropdownlist']").first() : null;
+var dd = el ? el.data('kendoDropDownList') : null;
+if (!dd) { return null; }
+var textField = dd.options.dataTextField;
+var items = dd.dataSource.data();
+for (var i = 0; i < items.length; i++) {
+    var text = textField ? items[i][textField] : items[i];
+    if (String(text).indexOf(target) !== -1) {
+        dd.select(function (item) { return item === items[i]; });
+        dd.trigger('change');
+        return true;
+    }
+}
+return false;
+"""
+
+
 def select_institution(driver, wait, target_name):
+    try:
+        before = grid_state(driver)
+        selected = driver.execute_script(SELECT_INSTITUTION_JS, target_name)
+    except Exception:
+        selected = None
+    if selected is None:
+        return _select_from_list(driver, wait, target_name)
+    if selected:
+        wait_for_grid_update(driver, before)
+    return selected
+
+
+def _select_from_list(driver, wait, target_name):
+    """Fallback: open the dropdown and click the matching option."""
     try:
         trigger = wait.until(EC.element_to_be_clickable(
             (By.CSS_SELECTOR, "span[aria-controls$='listbox']")
@@ -320,96 +742,79 @@ def select_institution(driver, wait, target_name):
         listbox = wait.until(EC.visibility_of_element_located(
             (By.CSS_SELECTOR, "ul[id$='listbox'][aria-hidden='false']")
         ))
-        time.sleep(0.4)
+        options = wait.until(lambda d: listbox.find_elements(By.TAG_NAME, "li"))
 
-        for opt in listbox.find_elements(By.TAG_NAME, "li"):
+        for opt in options:
             if target_name in opt.text:
+                before = grid_state(driver)
                 driver.execute_script("arguments[0].click();", opt)
-                wait_for_loading_complete(driver)
-                time.sleep(PAGE_LOAD_WAIT)
+                wait_for_grid_update(driver, before)
                 return True
 
-        driver.find_element(By.TAG_NAME, "body").click()
+        close_dropdown(driver)
         return False
 
     except Exception:
-        try:
-            driver.find_element(By.TAG_NAME, "body").click()
-        except Exception:
-            pass
+        close_dropdown(driver)
         return False
 
 # ==========================================
 # MODULE 3: Scrape One Page of Rows
 # ==========================================
-def scrape_rows(rows, institution_name):
+# Reads the whole page state in one round-trip:
+#   rows  - [branch, name, type, manage href or null] per tr.k-master-row
+#           (null for rows without cells)
+#   pager - pager label text, next - whether the next-page button is enabled
+# Manage link: first <a> in the last cell, else any link whose href or
+# title/text mentions Manage / Details / Edit / View.
+SCRAPE_ROWS_JS = """
+var keywords = /Manage|Details|Edit|View/;
+var pager = document.querySelector('span.k-pager-info.k-label');
+var next = document.querySelector("a.k-pager-nav[aria-label='Go to the next page']");
+var rows = Array.from(document.querySelectorAll('tr.k-master-row')).map(function (row) {
+    var cells = row.querySelectorAll('td');
+    if (!cells.length) { return null; }
+    var text = function (i) { return cells[i] ? cells[i].innerText.trim() : ''; };
+    var link = cells[cells.length - 1].querySelector('a[href]') ||
+        Array.from(row.querySelectorAll('td a[href]')).find(function (a) {
+            return keywords.test(a.href + ' ' + (a.title || '') + ' ' + a.textContent);
+        });
+    return [text(0), text(1), text(2), link ? link.href : null];
+});
+return {
+    rows: rows,
+    pager: pager ? pager.innerText : null,
+    next: !!next && next.getAttribute('aria-disabled') !== 'true'
+};
+"""
+
+
+def scrape_rows(driver, institution_name):
     """
-    Extract data from a stable list of tr.k-master-row elements.
+    Extract data from the tr.k-master-row elements on the current page.
     Looks at the screenshot: columns are
       0: Branch/HEI abbrev  1: Facility Name  2: Facility Type
       3: Experts?  4: Equipment?  5: Enabled  6: Actions (Manage link)
-    Adjust indices if the live page differs.
+    Adjust indices (in SCRAPE_ROWS_JS) if the live page differs.
+    Returns (records, (start, end, total), has_next).
     """
-    page_data = []
-
-    for row in rows:
-        try:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if not cells:
-                continue
-
-            def cell_text(idx):
-                try:
-                    return cells[idx].text.strip()
-                except Exception:
-                    return ""
-
-            branch        = cell_text(0)
-            facility_name = cell_text(1)
-            facility_type = cell_text(2)
-
-            # --- Manage / Actions link ---
-            manage_url = "Not Found"
-
-            # Strategy 1: last cell contains the link
-            try:
-                link = cells[-1].find_element(By.TAG_NAME, "a")
-                manage_url = link.get_attribute("href") or "Not Found"
-            except Exception:
-                pass
+    try:
+        result = driver.execute_script(SCRAPE_ROWS_JS)
+    except Exception as e:
+        print(yellow(f"         ⚠ Row extraction failed: {e}"))
+        return [], parse_pagination_info(driver), has_next_page(driver)
 
-            # Strategy 2: scan all cells for href containing 'Manage' or 'Details'
-            if manage_url == "Not Found":
-                try:
-                    for cell in cells:
-                        links = cell.find_elements(By.TAG_NAME, "a")
-                        for lnk in links:
-                            href = lnk.get_attribute("href") or ""
-                            title = lnk.get_attribute("title") or lnk.text or ""
-                            if any(kw in href or kw in title
-                                   for kw in ["Manage", "Details", "Edit", "View"]):
-                                manage_url = href
-                                break
-                        if manage_url != "Not Found":
-                            break
-                except Exception:
-                    pass
-
-            page_data.append({
-                "Institution":   institution_name,
-                "Branch":        branch,
-                "Facility_Name": facility_name,
-                "Facility_Type": facility_type,
-                "Manage_URL":    manage_url,
-                "Scraped_At":    datetime.now().isoformat(),
-            })
-
-        except StaleElementReferenceException:
-            continue
-        except Exception:
-            continue
+    scraped_at = datetime.now().isoformat()
+    page_data = [{
+        "Institution":   institution_name,
+        "Branch":        branch,
+        "Facility_Name": facility_name,
+        "Facility_Type": facility_type,
+        "Manage_URL":    manage_url or "Not Found",
+        "Scraped_At":    scraped_at,
+    } for branch, facility_name, facility_type, manage_url in filter(None, result["rows"])]
 
-    return page_data
+    return page_data, parse_pager_text(result["pager"]), result["next"]
 
 # ==========================================
 # MODULE 4: Full Pagination Loop
@@ -422,8 +827,12 @@ def scrape_all_pages_for_institution(driver, wait, institution_name):
     all_facilities = []
     current_page   = 1
 
+    # Pull (nearly) everything onto one page; the pager loop below only runs
+    # for very large institutions or if the grid API is unavailable
+    expand_page_size(driver)
+
     # ── First page: use the extended retry logic ──────────────────────────────
-    rows, is_empty = wait_for_rows_with_retry(driver, institution_name)
+    row_count, is_empty = wait_for_rows_with_retry(driver, institution_name)
 
     if is_empty:
         # One final check via pagination label
@@ -432,55 +841,53 @@ def scrape_all_pages_for_institution(driver, wait, institution_name):
             return []          # Genuinely no data
         # Pagination says there IS data — wait a bit more
         print(yellow(f"         ⚠ Pagination says {total} items but no rows visible. "
-                     f"Waiting extra 10s…"))
-        time.sleep(10)
+                     f"Waiting up to 10s more…"))
         wait_for_loading_complete(driver)
-        rows = wait_for_rows_stable(driver)
-        if not rows:
+        row_count = wait_for_rows_stable(driver, timeout=10)
+        if not row_count:
             return []
 
-    _, _, total = parse_pagination_info(driver)
-    print(cyan(f"      → Detected {total if total else '?'} total facilities"))
-
-    # Progress bar for pages (estimate)
-    pages_estimate = max(1, (total // 50) + 1) if total else 999
-
     page_bar = None
-    if TQDM_AVAILABLE and total:
-        page_bar = tqdm(
-            total=total,
-            desc=f"      {institution_name[:30]}",
-            unit="row",
-            leave=False,
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} rows [{elapsed}<{remaining}]"
-        )
 
     while True:
-        page_data = scrape_rows(rows, institution_name)
+        # Rows, pager and next-button state all come from one script call
+        page_data, (start, end, total_now), next_page = scrape_rows(driver, institution_name)
         all_facilities.extend(page_data)
 
+        if current_page == 1:
+            print(cyan(f"      → Detected {total_now if total_now else '?'} total facilities"))
+            if TQDM_AVAILABLE and total_now:
+                page_bar = tqdm(
+                    total=total_now,
+                    desc=f"      {institution_name[:30]}",
+                    unit="row",
+                    leave=False,
+                    bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} rows [{elapsed}<{remaining}]",
+                    **BAR_OPTIONS
+                )
+
         if page_bar:
             page_bar.update(len(page_data))
 
-        print(f"         Page {current_page}: {green(str(len(page_data)))} records  "
-              f"(running total: {len(all_facilities)})")
+        else:
+            # Only without a bar: it already shows the same running count
+            print(f"         Page {current_page}: {green(str(len(page_data)))} records  "
+                  f"(running total: {len(all_facilities)})")
 
         # Check if we should move to next page
-        start, end, total_now = parse_pagination_info(driver)
-        if not has_next_page(driver) or (total_now > 0 and end >= total_now):
+        if not next_page or (total_now > 0 and end >= total_now):
             break
 
         if not click_next_page(driver, wait):
             break
 
         # Wait for the *new* page rows to stabilise before scraping
-        rows = wait_for_rows_stable(driver)
-        if not rows:
+        row_count = wait_for_rows_stable(driver)
+        if not row_count:
             # Try once more with extra time
-            time.sleep(EMPTY_RETRY_WAIT)
             wait_for_loading_complete(driver)
-            rows = wait_for_rows_stable(driver)
-            if not rows:
+            row_count = wait_for_rows_stable(driver, timeout=ROW_STABLE_TIMEOUT + EMPTY_RETRY_WAIT)
+            if not row_count:
                 print(yellow("         ⚠ No rows on this page after waiting — stopping pagination"))
                 break
 
@@ -492,10 +899,298 @@ def scrape_all_pages_for_institution(driver, wait, institution_name):
         page_bar.close()
 
     if current_page > 1:
-        reset_to_first_page(driver, wait)
+        reset_to_first_page(driver, wait, start)
 
     return all_facilities
 
+# ==========================================
+# GRID DATA ENDPOINT
+# ==========================================
+# Records every jQuery AJAX request so the grid's read request can be found
+WATCH_AJAX_JS = """
+window.__ocipAjax = [];
+if (window.jQuery && !window.__ocipAjaxHooked) {
+    window.__ocipAjaxHooked = true;
+    window.jQuery(document).ajaxSend(function (e, xhr, s) {
+        window.__ocipAjax.push({url: s.url, type: s.type, data: s.data || '', contentType: s.contentType || ''});
+    });
+}
+"""
+
+# What a direct request needs: the grid's read request (as last sent), the
+# dropdown value it was sent for, the column fields and the first data item
+GRID_API_JS = """
+var el = document.querySelector('.k-grid');
+var grid = (el && window.jQuery) ? window.jQuery(el).data('kendoGrid') : null;
+var ddEl = window.jQuery ? window.jQuery("[data-role='dropdownlist']").first() : null;
+var dd = ddEl ? ddEl.data('kendoDropDownList') : null;
+if (!grid || !dd) { return null; }
+var read = grid.dataSource.transport.options.read;
+var readUrl = read && (typeof read === 'string' ? read : read.url);
+if (typeof readUrl !== 'string') { return null; }
+var absolute = function (u) { var a = document.createElement('a'); a.href = u; return a.href.split('?')[0]; };
+var target = absolute(readUrl);
+var sent = (window.__ocipAjax || []).filter(function (r) { return absolute(r.url) === target; });
+var schema = grid.dataSource.options.schema || {};
+var items = grid.dataSource.data();
+return {
+    request: sent.length ? sent[sent.length - 1] : null,
+    page_url: location.href,
+    value: String(dd.value()),
+    data_key: typeof schema.data === 'string' ? schema.data : null,
+    text_field: dd.options.dataTextField,
+    value_field: dd.options.dataValueField,
+    options: dd.dataSource.data().toJSON(),
+    fields: grid.columns.map(function (c) { return c.field || null; }),
+    first_item: items.length ? items[0].toJSON() : null
+};
+"""
+
+
+# Kendo paging parameters, rewritten so one request returns every row
+PAGING_PARAMS = {"page": "1", "skip": "0", "pageSize": str(API_PAGE_SIZE), "take": str(API_PAGE_SIZE)}
+
+
+class GridApi:
+    """Fetch an institution's facility rows from the grid's JSON endpoint."""
+
+    def __init__(self, driver, info, manage_url_parts):
+        request = info["request"]
+        self.url = urljoin(info["page_url"], request["url"])
+        self.method = (request["type"] or "GET").upper()
+        self.params = dict(parse_qsl(request["data"], keep_blank_values=True))
+        self.hei_key = next(k for k, v in self.params.items()
+                            if v == info["value"] and k not in PAGING_PARAMS)
+        for key, value in PAGING_PARAMS.items():
+            if key in self.params:
+                self.params[key] = value
+        self.data_key = info["data_key"]
+        self.fields = info["fields"][:3]
+        self.manage_url_parts = manage_url_parts
+        self.hei_ids = {
+            str(opt.get(info["text_field"], "")).strip(): str(opt.get(info["value_field"], ""))
+            for opt in info["options"]
+        }
+
+        cookies = {c["name"]: c["value"] for c in driver.get_cookies()}
+        headers = {
+            "User-Agent": driver.execute_script("return navigator.userAgent;"),
+            "X-Requested-With": "XMLHttpRequest",
+        }
+        if AIOHTTP_AVAILABLE:
+            self.loop = asyncio.new_event_loop()
+            self.session = self.loop.run_until_complete(self._open(cookies, headers))
+        else:
+            self.loop = None
+            self.session = requests.Session()
+            self.session.cookies.update(cookies)
+            self.session.headers.update(headers)
+            self.executor = ThreadPoolExecutor(max_workers=API_CONCURRENCY)
+
+    async def _open(self, cookies, headers):
+        """Create the pooled aiohttp session inside the event loop."""
+        return aiohttp.ClientSession(
+            cookies=cookies,
+            headers=headers,
+            connector=aiohttp.TCPConnector(limit=API_CONCURRENCY),
+            timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+        )
+
+    @classmethod
+    def discover(cls, driver, wait, uni_name):
+        """
+        Select uni_name in the browser, watch the grid load and work out how to
+        request it directly. Returns a GridApi, or None if that isn't possible.
+        """
+        try:
+            driver.execute_script(WATCH_AJAX_JS)
+            if not select_institution(driver, wait, uni_name):
+                return None
+            wait_for_rows_stable(driver)
+            info = driver.execute_script(GRID_API_JS)
+            if not info or not info["request"] or None in info["fields"][:3]:
+                return None
+            sent = parse_qsl(info["request"]["data"], keep_blank_values=True)
+            if not any(v == info["value"] and k not in PAGING_PARAMS for k, v in sent):
+                return None
+            page_rows, _, _ = scrape_rows(driver, uni_name)
+            api = cls(driver, info, cls._manage_url_parts(page_rows, info["first_item"]))
+        except Exception as e:
+            print(yellow(f"  ⚠ Grid endpoint discovery failed: {e}"))
+            return None
+
+        # The endpoint must return what the grid shows
+        rows = api.fetch(uni_name)
+        if not rows or not page_rows or rows[0]["Facility_Name"] != page_rows[0]["Facility_Name"]:
+            api.close()
+            return None
+        return api
+
+    @staticmethod
+    def _manage_url_parts(page_rows, first_item):
+        """
+        (prefix, field, suffix) such that prefix + item[field] + suffix is an
+        item's Manage URL, found by matching the first row's link against its
+        data item. None if no field appears in the link.
+        """
+        if not page_rows or not first_item:
+            return None
+        href = page_rows[0]["Manage_URL"]
+        candidates = [(k, str(v)) for k, v in first_item.items()
+                      if v not in (None, "") and not isinstance(v, (bool, dict, list)) and str(v) in href]
+        if href == "Not Found" or not candidates:
+            return None
+        field, value = max(candidates, key=lambda kv: len(kv[1]))
+        prefix, _, suffix = href.partition(value)
+        return prefix, field, suffix
+
+    @staticmethod
+    def cell(item, field):
+        """A data item's field as display text."""
+        value = item.get(field)
+        return "" if value is None else str(value).strip()
+
+    def _params(self, uni_name):
+        """Request parameters for one institution, or None if its id is unknown."""
+        hei_id = self.hei_ids.get(uni_name.strip())
+        if hei_id is None:
+            return None
+        return dict(self.params, **{self.hei_key: hei_id})
+
+    @staticmethod
+    def _next_page(params, page, size):
+        """
+        Parameters for page number `page` of `size` rows, used when the server
+        returned fewer rows than its total (it caps the page size). None if the
+        request has no paging parameters to change.
+        """
+        paged = {"page": str(page), "skip": str((page - 1) * size),
+                 "pageSize": str(size), "take": str(size)}
+        changes = {k: v for k, v in paged.items() if k in params}
+        if not changes or page > 200:   # absolute safety, as in the browser loop
+            return None
+        return dict(params, **changes)
+
+    def _items(self, payload):
+        """(items, total) from an endpoint response; items is None if unrecognised."""
+        if not isinstance(payload, dict):
+            return (payload if isinstance(payload, list) else None), None
+        items = payload.get(self.data_key) if self.data_key else (payload.get("Data") or payload.get("data"))
+        total = payload.get("Total", payload.get("total"))
+        return (items if isinstance(items, list) else None), (total if isinstance(total, int) else None)
+
+    async def _fetch_async(self, uni_name):
+        """aiohttp: the institution's records, or None if the request failed."""
+        params = self._params(uni_name)
+        if params is None:
+            return None
+        items, page = [], 1
+        try:
+            while True:
+                if self.method == "GET":
+                    request = self.session.get(self.url, params=params)
+                else:
+                    request = self.session.post(self.url, data=params)
+                async with request as response:
+                    if response.status != 200:
+                        return None
+                    payload = await response.json(content_type=None)
+                page_items, total = self._items(payload)
+                if page_items is None:
+                    return None
+                items.extend(page_items)
+                if not page_items or total is None or len(items) >= total:
+                    break
+                page += 1
+                params = self._next_page(params, page, len(page_items))
+                if params is None:
+                    return None
+        except Exception:
+            return None
+        return self._records(uni_name, items)
+
+    def _fetch_sync(self, uni_name):
+        """requests: the institution's records, or None if the request failed."""
+        params = self._params(uni_name)
+        if params is None:
+            return None
+        items, page = [], 1
+        try:
+            while True:
+                if self.method == "GET":
+                    response = self.session.get(self.url, params=params, timeout=API_TIMEOUT)
+                else:
+                    response = self.session.post(self.url, data=params, timeout=API_TIMEOUT)
+                if response.status_code != 200:
+                    return None
+                page_items, total = self._items(response.json())
+                if page_items is None:
+                    return None
+                items.extend(page_items)
+                if not page_items or total is None or len(items) >= total:
+                    break
+                page += 1
+                params = self._next_page(params, page, len(page_items))
+                if params is None:
+                    return None
+        except Exception:
+            return None
+        return self._records(uni_name, items)
+
+    def fetch_many(self, uni_names):
+        """Fetch several institutions concurrently; results match the input order."""
+        if self.loop is not None:
+            return self.loop.run_until_complete(
+                asyncio.gather(*(self._fetch_async(name) for name in uni_names))
+            )
+        return list(self.executor.map(self._fetch_sync, uni_names))
+
+    def fetch(self, uni_name):
+        """Return the institution's records, or None if the request failed."""
+        return self.fetch_many([uni_name])[0]
+
+    def _records(self, uni_name, items):
+        """Turn the endpoint's data items into facility records."""
+        branch_f, name_f, type_f = self.fields
+        parts = self.manage_url_parts
+        scraped_at = datetime.now().isoformat()
+        return [{
+            "Institution":   uni_name,
+            "Branch":        self.cell(item, branch_f),
+            "Facility_Name": self.cell(item, name_f),
+            "Facility_Type": self.cell(item, type_f),
+            "Manage_URL":    parts[0] + self.cell(item, parts[1]) + parts[2] if parts else "Not Found",
+            "Scraped_At":    scraped_at,
+        } for item in items]
+
+    def close(self):
+        """Close the session (and its event loop / threads)."""
+        if self.loop is not None:
+            try:
+                self.loop.run_until_complete(self.session.close())
+            finally:
+                self.loop.close()
+        else:
+            self.executor.shutdown(wait=True)
+            self.session.close()
+
+
+def _scrape_via_api(api, driver, wait, tasks):
+    """
+    Yield (index, name, data) from the grid endpoint, API_CONCURRENCY
+    institutions per batch, using the browser for any request that fails.
+    """
+    for b in range(0, len(tasks), API_CONCURRENCY):
+        batch = tasks[b:b + API_CONCURRENCY]
+        results = api.fetch_many([uni_name for _, uni_name, _ in batch])
+        for (i, uni_name, total_count), data in zip(batch, results):
+            if data is None:
+                print(yellow(f"      ⚠ Endpoint request failed for {uni_name} — using the browser"))
+                data = scrape_institution(driver, wait, uni_name, i, total_count)
+            else:
+                print(f"\n[{i + 1}/{total_count}] {bold(uni_name)}")
+            yield i, uni_name, data
+
 # ==========================================
 # SCRAPE ONE INSTITUTION (helper)
 # ==========================================
@@ -510,17 +1205,121 @@ def scrape_institution(driver, wait, uni_name, idx, total_count):
     data = scrape_all_pages_for_institution(driver, wait, uni_name)
     return data
 
+def _scrape_sequential(driver, wait, tasks):
+    """Yield (index, name, data) for each institution using a single browser."""
+    for n, (i, uni_name, total_count) in enumerate(tasks):
+        if n:
+            time.sleep(0.5)
+        yield i, uni_name, scrape_institution(driver, wait, uni_name, i, total_count)
+
+
+def scrape_institutions(driver, wait, tasks):
+    """
+    Yield (index, name, data) for each (index, name, total) task, in order.
+    Uses WORKER_COUNT browsers when there is more than one task, otherwise
+    the main browser (which also takes the tasks of any worker whose browser
+    failed to start). Close the generator to stop the workers early.
+    """
+    # Pool tasks must be picklable by module name, which only holds when
+    # this file runs as a script (not when loaded by the main controller)
+    if WORKER_COUNT <= 1 or len(tasks) <= 1 or __name__ != "__main__":
+        yield from _scrape_sequential(driver, wait, tasks)
+        return
+
+    print(cyan(f"  Scraping with {WORKER_COUNT} parallel browsers…"))
+    pool = multiprocessing.Pool(
+        min(WORKER_COUNT, len(tasks)),
+        initializer=_init_worker,
+        initargs=(driver.get_cookies(), driver.current_url)
+    )
+    try:
+        warned = False
+        # imap keeps input order, so checkpoints stay index-based
+        for task, (i, uni_name, data, error) in zip(tasks, pool.imap(_scrape_in_worker, tasks)):
+            if error is not None:
+                # This worker has no browser: scrape the institution here instead
+                if not warned:
+                    print(yellow(f"  ⚠ A worker browser failed to start ({error}) — "
+                                 f"its institutions are scraped in the main browser"))
+                    warned = True
+                data = scrape_institution(driver, wait, uni_name, i, task[2])
+            yield i, uni_name, data
+    except BaseException:
+        pool.terminate()
+        raise
+    pool.close()
+    pool.join()
+
+# ==========================================
+# WORKER POOL
+# ==========================================
+_worker_driver = None
+_worker_wait   = None
+_worker_error  = None   # why this worker's browser failed to start, if it did
+
+
+def _init_worker(cookies, target_url):
+    """Start this worker's browser and log it in with the shared cookies."""
+    global _worker_driver, _worker_wait, _worker_error, TQDM_AVAILABLE
+    # Per-page bars from several processes would garble the institutions bar
+    TQDM_AVAILABLE = False
+
+    # An initializer that raises makes the pool respawn the worker forever
+    # (and imap never returns), so a failed start is recorded instead
+    try:
+        _worker_driver = get_driver(headless=HEADLESS, block_images=BLOCK_RESOURCES)
+        _worker_wait   = WebDriverWait(_worker_driver, 20, poll_frequency=0.1)
+        if BLOCK_RESOURCES:
+            block_resources(_worker_driver)
+
+        # Cookies can only be set for the domain currently loaded
+        _worker_driver.get(LOGIN_URL)
+        add_cookies(_worker_driver, cookies)
+        _worker_driver.get(target_url)
+        wait_for_loading_complete(_worker_driver, timeout=20)
+    except Exception as e:
+        _worker_error = f"{type(e).__name__}: {e}"
+        if _worker_driver is not None:
+            try:
+                _worker_driver.quit()
+            except Exception:
+                pass
+            _worker_driver = None
+        return
+
+    # Quit the browser when the pool shuts this worker down
+    mp_util.Finalize(None, _worker_driver.quit, exitpriority=10)
+
+
+def _scrape_in_worker(task):
+    """
+    Pool task: scrape one institution on this worker's browser.
+    Returns (index, name, data, error); error is set (and data None) if the
+    worker's browser failed to start.
+    """
+    i, uni_name, total_count = task
+    if _worker_error is not None:
+        return i, uni_name, None, _worker_error
+    try:
+        return i, uni_name, scrape_institution(_worker_driver, _worker_wait, uni_name, i, total_count), None
+    except Exception as e:
+        print(red(f"      ✗ Worker error on '{uni_name}': {e}"))
+        return i, uni_name, None, None
+
 # ==========================================
 # POST-SCRAPE INTERACTIVE MENU
 # ==========================================
-def post_scrape_menu(driver, wait, master_list, empty_institutions, institution_names):
+def post_scrape_menu(driver, wait, log, master_list, empty_institutions, institution_names):
     """
     After the main scrape, ask the user if they want to re-visit empties.
     Allows: re-visit ALL empties, specific ones by number, or finish.
+    Returns (master_list, dirty) — dirty is True if anything was re-scraped.
     """
     if not empty_institutions:
         print(green("\n✓ No empty institutions detected — all done!"))
-        return master_list
+        return master_list, False
+
+    dirty = False
 
     print("\n" + "=" * 60)
     print(bold("  POST-SCRAPE: EMPTY INSTITUTIONS REVIEW"))
@@ -544,8 +1343,9 @@ def post_scrape_menu(driver, wait, master_list, empty_institutions, institution_
 
         elif choice == "A":
             targets = empty_institutions[:]
-            newly_empty = _revisit_targets(driver, wait, master_list, targets,
+            newly_empty = _revisit_targets(driver, wait, log, master_list, targets,
                                            institution_names, empty_institutions)
+            dirty = True
             empty_institutions = newly_empty
             if not empty_institutions:
                 print(green("  ✓ All previously-empty institutions now have data!"))
@@ -575,8 +1375,9 @@ def post_scrape_menu(driver, wait, master_list, empty_institutions, institution_
                 print(red("  ✗ No valid selections — try again"))
                 continue
 
-            newly_empty = _revisit_targets(driver, wait, master_list, targets,
+            newly_empty = _revisit_targets(driver, wait, log, master_list, targets,
                                            institution_names, empty_institutions)
+            dirty = True
             # Remove re-scraped ones from empty list
             revisited_names = {t["name"] for t in targets}
             still_empty = [e for e in empty_institutions if e["name"] in newly_empty_names(newly_empty)]
@@ -587,70 +1388,103 @@ def post_scrape_menu(driver, wait, master_list, empty_institutions, institution_
         else:
             print(red("  ✗ Unrecognised option — please enter A, S, or Q"))
 
-    return master_list
+    return master_list, dirty
 
 
 def newly_empty_names(newly_empty):
     return {e["name"] for e in newly_empty}
 
 
-def _revisit_targets(driver, wait, master_list, targets, institution_names, old_empty):
+def _revisit_targets(driver, wait, log, master_list, targets, institution_names, old_empty):
     """Re-scrape target institutions. Returns list of still-empty entries."""
     print(cyan(f"\n  → Re-visiting {len(targets)} institution(s)…"))
     still_empty = []
 
     bar = None
     if TQDM_AVAILABLE:
-        bar = tqdm(targets, desc="  Re-scraping", unit="inst")
-
-    iterable = bar if bar else targets
-    for item in iterable:
-        uni_name = item["name"]
-        idx      = item["index"]
-
-        # Remove any previously collected (possibly partial) records for this institution
-        before = len(master_list)
-        master_list[:] = [r for r in master_list if r.get("Institution") != uni_name]
-        removed = before - len(master_list)
-        if removed:
-            print(yellow(f"      ℹ Removed {removed} old records for {uni_name} before re-scrape"))
-
-        data = scrape_institution(driver, wait, uni_name, idx, len(institution_names))
-
-        if data is None:
-            print(red(f"      ✗ Selection error for {uni_name}"))
-            still_empty.append(item)
-        elif len(data) == 0:
-            print(yellow(f"      ⚠ Still no data for {uni_name}"))
-            still_empty.append(item)
-        else:
-            master_list.extend(data)
-            print(green(f"      ✓ Collected {len(data)} records for {uni_name}"))
+        bar = tqdm(total=len(targets), desc="  Re-scraping", unit="inst", **BAR_OPTIONS)
+
+    # Remove any previously collected (possibly partial) records for these
+    # institutions, in one pass over the list
+    target_names = {item["name"] for item in targets}
+    before = len(master_list)
+    master_list[:] = [r for r in master_list if r.get("Institution") not in target_names]
+    removed = before - len(master_list)
+    if removed:
+        print(yellow(f"      ℹ Removed {removed} old records before re-scrape"))
+        rewrite_checkpoint_log(log, master_list)
+
+    # Empty entries still outstanding, for the checkpoints below
+    remaining_empty = {e["name"]: e for e in old_empty}
+
+    tasks = [(item["index"], item["name"], len(institution_names)) for item in targets]
+    results = scrape_institutions(driver, wait, tasks)
+    try:
+        for n, (item, (idx, uni_name, data)) in enumerate(zip(targets, results), start=1):
+            if data is None:
+                print(red(f"      ✗ Selection error for {uni_name}"))
+                still_empty.append(item)
+            elif len(data) == 0:
+                print(yellow(f"      ⚠ Still no data for {uni_name}"))
+                still_empty.append(item)
+            else:
+                master_list.extend(data)
+                append_checkpoint(log, data)
+                remaining_empty.pop(uni_name, None)
+                print(green(f"      ✓ Collected {len(data)} records for {uni_name}"))
 
-        save_checkpoint(master_list, idx + 1, institution_names,
-                        [e for e in old_empty if e["name"] != uni_name])
-        time.sleep(0.5)
+            if bar:
+                bar.update(1)
 
-    if bar:
-        bar.close()
+            if n % CHECKPOINT_EVERY == 0 or n == len(targets):
+                save_checkpoint(log, len(master_list), idx + 1, institution_names,
+                                list(remaining_empty.values()))
+    finally:
+        results.close()
+        if bar:
+            bar.close()
 
     return still_empty
 
 # ==========================================
 # SAVE RESULTS
 # ==========================================
+def write_excel_streaming(records, path):
+    """
+    Write records to .xlsx with xlsxwriter's constant_memory mode.
+    Rows are flushed as they are written, so memory stays flat.
+    URLs are stored as plain text, not hyperlinks (a sheet holds at most
+    65,530 hyperlinks; xlsxwriter drops the cells past that).
+    """
+    columns = list(dict.fromkeys(key for rec in records for key in rec))
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+    try:
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, columns)
+        for row, rec in enumerate(records, start=1):
+            sheet.write_row(row, 0, [rec.get(col, "") for col in columns])
+    finally:
+        workbook.close()
+
+
 def save_results(master_list):
     print("\n" + "=" * 60)
     print(bold("  SAVING RESULTS"))
     print("=" * 60)
 
-    with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
-        json.dump(master_list, f, indent=2, ensure_ascii=False)
+    # One compact record per line: much smaller than indent=2, still diffable
+    if ORJSON_AVAILABLE:
+        lines = [orjson.dumps(r) for r in master_list]
+    else:
+        lines = [json.dumps(r, ensure_ascii=False).encode('utf-8') for r in master_list]
+    with open(OUTPUT_JSON, 'wb') as f:
+        f.write(b"[\n" + b",\n".join(lines) + b"\n]\n" if lines else b"[]\n")
     print(green(f"  ✓ JSON  → {OUTPUT_JSON}  ({len(master_list)} records)"))
 
+    if not XLSXWRITER_AVAILABLE:
+        return
     try:
-        df = pd.DataFrame(master_list)
-        df.to_excel(OUTPUT_EXCEL, index=False)
+        write_excel_streaming(master_list, OUTPUT_EXCEL)
         print(green(f"  ✓ Excel → {OUTPUT_EXCEL}"))
     except Exception as e:
         print(yellow(f"  ⚠ Excel save failed: {e}"))
@@ -671,6 +1505,7 @@ def main():
 
     checkpoint = load_checkpoint()
     resume = False
+    resume_bytes = None
 
     if checkpoint:
         print(yellow(f"\n  ⚠  Checkpoint found:"))
@@ -684,6 +1519,7 @@ def main():
             start_index        = checkpoint.get('current_index', 0)
             institution_names  = checkpoint.get('institution_names', [])
             empty_institutions = checkpoint.get('empty_institutions', [])
+            resume_bytes       = checkpoint.get('data_bytes')
             resume = True
             print(green(f"  ✓ Resuming from institution #{start_index + 1}"))
         else:
@@ -691,22 +1527,31 @@ def main():
     else:
         print(cyan("  No checkpoint found — starting fresh"))
 
+    log = open_checkpoint_log(resume_bytes)
+    if resume and resume_bytes is None:
+        # Older checkpoint with inline rows: move them into the log once
+        append_checkpoint(log, master_list)
+
     # ── NOW open the browser ──────────────────────────────────────────────────
     print(cyan("\n  Opening browser…"))
-    driver = get_driver()
-    wait   = WebDriverWait(driver, 20)
+    headless = HEADLESS_MAIN and load_cookies() is not None
+    driver = get_driver(headless=headless)
+    wait   = WebDriverWait(driver, 20, poll_frequency=0.1)
 
     try:
         # Step 1: Login
-        driver.get(LOGIN_URL)
-        print(bold("\nSTEP 1: Please log in to the portal."))
-        input("  >>> Press ENTER when fully logged in… ")
+        if not login(driver, manual=not headless):
+            driver.quit()
+            driver = get_driver()
+            wait   = WebDriverWait(driver, 20, poll_frequency=0.1)
+            login(driver)
+        if BLOCK_RESOURCES:
+            block_resources(driver)
 
         # Step 2: Navigate to Facilities
         driver.get(TARGET_URL)
         print(cyan(f"\n  Navigating to: {TARGET_URL}"))
         wait_for_loading_complete(driver, timeout=20)
-        time.sleep(PAGE_LOAD_WAIT)
 
         # Step 3: Get institutions (if not loaded from checkpoint)
         if not institution_names:
@@ -727,28 +1572,49 @@ def main():
                 initial=start_index,
                 desc="  Institutions",
                 unit="inst",
-                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]"
+                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+                **BAR_OPTIONS
             )
 
-        for i, uni_name in enumerate(institution_names[start_index:], start=start_index):
+        tasks = [(i, name, total_count)
+                 for i, name in enumerate(institution_names[start_index:], start=start_index)]
 
-            data = scrape_institution(driver, wait, uni_name, i, total_count)
-
-            if data is None:
-                # Selection failed — treat as needing re-visit
-                empty_institutions.append({"index": i, "name": uni_name, "reason": "selection_failed"})
-            elif len(data) == 0:
-                print(yellow(f"      ⚠ No data collected for {uni_name}"))
-                empty_institutions.append({"index": i, "name": uni_name, "reason": "no_data"})
+        api = None
+        if USE_GRID_API and (AIOHTTP_AVAILABLE or REQUESTS_AVAILABLE) and tasks:
+            api = GridApi.discover(driver, wait, tasks[0][1])
+            if api:
+                print(green(f"  ✓ Reading facilities from the grid endpoint ({api.url})"))
             else:
-                master_list.extend(data)
-                print(green(f"      ✓ {len(data)} records  |  Running total: {len(master_list)}"))
+                print(yellow("  ⚠ Grid endpoint not found — scraping through the browser"))
 
-            if outer_bar:
-                outer_bar.update(1)
+        if api:
+            results = _scrape_via_api(api, driver, wait, tasks)
+        else:
+            results = scrape_institutions(driver, wait, tasks)
 
-            save_checkpoint(master_list, i + 1, institution_names, empty_institutions)
-            time.sleep(0.5)
+        try:
+            for i, uni_name, data in results:
+                if data is None:
+                    # Selection failed — treat as needing re-visit
+                    empty_institutions.append({"index": i, "name": uni_name, "reason": "selection_failed"})
+                elif len(data) == 0:
+                    print(yellow(f"      ⚠ No data collected for {uni_name}"))
+                    empty_institutions.append({"index": i, "name": uni_name, "reason": "no_data"})
+                else:
+                    master_list.extend(data)
+                    append_checkpoint(log, data)
+                    print(green(f"      ✓ {uni_name}: {len(data)} records  |  Running total: {len(master_list)}"))
+
+                if outer_bar:
+                    outer_bar.update(1)
+
+                start_index = i + 1
+                if start_index % CHECKPOINT_EVERY == 0 or start_index == total_count:
+                    save_checkpoint(log, len(master_list), start_index, institution_names, empty_institutions)
+        finally:
+            results.close()
+            if api is not None:
+                api.close()
 
         if outer_bar:
             outer_bar.close()
@@ -768,27 +1634,29 @@ def main():
         save_results(master_list)
 
         # Step 7: Post-scrape interactive re-visit menu
-        master_list = post_scrape_menu(
-            driver, wait, master_list, empty_institutions, institution_names
+        master_list, dirty = post_scrape_menu(
+            driver, wait, log, master_list, empty_institutions, institution_names
         )
 
-        # Save final results again in case re-visits added data
-        save_results(master_list)
+        # Save final results again if re-visits changed the data
+        if dirty:
+            save_results(master_list)
         print(green("\n  ✓ All done!"))
 
     except KeyboardInterrupt:
         print(yellow("\n  ⚠  Interrupted by user — saving progress…"))
-        save_checkpoint(master_list, start_index, institution_names, empty_institutions)
+        save_checkpoint(log, len(master_list), start_index, institution_names, empty_institutions)
         save_results(master_list)
 
     except Exception as e:
         print(red(f"\n  ✗ CRITICAL ERROR: {e}"))
         import traceback
         traceback.print_exc()
-        save_checkpoint(master_list, start_index, institution_names, empty_institutions)
+        save_checkpoint(log, len(master_list), start_index, institution_names, empty_institutions)
         save_results(master_list)
 
     finally:
+        log.close()
         print(cyan("\n  Script finished."))
 
 
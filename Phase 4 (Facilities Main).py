@@ -13,6 +13,8 @@ import time
 import json
 import re
 import os
+import multiprocessing
+from multiprocessing import util as mp_util
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -20,34 +22,51 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
-    StaleElementReferenceException,
-    ElementClickInterceptedException
+    StaleElementReferenceException
 )
 
 # ==========================================
 # CONFIGURATION
 # ==========================================
+LOGIN_URL = "https://www.ocip.express/"
 INPUT_FILE = "facilities_master_list.json"
 OUTPUT_FILE = "facilities_full_details.json"
 CHECKPOINT_FILE = "phase4_checkpoint.json"
 ERROR_LOG_FILE = "phase4_errors.json"
 
 # Timing Configuration
-PAGE_LOAD_WAIT = 2.0
-ACCORDION_EXPAND_WAIT = 0.5
+ACCORDION_EXPAND_TIMEOUT = 2.0  # Max wait for the panels to report themselves expanded
 BETWEEN_FACILITIES_DELAY = 1.0
-REQUEST_DELAY = 0.3
 
-# Rate limiting
+# The section extractors read the first SECTION_COUNT top-level panels by
+# position; later or nested panels are never expanded.
+SECTION_COUNT = 12
+
+# Rate limiting (BATCH_PAUSE applies when scraping in the main browser only;
+# every browser waits BETWEEN_FACILITIES_DELAY between its own facilities)
 BATCH_SIZE = 50
 BATCH_PAUSE = 10
 
+# Parallel scraping: facilities are split across this many browsers (each its
+# own process, logged in with the main browser's cookies). 1 = scrape in the
+# main browser.
+WORKER_COUNT = 4
+HEADLESS = os.environ.get("HEADLESS", "1") != "0"  # worker browsers run headless
+
+# Page weight: detail pages are read from the DOM, so images and web fonts
+# aren't downloaded. Stylesheets stay on (the extractors read rendered text).
+# The browser loads everything until you have logged in.
+BLOCK_RESOURCES = True
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.webp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+
 
 # ==========================================
 # DRIVER SETUP
 # ==========================================
-def get_driver():
+def get_driver(headless=False):
     """Initialize Chrome WebDriver with optimal settings."""
     options = webdriver.ChromeOptions()
     options.add_argument("--start-maximized")
@@ -55,12 +74,39 @@ def get_driver():
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
     options.add_experimental_option("detach", True)
+    # driver.get() returns at DOMContentLoaded; the panel-bar wait does the rest
+    options.page_load_strategy = "eager"
+    options.add_experimental_option("prefs", {"profile.default_content_setting_values.notifications": 2})
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
 
     driver = webdriver.Chrome(options=options)
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     return driver
 
 
+def add_cookies(driver, cookies):
+    """Set cookies on the domain currently loaded in the browser."""
+    for cookie in cookies:
+        cookie.pop("sameSite", None)
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            pass
+
+
+def block_resources(driver):
+    """Stop the browser requesting BLOCKED_URL_PATTERNS (via DevTools)."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"      [Warning] Could not block page resources: {e}")
+
+
 # ==========================================
 # UTILITY FUNCTIONS
 # ==========================================
@@ -79,671 +125,531 @@ def load_master_list(filepath):
         return None
 
 
-def save_checkpoint(processed_data, current_index, errors):
-    """Save progress checkpoint."""
+def checkpoint_data_file():
+    """Path of the append-only profile log that goes with CHECKPOINT_FILE."""
+    return os.path.splitext(CHECKPOINT_FILE)[0] + ".jsonl"
+
+
+def open_checkpoint_log(resume_bytes=None):
+    """
+    Open the profile log for appending.
+    When resuming, anything written after the last saved checkpoint is cut off.
+    """
+    if resume_bytes is None:
+        # Fresh start: the old index would not describe the new log
+        try:
+            os.remove(CHECKPOINT_FILE)
+        except FileNotFoundError:
+            pass
+        return open(checkpoint_data_file(), 'wb')
+    log = open(checkpoint_data_file(), 'r+b')
+    log.truncate(resume_bytes)
+    log.seek(0, os.SEEK_END)
+    return log
+
+
+def append_profile(log, profile):
+    """Append one profile to the log as a JSON line."""
+    log.write(json.dumps(profile, ensure_ascii=False).encode('utf-8') + b"\n")
+
+
+def write_json_atomic(filepath, obj):
+    """Write obj as indented JSON to a temp file, then swap it into place."""
+    tmp = filepath + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, filepath)
+
+
+def save_checkpoint(log, facilities_processed, current_index, errors):
+    """
+    Save progress checkpoint.
+    Profiles are already in the log; only a small header is rewritten.
+    """
+    log.flush()
     checkpoint = {
         "timestamp": datetime.now().isoformat(),
         "current_index": current_index,
-        "facilities_processed": len(processed_data),
+        "facilities_processed": facilities_processed,
         "errors_count": len(errors),
-        "data": processed_data
+        "data_bytes": log.tell()
     }
-    with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(checkpoint, f, indent=2, ensure_ascii=False)
-
-    with open(ERROR_LOG_FILE, 'w', encoding='utf-8') as f:
-        json.dump(errors, f, indent=2, ensure_ascii=False)
+    write_json_atomic(CHECKPOINT_FILE, checkpoint)
+    write_json_atomic(ERROR_LOG_FILE, errors)
 
 
 def load_checkpoint():
     """Load previous checkpoint if exists."""
     try:
         with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            checkpoint = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
+    # Older checkpoints carry the profiles inline
+    if "data" in checkpoint:
+        return checkpoint
 
-def clean_text(text):
-    """Clean and normalize extracted text."""
-    if not text:
-        return ""
-    text = re.sub(r'\s+', ' ', text.strip())
-    text = text.replace('\xa0', ' ')
-    return text
-
-
-def parse_yes_no(element):
-    """Parse Yes/No icon elements."""
-    try:
-        icon = element.find_element(By.CSS_SELECTOR, "span.k-icon")
-        title = icon.get_attribute("title")
-        if title:
-            return title
-        classes = icon.get_attribute("class")
-        if "k-i-checkbox-checked" in classes:
-            return "Yes"
-        elif "k-i-checkbox" in classes:
-            return "No"
-    except:
-        pass
-    return clean_text(element.text)
-
-
-def expand_all_accordions(driver, wait):
-    """Expand all collapsed accordion panels."""
     try:
-        # Find all collapsed accordion headers
-        collapsed_headers = driver.find_elements(
-            By.CSS_SELECTOR,
-            "li.k-panelbar-header[aria-expanded='false'] > a.k-link, " +
-            "li.k-panelbar-item[aria-expanded='false'] > a.k-link"
-        )
-
-        expanded_count = 0
-        for header in collapsed_headers:
-            try:
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", header)
-                time.sleep(0.1)
+        with open(checkpoint_data_file(), 'rb') as f:
+            raw = f.read(checkpoint["data_bytes"])
+    except (OSError, KeyError):
+        return None
+    if len(raw) < checkpoint["data_bytes"]:
+        return None
 
-                try:
-                    header.click()
-                except ElementClickInterceptedException:
-                    driver.execute_script("arguments[0].click();", header)
+    checkpoint["data"] = [json.loads(line) for line in raw.splitlines() if line]
+    return checkpoint
 
-                expanded_count += 1
-                time.sleep(ACCORDION_EXPAND_WAIT)
 
-            except StaleElementReferenceException:
-                continue
-            except Exception:
-                continue
+_WS_RE = re.compile(r'\s+')
+# Non-breaking spaces become spaces; zero-width spaces and BOMs are dropped
+_TRANS = str.maketrans({'\xa0': ' ', '\u200b': '', '\ufeff': ''})
 
-        time.sleep(0.5)
-        return True
 
-    except Exception as e:
-        print(f"      [Warning] Accordion expansion error: {e}")
-        return False
+def clean_text(text):
+    """Clean and normalize extracted text."""
+    if not text:
+        return ""
+    return _WS_RE.sub(' ', text.translate(_TRANS)).strip()
+
+
+# Expands every collapsed panel among the first arguments[0] top-level panels
+# and returns those panels, so the caller can wait on them. Uses the Kendo
+# PanelBar API (without animation) when available, else clicks the header.
+EXPAND_PANELS_JS = """
+var panels = Array.from(document.querySelectorAll('ul.k-panelbar > li')).slice(0, arguments[0]);
+var collapsed = panels.filter(function (li) { return li.getAttribute('aria-expanded') === 'false'; });
+collapsed.forEach(function (li) {
+    var bar = window.jQuery ? window.jQuery(li.parentElement).data('kendoPanelBar') : null;
+    if (bar) {
+        bar.expand(li, false);
+        return;
+    }
+    var link = li.querySelector(':scope > .k-link');
+    if (link) { link.click(); }
+});
+return collapsed;
+"""
 
 
-def extract_table_grid_data(panel, grid_id=None):
+def expand_all_accordions(driver, wait, section_count=SECTION_COUNT):
     """
-    Generic function to extract data from a Kendo grid table within a panel.
-    Returns a list of dictionaries.
+    Expand the collapsed panels the section extractors read (the first
+    section_count top-level panels) with one click script, then wait once
+    for all of them to report aria-expanded="true".
     """
-    data_list = []
-
     try:
-        # Find the grid
-        if grid_id:
-            grid = panel.find_element(By.ID, grid_id)
-        else:
-            grid = panel.find_element(By.CSS_SELECTOR, "div.k-grid")
+        collapsed = driver.execute_script(EXPAND_PANELS_JS, section_count)
+        if not collapsed:
+            return True
 
-        # Check for "No records"
         try:
-            no_data = grid.find_element(By.CSS_SELECTOR, "tr.k-no-data, div.k-grid-norecords-template")
-            if no_data and no_data.is_displayed():
-                return []
-        except NoSuchElementException:
-            pass
-
-        # Get headers
-        headers = []
-        try:
-            header_cells = grid.find_elements(By.CSS_SELECTOR, "thead th")
-            for th in header_cells:
-                header_text = clean_text(th.text)
-                if header_text:
-                    headers.append(header_text.replace(" ", "_"))
-        except:
-            pass
+            WebDriverWait(driver, ACCORDION_EXPAND_TIMEOUT, poll_frequency=0.1).until(
+                lambda d: all(li.get_attribute("aria-expanded") == "true" for li in collapsed)
+            )
+        except (TimeoutException, StaleElementReferenceException):
+            print("      [Warning] Not all accordions reported expanded - proceeding anyway")
 
-        # Get rows
-        rows = grid.find_elements(By.CSS_SELECTOR, "tbody tr.k-master-row")
-
-        for row in rows:
-            try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                row_data = {}
-
-                for idx, cell in enumerate(cells):
-                    # Use header if available, otherwise use index
-                    key = headers[idx] if idx < len(headers) else f"Column_{idx}"
-
-                    # Check for links
-                    try:
-                        link = cell.find_element(By.TAG_NAME, "a")
-                        row_data[key] = clean_text(link.text)
-                        row_data[f"{key}_URL"] = link.get_attribute("href")
-                    except NoSuchElementException:
-                        # Check for Yes/No icons
-                        try:
-                            icon = cell.find_element(By.CSS_SELECTOR, "span.k-icon")
-                            row_data[key] = parse_yes_no(cell)
-                        except NoSuchElementException:
-                            row_data[key] = clean_text(cell.text)
-
-                if row_data:
-                    data_list.append(row_data)
-
-            except Exception:
-                continue
+        return True
 
-    except NoSuchElementException:
-        pass
     except Exception as e:
-        pass
-
-    return data_list
-
+        print(f"      [Warning] Accordion expansion error: {e}")
+        return False
 
-def extract_key_value_pairs(panel):
-    """
-    Generic function to extract label-value pairs from a panel.
-    Returns a dictionary.
-    """
-    data = {}
 
-    try:
-        rows = panel.find_elements(By.CSS_SELECTOR, "div.row")
+# In-browser clean_text() and Yes/No icon parsing, shared by the panel
+# functions below.
+PANEL_HELPERS_JS = """
+var clean = function (text) { return (text || '').replace(/[\\u200b\\ufeff]/g, '').replace(/\\s+/g, ' ').trim(); };
+var yesNo = function (el) {
+    var icon = el.querySelector('span.k-icon');
+    if (icon) {
+        var title = icon.getAttribute('title');
+        if (title) { return title; }
+        var classes = icon.getAttribute('class') || '';
+        if (classes.indexOf('k-i-checkbox-checked') !== -1) { return 'Yes'; }
+        if (classes.indexOf('k-i-checkbox') !== -1) { return 'No'; }
+    }
+    return clean(el.innerText);
+};
+var hrefOf = function (a) { return a.hasAttribute('href') ? a.href : null; };
+"""
 
-        for row in rows:
-            try:
-                labels = row.find_elements(By.TAG_NAME, "label")
-                if not labels:
-                    continue
+# Rows of the first Kendo grid in a panel, each as a list of [key, value]
+# pairs; [] when there is no grid or no data. Grids whose visible columns are
+# all plain fields are read from the widget's dataSource (formatted like the
+# cells); others from the rendered rows, so template links and Yes/No icons
+# are kept.
+GRID_ROWS_FN = """
+function gridRows(panel) {
+    var grid = panel.querySelector('div.k-grid');
+    if (!grid) { return []; }
+    var widget = window.jQuery ? window.jQuery(grid).data('kendoGrid') : null;
+    if (widget && !widget.dataSource.group().length) {
+        var columns = widget.columns.filter(function (c) { return !c.hidden; });
+        var plain = columns.length && columns.every(function (c) {
+            return c.field && !c.template && !c.command;
+        });
+        if (plain) {
+            return Array.from(widget.dataSource.view()).map(function (item) {
+                return columns.map(function (c) {
+                    var value = item.get ? item.get(c.field) : item[c.field];
+                    var text = value == null ? ''
+                        : (c.format && window.kendo) ? window.kendo.format(c.format, value) : String(value);
+                    return [clean(c.title || c.field).split(' ').join('_'), clean(text)];
+                });
+            });
+        }
+    }
+    var noData = grid.querySelector('tr.k-no-data, div.k-grid-norecords-template');
+    if (noData && noData.getClientRects().length) { return []; }
+    var headers = [];
+    grid.querySelectorAll('thead th').forEach(function (th) {
+        var text = clean(th.innerText);
+        if (text) { headers.push(text.split(' ').join('_')); }
+    });
+    var out = [];
+    grid.querySelectorAll('tbody tr.k-master-row').forEach(function (row) {
+        var pairs = [];
+        row.querySelectorAll('td').forEach(function (cell, idx) {
+            var key = idx < headers.length ? headers[idx] : 'Column_' + idx;
+            var link = cell.querySelector('a');
+            if (link) {
+                pairs.push([key, clean(link.innerText)], [key + '_URL', hrefOf(link)]);
+            } else if (cell.querySelector('span.k-icon')) {
+                pairs.push([key, yesNo(cell)]);
+            } else {
+                pairs.push([key, clean(cell.innerText)]);
+            }
+        });
+        if (pairs.length) { out.push(pairs); }
+    });
+    return out;
+}
+"""
 
-                label = labels[0]
-                label_for = label.get_attribute("for") or ""
-                label_text = clean_text(label.text)
+# Label/value pairs of every div.row in a panel, as [key, value] pairs in
+# page order (later duplicates overwrite earlier ones on the Python side).
+KEY_VALUE_PAIRS_FN = """
+function keyValuePairs(panel) {
+    var pairs = [];
+    panel.querySelectorAll('div.row').forEach(function (row) {
+        var label = row.querySelector('label');
+        if (!label) { return; }
+        var labelFor = label.getAttribute('for') || '';
+        var labelText = clean(label.innerText);
+
+        var valueCol = row.querySelector('div.col-md-9, div.col-md-7, div.col-md-8, div.col-md-10');
+        if (!valueCol) {
+            // Any column that doesn't hold the label
+            valueCol = Array.from(row.querySelectorAll("div[class*='col-']")).find(function (col) {
+                return !col.contains(label);
+            });
+        }
+        if (!valueCol) { return; }
+        var key = labelFor || labelText.split(' ').join('_').split(':').join('');
 
-                # Find value column
-                value_cols = row.find_elements(By.CSS_SELECTOR,
-                    "div.col-md-9, div.col-md-7, div.col-md-8, div.col-md-10")
+        if (valueCol.querySelector('span.k-icon')) {
+            pairs.push([key, yesNo(valueCol)]);
+            return;
+        }
+        var link = valueCol.querySelector('a');
+        if (link) {
+            var href = hrefOf(link) || '';
+            if (href.indexOf('mailto:') === 0) {
+                pairs.push(['Email', clean(link.innerText)]);
+            } else if (href.indexOf('tel:') === 0) {
+                pairs.push(['Phone', clean(link.innerText)]);
+            } else {
+                pairs.push([key, clean(link.innerText)], [key + '_URL', href]);
+            }
+            return;
+        }
+        var rating = valueCol.querySelector('span.k-rating');
+        if (rating) {
+            pairs.push([key, rating.getAttribute('aria-valuenow') || 'Not Rated']);
+            return;
+        }
+        pairs.push([key, clean(valueCol.innerText)]);
+    });
+    return pairs;
+}
+"""
 
-                if not value_cols:
-                    # Try finding any column that's not the label column
-                    all_cols = row.find_elements(By.CSS_SELECTOR, "div[class*='col-']")
-                    for col in all_cols:
-                        if label not in col.find_elements(By.TAG_NAME, "label"):
-                            value_cols = [col]
-                            break
+# Contact cards in a panel, each as a list of [field, text] pairs for the
+# fields the card has (cards with none are left out).
+CONTACT_CARDS_FN = """
+function contactCards(panel) {
+    var fields = [
+        ['Name', 'h4, h5, .name, strong'],
+        ['Email', "a[href^='mailto:']"],
+        ['Phone', "a[href^='tel:']"],
+        ['Role', '.role, .title, .position']
+    ];
+    var out = [];
+    panel.querySelectorAll('div.contact-card, div.card, div.row').forEach(function (card) {
+        var pairs = [];
+        fields.forEach(function (field) {
+            var el = card.querySelector(field[1]);
+            if (el) { pairs.push([field[0], clean(el.innerText)]); }
+        });
+        if (pairs.length) { out.push(pairs); }
+    });
+    return out;
+}
+"""
 
-                if not value_cols:
-                    continue
+# Everything the section extractors read from the first arguments[0]
+# top-level panels, in one call: one object per panel, with the text of the
+# elements matching each of that panel's selectors in arguments[1][i]
+# (name -> selector) under "lists".
+PANEL_SNAPSHOTS_JS = PANEL_HELPERS_JS + GRID_ROWS_FN + KEY_VALUE_PAIRS_FN + CONTACT_CARDS_FN + """
+var panels = Array.from(document.querySelectorAll('ul.k-panelbar > li')).slice(0, arguments[0]);
+var selectors = arguments[1];
+return panels.map(function (panel, idx) {
+    var lists = {};
+    Object.keys(selectors[idx] || {}).forEach(function (name) {
+        lists[name] = Array.from(panel.querySelectorAll(selectors[idx][name])).map(function (el) {
+            return clean(el.innerText);
+        });
+    });
+    var content = panel.querySelector('div.k-content, div.panel-body');
+    var image = panel.querySelector('img[alt]');
+    return {
+        grid: gridRows(panel),
+        pairs: keyValuePairs(panel),
+        contacts: contactCards(panel),
+        links: Array.from(panel.querySelectorAll('a')).map(function (a) {
+            return [clean(a.innerText), hrefOf(a)];
+        }),
+        content: content ? clean(content.innerText) : null,
+        image: image ? image.src : null,
+        lists: lists
+    };
+});
+"""
 
-                value_col = value_cols[0]
-                field_key = label_for if label_for else label_text.replace(" ", "_").replace(":", "")
 
-                # Handle different field types
-                # Check for Yes/No icons
-                try:
-                    icon = value_col.find_element(By.CSS_SELECTOR, "span.k-icon")
-                    data[field_key] = parse_yes_no(value_col)
-                    continue
-                except NoSuchElementException:
-                    pass
-
-                # Check for links (email, phone, URL)
-                try:
-                    link = value_col.find_element(By.TAG_NAME, "a")
-                    href = link.get_attribute("href") or ""
-                    if href.startswith("mailto:"):
-                        data["Email"] = clean_text(link.text)
-                    elif href.startswith("tel:"):
-                        data["Phone"] = clean_text(link.text)
-                    else:
-                        data[field_key] = clean_text(link.text)
-                        data[f"{field_key}_URL"] = href
-                    continue
-                except NoSuchElementException:
-                    pass
-
-                # Check for rating
-                try:
-                    rating = value_col.find_element(By.CSS_SELECTOR, "span.k-rating")
-                    rating_value = rating.get_attribute("aria-valuenow")
-                    data[field_key] = rating_value if rating_value else "Not Rated"
-                    continue
-                except NoSuchElementException:
-                    pass
+def grid_rows(snapshot):
+    """The panel's Kendo grid rows as a list of dictionaries."""
+    return [dict(pairs) for pairs in snapshot["grid"]]
 
-                # Default: plain text
-                data[field_key] = clean_text(value_col.text)
 
-            except Exception:
-                continue
+def key_value_pairs(snapshot):
+    """The panel's label-value pairs as a dictionary."""
+    return dict(snapshot["pairs"])
 
-    except Exception as e:
-        pass
 
-    return data
+def texts(snapshot, name):
+    """Non-empty texts of the elements matched by the panel's `name` selector."""
+    return [text for text in snapshot["lists"].get(name, []) if text]
 
 
 # ==========================================
 # SECTION EXTRACTORS (12 Sections)
 # ==========================================
+# Each extractor takes its panel's snapshot from PANEL_SNAPSHOTS_JS, read
+# once per page by extract_facility_full_profile(); extract_sections()
+# handles missing panels and errors for all of them.
 
-def extract_general_information(driver):
+def extract_general_information(snapshot):
     """Extract data from General Information section (li[1])."""
-    data = {}
-
-    try:
-        # Find panel by index - first panel
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 1:
-            return data
+    data = key_value_pairs(snapshot)
 
-        panel = panels[0]
+    # Breadcrumb if present (Academic Unit path)
+    if snapshot["lists"].get("breadcrumb"):
+        data["Academic_Unit_Path"] = " > ".join(texts(snapshot, "breadcrumb"))
 
-        # Extract key-value pairs
-        data = extract_key_value_pairs(panel)
-
-        # Extract breadcrumb if present (Academic Unit path)
-        try:
-            breadcrumb_items = panel.find_elements(By.CSS_SELECTOR, "ol.breadcrumb li")
-            if breadcrumb_items:
-                path = [clean_text(item.text) for item in breadcrumb_items if clean_text(item.text)]
-                data["Academic_Unit_Path"] = " > ".join(path)
-        except:
-            pass
-
-        # Extract image URL if present
-        try:
-            img = panel.find_element(By.CSS_SELECTOR, "img[alt]")
-            data["Image_URL"] = img.get_attribute("src")
-        except:
-            pass
-
-    except Exception as e:
-        print(f"      [Warning] General Information extraction error: {e}")
+    # Image URL if present
+    if snapshot["image"] is not None:
+        data["Image_URL"] = snapshot["image"]
 
     return data
 
 
-def extract_academic_unit_details(driver):
+def extract_academic_unit_details(snapshot):
     """Extract data from Academic Unit Details section (li[2])."""
-    data = {}
-
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 2:
-            return data
-
-        panel = panels[1]
-        data = extract_key_value_pairs(panel)
-
-    except Exception as e:
-        print(f"      [Warning] Academic Unit Details extraction error: {e}")
-
-    return data
+    return key_value_pairs(snapshot)
 
 
-def extract_provinces_served(driver):
+def extract_provinces_served(snapshot):
     """Extract data from Provinces Served section (li[3])."""
-    provinces_list = []
+    # Could be a table/grid or a list
+    grid_data = grid_rows(snapshot)
+    if grid_data:
+        return grid_data
 
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 3:
-            return provinces_list
-
-        panel = panels[2]
+    provinces_list = texts(snapshot, "items")
 
-        # Could be a table/grid or a list
-        grid_data = extract_table_grid_data(panel)
-        if grid_data:
-            return grid_data
-
-        # Try extracting as list items
-        try:
-            items = panel.find_elements(By.CSS_SELECTOR, "li, div.item, span.tag")
-            for item in items:
-                text = clean_text(item.text)
-                if text:
-                    provinces_list.append(text)
-        except:
-            pass
-
-        # Try extracting as plain text
-        if not provinces_list:
-            try:
-                content_div = panel.find_element(By.CSS_SELECTOR, "div.k-content, div.panel-body")
-                text = clean_text(content_div.text)
-                if text:
-                    provinces_list = [p.strip() for p in text.split(',') if p.strip()]
-            except:
-                pass
-
-    except Exception as e:
-        print(f"      [Warning] Provinces Served extraction error: {e}")
+    # Fall back to the plain text
+    if not provinces_list and snapshot["content"]:
+        provinces_list = [p.strip() for p in snapshot["content"].split(',') if p.strip()]
 
     return provinces_list
 
 
-def extract_activities_offered(driver):
+def extract_activities_offered(snapshot):
     """Extract data from Activities Offered section (li[4])."""
-    activities_list = []
-
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 4:
-            return activities_list
-
-        panel = panels[3]
-
-        # Try grid extraction first
-        grid_data = extract_table_grid_data(panel)
-        if grid_data:
-            return grid_data
+    grid_data = grid_rows(snapshot)
+    if grid_data:
+        return grid_data
 
-        # Try list extraction
-        try:
-            items = panel.find_elements(By.CSS_SELECTOR, "li, div.item, span.tag, div.chip")
-            for item in items:
-                text = clean_text(item.text)
-                if text and text not in ["Activities Offered", ""]:
-                    activities_list.append(text)
-        except:
-            pass
-
-    except Exception as e:
-        print(f"      [Warning] Activities Offered extraction error: {e}")
+    return [text for text in texts(snapshot, "items") if text != "Activities Offered"]
 
-    return activities_list
 
-
-def extract_sectors_served(driver):
+def extract_sectors_served(snapshot):
     """Extract data from Sectors Served section (li[5])."""
-    sectors_list = []
-
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 5:
-            return sectors_list
+    grid_data = grid_rows(snapshot)
+    if grid_data:
+        return grid_data
 
-        panel = panels[4]
+    return [text for text in texts(snapshot, "items") if text != "Sectors Served"]
 
-        # Try grid extraction
-        grid_data = extract_table_grid_data(panel)
-        if grid_data:
-            return grid_data
 
-        # Try list/tag extraction
-        try:
-            items = panel.find_elements(By.CSS_SELECTOR, "li, div.item, span.tag, div.chip")
-            for item in items:
-                text = clean_text(item.text)
-                if text and text not in ["Sectors Served", ""]:
-                    sectors_list.append(text)
-        except:
-            pass
-
-    except Exception as e:
-        print(f"      [Warning] Sectors Served extraction error: {e}")
-
-    return sectors_list
-
-
-def extract_contacts(driver):
+def extract_contacts(snapshot):
     """Extract data from Contacts section (li[6])."""
-    contacts_list = []
-
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 6:
-            return contacts_list
-
-        panel = panels[5]
-
-        # Try grid extraction (contacts usually in a table)
-        grid_data = extract_table_grid_data(panel)
-        if grid_data:
-            return grid_data
-
-        # Fallback: Extract contact cards
-        try:
-            contact_cards = panel.find_elements(By.CSS_SELECTOR, "div.contact-card, div.card, div.row")
-            for card in contact_cards:
-                contact = {}
-
-                # Name
-                try:
-                    name_elem = card.find_element(By.CSS_SELECTOR, "h4, h5, .name, strong")
-                    contact["Name"] = clean_text(name_elem.text)
-                except:
-                    pass
-
-                # Email
-                try:
-                    email_elem = card.find_element(By.CSS_SELECTOR, "a[href^='mailto:']")
-                    contact["Email"] = clean_text(email_elem.text)
-                except:
-                    pass
-
-                # Phone
-                try:
-                    phone_elem = card.find_element(By.CSS_SELECTOR, "a[href^='tel:']")
-                    contact["Phone"] = clean_text(phone_elem.text)
-                except:
-                    pass
-
-                # Role/Title
-                try:
-                    role_elem = card.find_element(By.CSS_SELECTOR, ".role, .title, .position")
-                    contact["Role"] = clean_text(role_elem.text)
-                except:
-                    pass
-
-                if contact:
-                    contacts_list.append(contact)
-
-        except:
-            pass
-
-    except Exception as e:
-        print(f"      [Warning] Contacts extraction error: {e}")
+    # Contacts are usually in a table
+    grid_data = grid_rows(snapshot)
+    if grid_data:
+        return grid_data
 
-    return contacts_list
+    # Fallback: contact cards
+    return [dict(pairs) for pairs in snapshot["contacts"]]
 
 
-def extract_locations(driver):
+def extract_locations(snapshot):
     """Extract data from Locations section (li[7])."""
-    locations_list = []
-
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 7:
-            return locations_list
-
-        panel = panels[6]
-
-        # Try grid extraction
-        grid_data = extract_table_grid_data(panel)
-        if grid_data:
-            return grid_data
-
-        # Fallback: Extract address blocks
-        try:
-            address_blocks = panel.find_elements(By.CSS_SELECTOR, "address, div.address, div.location")
-            for block in address_blocks:
-                location = {
-                    "Address": clean_text(block.text)
-                }
-                locations_list.append(location)
-        except:
-            pass
+    grid_data = grid_rows(snapshot)
+    if grid_data:
+        return grid_data
 
-        # Another fallback: key-value pairs
-        if not locations_list:
-            kv_data = extract_key_value_pairs(panel)
-            if kv_data:
-                locations_list.append(kv_data)
+    # Fallback: address blocks
+    locations_list = [{"Address": address} for address in snapshot["lists"].get("addresses", [])]
 
-    except Exception as e:
-        print(f"      [Warning] Locations extraction error: {e}")
+    # Another fallback: key-value pairs
+    if not locations_list:
+        kv_data = key_value_pairs(snapshot)
+        if kv_data:
+            locations_list.append(kv_data)
 
     return locations_list
 
 
-def extract_facility_descriptors(driver):
+def extract_facility_descriptors(snapshot):
     """Extract data from Facility Descriptors section (li[8])."""
-    descriptors = {}
-
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 8:
-            return descriptors
+    descriptors = key_value_pairs(snapshot)
 
-        panel = panels[7]
+    # Also take the grid for list-like descriptors
+    grid_data = grid_rows(snapshot)
+    if grid_data:
+        descriptors["Descriptors_List"] = grid_data
 
-        # Try key-value extraction
-        descriptors = extract_key_value_pairs(panel)
-
-        # Also try grid extraction for list-like descriptors
-        grid_data = extract_table_grid_data(panel)
-        if grid_data:
-            descriptors["Descriptors_List"] = grid_data
-
-        # Try extracting tags/chips
-        try:
-            tags = panel.find_elements(By.CSS_SELECTOR, "span.tag, div.chip, span.badge")
-            if tags:
-                descriptors["Tags"] = [clean_text(tag.text) for tag in tags if clean_text(tag.text)]
-        except:
-            pass
-
-    except Exception as e:
-        print(f"      [Warning] Facility Descriptors extraction error: {e}")
+    # Tags/chips
+    if snapshot["lists"].get("tags"):
+        descriptors["Tags"] = texts(snapshot, "tags")
 
     return descriptors
 
 
-def extract_languages_serviced(driver):
+def extract_languages_serviced(snapshot):
     """Extract data from Languages Serviced section (li[9])."""
-    languages_list = []
-
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 9:
-            return languages_list
-
-        panel = panels[8]
-
-        # Try grid extraction
-        grid_data = extract_table_grid_data(panel)
-        if grid_data:
-            return grid_data
-
-        # Try list/tag extraction
-        try:
-            items = panel.find_elements(By.CSS_SELECTOR, "li, span.tag, div.chip, span.badge")
-            for item in items:
-                text = clean_text(item.text)
-                if text and text not in ["Languages Serviced", ""]:
-                    languages_list.append(text)
-        except:
-            pass
+    grid_data = grid_rows(snapshot)
+    if grid_data:
+        return grid_data
 
-        # Fallback: plain text
-        if not languages_list:
-            try:
-                content = panel.find_element(By.CSS_SELECTOR, "div.k-content, div.panel-body")
-                text = clean_text(content.text)
-                if text:
-                    languages_list = [l.strip() for l in text.split(',') if l.strip()]
-            except:
-                pass
+    languages_list = [text for text in texts(snapshot, "items") if text != "Languages Serviced"]
 
-    except Exception as e:
-        print(f"      [Warning] Languages Serviced extraction error: {e}")
+    # Fallback: plain text
+    if not languages_list and snapshot["content"]:
+        languages_list = [l.strip() for l in snapshot["content"].split(',') if l.strip()]
 
     return languages_list
 
 
-def extract_web_presence(driver):
+def extract_web_presence(snapshot):
     """Extract data from Web Presence section (li[10])."""
-    web_presence_list = []
-
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 10:
-            return web_presence_list
-
-        panel = panels[9]
-
-        # Try grid extraction
-        grid_data = extract_table_grid_data(panel)
-        if grid_data:
-            return grid_data
-
-        # Fallback: find all links
-        try:
-            links = panel.find_elements(By.TAG_NAME, "a")
-            for link in links:
-                href = link.get_attribute("href")
-                text = clean_text(link.text)
-                if href and not href.startswith("javascript"):
-                    web_presence_list.append({
-                        "Name": text if text else "Link",
-                        "URL": href
-                    })
-        except:
-            pass
-
-    except Exception as e:
-        print(f"      [Warning] Web Presence extraction error: {e}")
+    grid_data = grid_rows(snapshot)
+    if grid_data:
+        return grid_data
 
-    return web_presence_list
+    # Fallback: all links
+    return [
+        {"Name": text if text else "Link", "URL": href}
+        for text, href in snapshot["links"]
+        if href and not href.startswith("javascript")
+    ]
 
 
-def extract_ocip_activity(driver):
+def extract_ocip_activity(snapshot):
     """Extract data from OCIP Activity section (li[11])."""
-    activity_list = []
-
-    try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 11:
-            return activity_list
-
-        panel = panels[10]
+    grid_data = grid_rows(snapshot)
+    if grid_data:
+        return grid_data
 
-        # Try grid extraction
-        grid_data = extract_table_grid_data(panel)
-        if grid_data:
-            return grid_data
-
-        # Fallback: key-value pairs
-        kv_data = extract_key_value_pairs(panel)
-        if kv_data:
-            activity_list.append(kv_data)
-
-    except Exception as e:
-        print(f"      [Warning] OCIP Activity extraction error: {e}")
+    # Fallback: key-value pairs
+    kv_data = key_value_pairs(snapshot)
+    return [kv_data] if kv_data else []
 
-    return activity_list
 
-
-def extract_audit_trail(driver):
+def extract_audit_trail(snapshot):
     """Extract data from Audit Trail section (li[12])."""
-    data = {}
-
+    return key_value_pairs(snapshot)
+
+
+# Output key, extractor, display name, empty value and the element lists
+# (name -> CSS selector) the extractor reads, of each section in panel order
+PROFILE_SECTIONS = [
+    ("General_Information", extract_general_information, "General Information", dict,
+     {"breadcrumb": "ol.breadcrumb li"}),
+    ("Academic_Unit_Details", extract_academic_unit_details, "Academic Unit Details", dict, {}),
+    ("Provinces_Served", extract_provinces_served, "Provinces Served", list,
+     {"items": "li, div.item, span.tag"}),
+    ("Activities_Offered", extract_activities_offered, "Activities Offered", list,
+     {"items": "li, div.item, span.tag, div.chip"}),
+    ("Sectors_Served", extract_sectors_served, "Sectors Served", list,
+     {"items": "li, div.item, span.tag, div.chip"}),
+    ("Contacts", extract_contacts, "Contacts", list, {}),
+    ("Locations", extract_locations, "Locations", list,
+     {"addresses": "address, div.address, div.location"}),
+    ("Facility_Descriptors", extract_facility_descriptors, "Facility Descriptors", dict,
+     {"tags": "span.tag, div.chip, span.badge"}),
+    ("Languages_Serviced", extract_languages_serviced, "Languages Serviced", list,
+     {"items": "li, span.tag, div.chip, span.badge"}),
+    ("Web_Presence", extract_web_presence, "Web Presence", list, {}),
+    ("OCIP_Activity", extract_ocip_activity, "OCIP Activity", list, {}),
+    ("Audit_Trail", extract_audit_trail, "Audit Trail", dict, {}),
+]
+
+PANEL_SELECTORS = [lists for _, _, _, _, lists in PROFILE_SECTIONS]
+
+
+def panel_snapshots(driver):
+    """Read the section panels of the loaded page in one script call."""
     try:
-        panels = driver.find_elements(By.CSS_SELECTOR, "ul.k-panelbar > li")
-        if len(panels) < 12:
-            return data
-
-        panel = panels[11]
-
-        # Extract key-value pairs
-        data = extract_key_value_pairs(panel)
-
+        return driver.execute_script(PANEL_SNAPSHOTS_JS, SECTION_COUNT, PANEL_SELECTORS)
     except Exception as e:
-        print(f"      [Warning] Audit Trail extraction error: {e}")
+        print(f"      [Warning] Panel read error: {e}")
+        return []
 
-    return data
+
+def extract_sections(snapshots):
+    """
+    Run each section's extractor on its panel snapshot (from
+    panel_snapshots(), in panel order). A missing panel, or one that fails
+    to extract, gives an empty section.
+    """
+    sections = {}
+    for idx, (key, extractor, name, empty, _) in enumerate(PROFILE_SECTIONS):
+        if idx >= len(snapshots):
+            sections[key] = empty()
+            continue
+        try:
+            sections[key] = extractor(snapshots[idx])
+        except Exception as e:
+            print(f"      [Warning] {name} extraction error: {e}")
+            sections[key] = empty()
+    return sections
 
 
 # ==========================================
@@ -763,7 +669,6 @@ def extract_facility_full_profile(driver, wait, facility_basic_info):
     try:
         # Navigate to the detail page
         driver.get(url)
-        time.sleep(PAGE_LOAD_WAIT)
 
         # Wait for page to load
         try:
@@ -792,46 +697,145 @@ def extract_facility_full_profile(driver, wait, facility_basic_info):
         # Extract each section (12 sections total)
         print("         Extracting sections...")
 
-        profile["General_Information"] = extract_general_information(driver)
-        time.sleep(REQUEST_DELAY)
+        profile.update(extract_sections(panel_snapshots(driver)))
 
-        profile["Academic_Unit_Details"] = extract_academic_unit_details(driver)
-        time.sleep(REQUEST_DELAY)
+        return profile
 
-        profile["Provinces_Served"] = extract_provinces_served(driver)
-        time.sleep(REQUEST_DELAY)
+    except Exception as e:
+        print(f"      [Error] Failed to extract {url}: {e}")
+        return None
 
-        profile["Activities_Offered"] = extract_activities_offered(driver)
-        time.sleep(REQUEST_DELAY)
 
-        profile["Sectors_Served"] = extract_sectors_served(driver)
-        time.sleep(REQUEST_DELAY)
+# ==========================================
+# SCRAPE FACILITIES
+# ==========================================
+def has_manage_url(facility):
+    """True if the facility has a detail page to visit."""
+    url = facility.get("Manage_URL", "")
+    return bool(url) and url != "Not Found"
+
 
-        profile["Contacts"] = extract_contacts(driver)
-        time.sleep(REQUEST_DELAY)
+def scrape_facility(driver, wait, facility, idx, total):
+    """Print the facility's progress line and extract its profile (None if skipped or failed)."""
+    facility_name = facility.get("Facility_Name", "Unknown")
+    institution = facility.get("Institution", "Unknown")
+    print(f"\n[{idx + 1}/{total}] {facility_name} ({institution})")
 
-        profile["Locations"] = extract_locations(driver)
-        time.sleep(REQUEST_DELAY)
+    if not has_manage_url(facility):
+        return None
+    return extract_facility_full_profile(driver, wait, facility)
 
-        profile["Facility_Descriptors"] = extract_facility_descriptors(driver)
-        time.sleep(REQUEST_DELAY)
 
-        profile["Languages_Serviced"] = extract_languages_serviced(driver)
-        time.sleep(REQUEST_DELAY)
+def _scrape_sequential(driver, wait, tasks):
+    """Yield (index, profile) for each facility using a single browser."""
+    for i, facility, total in tasks:
+        yield i, scrape_facility(driver, wait, facility, i, total)
+        if not has_manage_url(facility):
+            continue
 
-        profile["Web_Presence"] = extract_web_presence(driver)
-        time.sleep(REQUEST_DELAY)
+        # Rate limiting
+        if (i + 1) % BATCH_SIZE == 0 and i + 1 < total:
+            print(f"\n   [Rate limit pause: {BATCH_PAUSE}s...]")
+            time.sleep(BATCH_PAUSE)
 
-        profile["OCIP_Activity"] = extract_ocip_activity(driver)
-        time.sleep(REQUEST_DELAY)
+        # Delay between facilities
+        time.sleep(BETWEEN_FACILITIES_DELAY)
 
-        profile["Audit_Trail"] = extract_audit_trail(driver)
 
-        return profile
+def scrape_facilities(driver, wait, tasks):
+    """
+    Yield (index, profile) for each (index, facility, total) task, in order.
+    Uses WORKER_COUNT browsers when there is more than one task, otherwise
+    the main browser (which also takes the tasks of any worker whose browser
+    failed to start). Close the generator to stop the workers early.
+    """
+    # Pool tasks must be picklable by module name, which only holds when
+    # this file runs as a script (not when loaded by the main controller)
+    if WORKER_COUNT <= 1 or len(tasks) <= 1 or __name__ != "__main__":
+        yield from _scrape_sequential(driver, wait, tasks)
+        return
 
+    print(f"\n   Scraping with {WORKER_COUNT} parallel browsers...")
+    pool = multiprocessing.Pool(
+        min(WORKER_COUNT, len(tasks)),
+        initializer=_init_worker,
+        initargs=(driver.get_cookies(),)
+    )
+    try:
+        warned = False
+        # imap keeps input order, so checkpoints stay index-based
+        for task, (i, profile, error) in zip(tasks, pool.imap(_scrape_in_worker, tasks)):
+            if error is not None:
+                # This worker has no browser: scrape the facility here instead
+                if not warned:
+                    print(f"      [Warning] A worker browser failed to start ({error}) - "
+                          f"its facilities are scraped in the main browser")
+                    warned = True
+                _, facility, total = task
+                profile = scrape_facility(driver, wait, facility, i, total)
+                if has_manage_url(facility):
+                    time.sleep(BETWEEN_FACILITIES_DELAY)
+            yield i, profile
+    except BaseException:
+        pool.terminate()
+        raise
+    pool.close()
+    pool.join()
+
+
+# ==========================================
+# WORKER POOL
+# ==========================================
+_worker_driver = None
+_worker_wait = None
+_worker_error = None  # why this worker's browser failed to start, if it did
+
+
+def _init_worker(cookies):
+    """Start this worker's browser and log it in with the shared cookies."""
+    global _worker_driver, _worker_wait, _worker_error
+    # An initializer that raises makes the pool respawn the worker forever
+    # (and imap never returns), so a failed start is recorded instead
+    try:
+        _worker_driver = get_driver(headless=HEADLESS)
+        _worker_wait = WebDriverWait(_worker_driver, 20, poll_frequency=0.1)
+        if BLOCK_RESOURCES:
+            block_resources(_worker_driver)
+
+        # Cookies can only be set for the domain currently loaded
+        _worker_driver.get(LOGIN_URL)
+        add_cookies(_worker_driver, cookies)
     except Exception as e:
-        print(f"      [Error] Failed to extract {url}: {e}")
-        return None
+        _worker_error = f"{type(e).__name__}: {e}"
+        if _worker_driver is not None:
+            try:
+                _worker_driver.quit()
+            except Exception:
+                pass
+            _worker_driver = None
+        return
+
+    # Quit the browser when the pool shuts this worker down
+    mp_util.Finalize(None, _worker_driver.quit, exitpriority=10)
+
+
+def _scrape_in_worker(task):
+    """
+    Pool task: scrape one facility on this worker's browser.
+    Returns (index, profile, error); error is set (and profile None) if the
+    worker's browser failed to start.
+    """
+    i, facility, total = task
+    if _worker_error is not None:
+        return i, None, _worker_error
+    try:
+        profile = scrape_facility(_worker_driver, _worker_wait, facility, i, total)
+    except Exception as e:
+        print(f"      [Error] Worker error on {facility.get('Manage_URL', '')}: {e}")
+        profile = None
+    if has_manage_url(facility):
+        time.sleep(BETWEEN_FACILITIES_DELAY)
+    return i, profile, None
 
 
 # ==========================================
@@ -853,10 +857,11 @@ def main():
 
     # Initialize
     driver = get_driver()
-    wait = WebDriverWait(driver, 20)
+    wait = WebDriverWait(driver, 20, poll_frequency=0.1)
     processed_data = []
     errors = []
     start_index = 0
+    resume_bytes = None
 
     # Check for existing checkpoint
     checkpoint = load_checkpoint()
@@ -870,6 +875,7 @@ def main():
         if resume == 'y':
             processed_data = checkpoint['data']
             start_index = checkpoint['current_index']
+            resume_bytes = checkpoint.get('data_bytes')
             try:
                 with open(ERROR_LOG_FILE, 'r') as f:
                     errors = json.load(f)
@@ -877,14 +883,22 @@ def main():
                 errors = []
             print("✓ Resuming from checkpoint...")
 
+    log = open_checkpoint_log(resume_bytes)
+    if processed_data and resume_bytes is None:
+        # Older checkpoint with inline profiles: move them into the log once
+        for profile in processed_data:
+            append_profile(log, profile)
+
     try:
         # Login step
         print("\n" + "-" * 50)
         print("STEP 1: AUTHENTICATION")
         print("-" * 50)
-        driver.get("https://www.ocip.express/")
+        driver.get(LOGIN_URL)
         print("Please log in to the portal manually.")
         input("\n>>> Press ENTER here once you're logged in...")
+        if BLOCK_RESOURCES:
+            block_resources(driver)
 
         # Process each facility
         print("\n" + "-" * 50)
@@ -893,60 +907,55 @@ def main():
 
         total = len(master_list)
 
-        for i, facility in enumerate(master_list[start_index:], start=start_index):
-            facility_name = facility.get("Facility_Name", "Unknown")
-            institution = facility.get("Institution", "Unknown")
-            url = facility.get("Manage_URL", "")
-
-            print(f"\n[{i + 1}/{total}] {facility_name} ({institution})")
-
-            if not url or url == "Not Found":
-                print("      → Skipped: No valid URL")
-                errors.append({
-                    "index": i,
-                    "name": facility_name,
-                    "institution": institution,
-                    "reason": "No valid Manage URL"
-                })
-                continue
-
-            # Extract full profile
-            profile = extract_facility_full_profile(driver, wait, facility)
-
-            if profile:
-                processed_data.append(profile)
-                print(f"      ✓ Extracted successfully")
-
-                # Show summary of what was found
-                provinces_count = len(profile.get("Provinces_Served", []))
-                activities_count = len(profile.get("Activities_Offered", []))
-                contacts_count = len(profile.get("Contacts", []))
-                locations_count = len(profile.get("Locations", []))
-
-                print(f"         Provinces: {provinces_count} | Activities: {activities_count} | "
-                      f"Contacts: {contacts_count} | Locations: {locations_count}")
-            else:
-                errors.append({
-                    "index": i,
-                    "name": facility_name,
-                    "institution": institution,
-                    "url": url,
-                    "reason": "Extraction failed"
-                })
-                print(f"      ✗ Extraction failed")
-
-            # Save checkpoint periodically
-            if (i + 1) % 10 == 0:
-                save_checkpoint(processed_data, i + 1, errors)
-                print(f"\n   [Checkpoint saved: {len(processed_data)} profiles]")
-
-            # Rate limiting
-            if (i + 1) % BATCH_SIZE == 0 and i + 1 < total:
-                print(f"\n   [Rate limit pause: {BATCH_PAUSE}s...]")
-                time.sleep(BATCH_PAUSE)
-
-            # Delay between facilities
-            time.sleep(BETWEEN_FACILITIES_DELAY)
+        tasks = [(i, facility, total)
+                 for i, facility in enumerate(master_list[start_index:], start=start_index)]
+        results = scrape_facilities(driver, wait, tasks)
+
+        try:
+            for i, profile in results:
+                facility = master_list[i]
+                facility_name = facility.get("Facility_Name", "Unknown")
+                institution = facility.get("Institution", "Unknown")
+
+                if not has_manage_url(facility):
+                    print("      → Skipped: No valid URL")
+                    errors.append({
+                        "index": i,
+                        "name": facility_name,
+                        "institution": institution,
+                        "reason": "No valid Manage URL"
+                    })
+                    continue
+
+                if profile:
+                    processed_data.append(profile)
+                    append_profile(log, profile)
+                    print(f"      ✓ Extracted successfully")
+
+                    # Show summary of what was found
+                    provinces_count = len(profile.get("Provinces_Served", []))
+                    activities_count = len(profile.get("Activities_Offered", []))
+                    contacts_count = len(profile.get("Contacts", []))
+                    locations_count = len(profile.get("Locations", []))
+
+                    print(f"         Provinces: {provinces_count} | Activities: {activities_count} | "
+                          f"Contacts: {contacts_count} | Locations: {locations_count}")
+                else:
+                    errors.append({
+                        "index": i,
+                        "name": facility_name,
+                        "institution": institution,
+                        "url": facility.get("Manage_URL", ""),
+                        "reason": "Extraction failed"
+                    })
+                    print(f"      ✗ Extraction failed")
+
+                # Save checkpoint periodically
+                if (i + 1) % 10 == 0:
+                    save_checkpoint(log, len(processed_data), i + 1, errors)
+                    print(f"\n   [Checkpoint saved: {len(processed_data)} profiles]")
+        finally:
+            results.close()
 
         # ===== FINAL SAVE =====
         print("\n" + "=" * 60)
@@ -989,14 +998,17 @@ def main():
         print(f"   Facilities with Web Presence: {total_with_web}")
         print(f"   Facilities with OCIP Activity: {total_with_ocip}")
 
-        # Clean up checkpoint file on success
-        if os.path.exists(CHECKPOINT_FILE) and len(errors) == 0:
-            os.remove(CHECKPOINT_FILE)
-            print("\n✓ Checkpoint file cleaned up")
+        # Clean up checkpoint files on success
+        if len(errors) == 0:
+            log.close()
+            os.remove(checkpoint_data_file())
+            if os.path.exists(CHECKPOINT_FILE):
+                os.remove(CHECKPOINT_FILE)
+                print("\n✓ Checkpoint file cleaned up")
 
     except KeyboardInterrupt:
         print("\n\n⚠ Script interrupted by user")
-        save_checkpoint(processed_data, i + 1 if 'i' in dir() else start_index, errors)
+        save_checkpoint(log, len(processed_data), i + 1 if 'i' in dir() else start_index, errors)
         print(f"   Progress saved. Processed {len(processed_data)} facilities so far.")
 
     except Exception as e:
@@ -1012,6 +1024,7 @@ def main():
             print(f"   Emergency backup saved to {emergency_file}")
 
     finally:
+        log.close()
         print("\n" + "=" * 60)
         print("Script finished. Browser left open for inspection.")
         print("=" * 60)
@@ -87,7 +87,7 @@ def wait_for_loading_complete(driver, timeout=LOADING_MASK_TIMEOUT):
     """Wait for loading masks to disappear."""
     try:
         time.sleep(0.3)
-        WebDriverWait(driver, timeout).until(
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
             EC.invisibility_of_element_located((By.CSS_SELECTOR, ".k-loading-mask"))
         )
     except:
@@ -393,7 +393,7 @@ def main():
     print()
 
     driver = get_driver()
-    wait = WebDriverWait(driver, 20)
+    wait = WebDriverWait(driver, 20, poll_frequency=0.1)
     master_list = []
     current_page = 1
 
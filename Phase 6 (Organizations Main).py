@@ -66,6 +66,11 @@ def get_driver():
 # ==========================================
 # UTILITY FUNCTIONS
 # ==========================================
+# Number of errors already on disk; the log only grows, so it is rewritten
+# only when new errors arrive instead of once per organization.
+_errors_saved_count = None
+
+
 def load_master_list(filepath):
     """Load the master list from Phase 5."""
     try:
@@ -103,12 +108,16 @@ def save_checkpoint(processed_data, current_index, errors, total):
     except Exception as e:
         print(f"      [Warning] Checkpoint save failed: {e}")
 
-    # Also save errors immediately
+    # Also save errors immediately (skipped when nothing new was logged)
+    global _errors_saved_count
+    if len(errors) == _errors_saved_count:
+        return
     try:
         with open(ERROR_LOG_FILE, 'w', encoding='utf-8') as f:
             json.dump(errors, f, indent=2, ensure_ascii=False)
             f.flush()
             os.fsync(f.fileno())
+        _errors_saved_count = len(errors)
     except:
         pass
 
@@ -902,8 +911,10 @@ def main():
         return
 
     # Initialize
+    global _errors_saved_count
+    _errors_saved_count = None
     driver = get_driver()
-    wait = WebDriverWait(driver, 20)
+    wait = WebDriverWait(driver, 20, poll_frequency=0.1)
     processed_data = []
     errors = []
     start_index = 0